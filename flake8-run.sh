@@ -6,8 +6,13 @@ if [[ ! -x $(which flake8) ]]; then
 fi
 
 if [[ $TRAVIS != "true" || $FLAKE == "true" ]]; then
-  find html5lib/ -name '*.py' -and -not -name 'constants.py' -print0 | xargs -0 flake8 --ignore=E501
+  find html5lib/ -name '*.py' -and -not -name 'constants.py' -and -not -name 'aio.py' -print0 | xargs -0 flake8 --ignore=E501
   flake1=$?
+  # aio.py uses async/await
+  if python -c 'import sys; sys.exit(sys.version_info < (3, 5))'; then
+    flake8 --ignore=E501 html5lib/aio.py
+    flake1=$[$flake1 || $?]
+  fi
   flake8 --max-line-length=99 --ignore=E126 html5lib/constants.py
   flake2=$?
   exit $[$flake1 || $flake2]
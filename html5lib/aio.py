@@ -0,0 +1,69 @@
+"""Parse HTML read asynchronously with asyncio
+
+Requires Python 3.5 or later, so unlike the rest of html5lib this module
+is not imported by the html5lib package itself.
+
+Example usage:
+
+import html5lib.aio
+reader, writer = await asyncio.open_connection(host, 80)
+...
+document = await html5lib.aio.parse(reader)
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import asyncio
+
+from . import treebuilders
+from .html5parser import HTMLParser
+
+
+async def parse(source, treebuilder="etree", encoding=None,
+                namespaceHTMLElements=True, **kwargs):
+    """Parse a HTML document read from source into a tree
+
+    Takes the same arguments as feed, apart from the parser.
+    """
+    tb = treebuilders.getTreeBuilder(treebuilder)
+    p = HTMLParser(tb, namespaceHTMLElements=namespaceHTMLElements)
+    return await feed(p, source, encoding=encoding, **kwargs)
+
+
+async def feed(parser, source, encoding=None, parseMeta=True, useChardet=True,
+               chunkSize=65536, tokensPerYield=1000, **kwargs):
+    """Feed all of source to parser and return the document
+
+    source - an asyncio.StreamReader (or anything else with a read coroutine
+    method returning an empty string at the end of the data) or an
+    asynchronous iterable of byte or text strings
+
+    chunkSize - the number of bytes to ask a StreamReader for at once
+
+    tokensPerYield - the number of tokens to process before giving the
+    event loop a chance to run something else
+
+    Other keyword arguments are passed on to parser.begin.
+    """
+    parser.begin(encoding, parseMeta, useChardet, **kwargs)
+    stream = parser.tokenizer.stream
+    if hasattr(source, "read"):
+        iterator = None
+    else:
+        iterator = source.__aiter__()
+    while True:
+        if iterator is None:
+            data = await source.read(chunkSize)
+            if not data:
+                break
+        else:
+            try:
+                data = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+        stream.feed(data)
+        while parser.feedLoop(False, tokensPerYield):
+            await asyncio.sleep(0)
+    stream.close()
+    while parser.feedLoop(False, tokensPerYield):
+        await asyncio.sleep(0)
+    return parser.close()
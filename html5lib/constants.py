@@ -3102,3 +3102,7 @@ class DataLossWarning(UserWarning):
 
 class ReparseException(Exception):
     pass
+
+
+class NeedMoreDataException(Exception):
+    pass
@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, unicode_literals
 from six import with_metaclass
 
 import types
+from itertools import chain
 
 from . import inputstream
 from . import tokenizer
@@ -21,18 +22,18 @@ from .constants import adjustForeignAttributes as adjustForeignAttributesMap
 
 
 def parse(doc, treebuilder="etree", encoding=None,
-          namespaceHTMLElements=True):
+          namespaceHTMLElements=True, **kwargs):
     """Parse a string or file-like object into a tree"""
     tb = treebuilders.getTreeBuilder(treebuilder)
     p = HTMLParser(tb, namespaceHTMLElements=namespaceHTMLElements)
-    return p.parse(doc, encoding=encoding)
+    return p.parse(doc, encoding=encoding, **kwargs)
 
 
 def parseFragment(doc, container="div", treebuilder="etree", encoding=None,
-                  namespaceHTMLElements=True):
+                  namespaceHTMLElements=True, **kwargs):
     tb = treebuilders.getTreeBuilder(treebuilder)
     p = HTMLParser(tb, namespaceHTMLElements=namespaceHTMLElements)
-    return p.parseFragment(doc, container=container, encoding=encoding)
+    return p.parseFragment(doc, container=container, encoding=encoding, **kwargs)
 
 
 def method_decorator_metaclass(function):
@@ -52,10 +53,24 @@ class HTMLParser(object):
         malformed) HTML"""
 
     def __init__(self, tree=None, tokenizer=tokenizer.HTMLTokenizer,
-                 strict=False, namespaceHTMLElements=True, debug=False):
+                 strict=False, namespaceHTMLElements=True, debug=False,
+                 collectErrors=True, maxErrors=None, coalesceCharacters=True):
         """
         strict - raise an exception when a parse error is encountered
 
+        collectErrors - record parse errors in self.errors; if False
+        reporting an error does nothing at all, the tokenizer doesn't
+        create ParseError tokens, and the input stream doesn't keep the
+        index of newlines used to work out their positions, which grows
+        with the number of lines. Always True if strict is.
+
+        maxErrors - stop recording parse errors, and indexing newlines,
+        after this many
+
+        coalesceCharacters - have the tokenizer merge adjacent character
+        tokens, so that each run of text is handled at once rather than in
+        pieces split at character references and the like
+
         tree - a treebuilder class controlling the type of tree that will be
         returned. Built in treebuilders can be accessed through
         html5lib.treebuilders.getTreeBuilder(treeType)
@@ -67,12 +82,19 @@ class HTMLParser(object):
 
         # Raise an exception on the first error encountered
         self.strict = strict
+        self.collectErrors = collectErrors or strict
+        self.maxErrors = maxErrors
+        self.coalesceCharacters = coalesceCharacters
 
         if tree is None:
             tree = treebuilders.getTreeBuilder("etree")
         self.tree = tree(namespaceHTMLElements)
         self.tokenizer_class = tokenizer
         self.errors = []
+        self.feeding = False
+        # Number of times parsing has had to start again from the beginning
+        # because the encoding changed part way through a document
+        self.reparseCount = 0
 
         self.phases = dict([(name, cls(self, self.tree)) for name, cls in
                             getPhases(debug).items()])
@@ -93,12 +115,93 @@ class HTMLParser(object):
                 self.mainLoop()
                 break
             except ReparseException:
+                self.reparseCount += 1
+                self.reset()
+
+    def begin(self, encoding=None, parseMeta=True, useChardet=True, **kwargs):
+        """Prepare to parse a HTML document passed in piece by piece with
+        feed()
+
+        Calling this is only needed to pass arguments; feed() calls it with
+        the defaults otherwise.
+
+        The optional encoding parameter must be a string that indicates
+        the encoding.  If specified, that encoding will be used,
+        regardless of any BOM or later declaration (such as in a meta
+        element)
+
+        Other keyword arguments are passed on to the tokenizer and input
+        stream, as for parse.
+        """
+        self.innerHTMLMode = False
+        self.container = "div"
+        stream = inputstream.HTMLIncrementalInputStream(encoding, parseMeta,
+                                                        useChardet, **kwargs)
+        self.tokenizer = self.tokenizer_class(stream, encoding=encoding,
+                                              parseMeta=parseMeta,
+                                              useChardet=useChardet,
+                                              parser=self, **kwargs)
+        self.reset()
+        self.feeding = True
+
+    def feed(self, data):
+        """Parse the next piece of a HTML document
+
+        data - a unicode or bytes string; all the pieces of a document must
+        be of the same type
+
+        As much of the tree is built as the data so far allows; the rest of
+        it is built by later calls to feed() and close().
+        """
+        if not self.feeding:
+            self.begin()
+        self.tokenizer.stream.feed(data)
+        self.feedLoop(False)
+
+    def close(self):
+        """Finish parsing a HTML document passed in with feed() and return
+        the tree"""
+        if not self.feeding:
+            self.begin()
+        self.tokenizer.stream.close()
+        self.feedLoop(True)
+        self.feeding = False
+        return self.tree.getDocument()
+
+    def feedLoop(self, finish, maxTokens=None):
+        """Process the tokens for the data fed so far
+
+        finish - also handle the end of the document once all the data has
+        been processed
+
+        maxTokens - stop after roughly this many tokens; returns True if it
+        did so, in which case call feedLoop again to carry on
+        """
+        self.tokenizer.tokenLimit = maxTokens
+        while True:
+            try:
+                self.mainLoop(False)
+                break
+            except ReparseException:
+                self.reparseCount += 1
                 self.reset()
+        if self.tokenizer.paused:
+            return True
+        if finish:
+            self.processEOF()
+        return False
 
     def reset(self):
         self.tree.reset()
         self.firstStartTag = False
         self.errors = []
+        self.collectingErrors = self.collectErrors and self.maxErrors != 0
+        # The offset in the text to report errors at, if the token being
+        # handled gives one
+        self.tokenOffset = None
+        self.tokenizer.collectErrors = self.collectingErrors
+        self.tokenizer.stream.trackLines = self.collectingErrors
+        self.tokenizer.coalesceCharacters = self.coalesceCharacters
         self.log = []  # only used with debug mode
         # "quirks" / "limited quirks" / "no quirks"
         self.compatMode = "no quirks"
@@ -142,7 +245,7 @@ class HTMLParser(object):
     def isMathMLTextIntegrationPoint(self, element):
         return (element.namespace, element.name) in mathmlTextIntegrationPointElements
 
-    def mainLoop(self):
+    def mainLoop(self, finish=True):
         CharactersToken = tokenTypes["Characters"]
         SpaceCharactersToken = tokenTypes["SpaceCharacters"]
         StartTagToken = tokenTypes["StartTag"]
@@ -151,7 +254,12 @@ class HTMLParser(object):
         DoctypeToken = tokenTypes["Doctype"]
         ParseErrorToken = tokenTypes["ParseError"]
 
-        for token in self.normalizedTokens():
+        # The tokenizer hands its tokens over a batch at a time
+        for token in chain.from_iterable(self.tokenBatches()):
+            # A token handed over later than the step of the tokenizer that
+            # made it says where the tokenizer had got to then
+            self.tokenOffset = token.get("offset")
+            token = self.normalizeToken(token)
             new_token = token
             while new_token is not None:
                 currentNode = self.tree.openElements[-1] if self.tree.openElements else None
@@ -196,7 +304,12 @@ class HTMLParser(object):
                     and not token["selfClosingAcknowledged"]):
                 self.parseError("non-void-element-with-trailing-solidus",
                                 {"name": token["name"]})
+        self.tokenOffset = None
 
+        if finish:
+            self.processEOF()
+
+    def processEOF(self):
         # When the loop finishes it's EOF
         reprocess = True
         phases = []
@@ -210,7 +323,18 @@ class HTMLParser(object):
         for token in self.tokenizer:
             yield self.normalizeToken(token)
 
-    def parse(self, stream, encoding=None, parseMeta=True, useChardet=True):
+    def tokenBatches(self):
+        """Return an iterator over lists of tokens from the tokenizer"""
+        # A tokenizer that doesn't inherit HTMLTokenizer.__iter__ may do
+        # something to the tokens there, so take them from that one at a
+        # time instead
+        if (getattr(type(self.tokenizer), "__iter__", None) ==
+                tokenizer.HTMLTokenizer.__iter__):
+            return self.tokenizer.iterBatches()
+        return ([token] for token in self.tokenizer)
+
+    def parse(self, stream, encoding=None, parseMeta=True, useChardet=True,
+              **kwargs):
         """Parse a HTML document into a well-formed tree
 
         stream - a filelike object or string containing the HTML to be parsed
@@ -219,13 +343,16 @@ class HTMLParser(object):
         the encoding.  If specified, that encoding will be used,
         regardless of any BOM or later declaration (such as in a meta
         element)
+
+        Any other keyword arguments are passed on to the tokenizer and
+        input stream, e.g. boundedBuffer or chunkSize
         """
         self._parse(stream, innerHTML=False, encoding=encoding,
-                    parseMeta=parseMeta, useChardet=useChardet)
+                    parseMeta=parseMeta, useChardet=useChardet, **kwargs)
         return self.tree.getDocument()
 
     def parseFragment(self, stream, container="div", encoding=None,
-                      parseMeta=False, useChardet=True):
+                      parseMeta=False, useChardet=True, **kwargs):
         """Parse a HTML fragment into a well-formed tree fragment
 
         container - name of the element we're setting the innerHTML property
@@ -238,14 +365,44 @@ class HTMLParser(object):
         regardless of any BOM or later declaration (such as in a meta
         element)
         """
-        self._parse(stream, True, container=container, encoding=encoding)
+        self._parse(stream, True, container=container, encoding=encoding,
+                    **kwargs)
         return self.tree.getFragment()
 
+    @property
+    def errors(self):
+        """The parse errors found so far, as a list of
+        ((line, col), errorcode, datavars) tuples"""
+        # parseError only records the offset of each error in the text;
+        # the line and column are worked out here, when they are needed
+        if self._unresolvedErrors:
+            positionAt = self.tokenizer.stream.positionAt
+            self._errors.extend([(positionAt(offset), errorcode, datavars)
+                                 for offset, errorcode, datavars
+                                 in self._unresolvedErrors])
+            self._unresolvedErrors = []
+        return self._errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
+        self._unresolvedErrors = []
+
     def parseError(self, errorcode="XXX-undefined-error", datavars={}):
         # XXX The idea is to make errorcode mandatory.
-        self.errors.append((self.tokenizer.stream.position(), errorcode, datavars))
+        if not self.collectingErrors:
+            return
+        offset = self.tokenOffset
+        if offset is None:
+            offset = self.tokenizer.stream.offset()
+        self._unresolvedErrors.append((offset, errorcode, datavars))
         if self.strict:
             raise ParseError
+        if len(self._errors) + len(self._unresolvedErrors) == self.maxErrors:
+            self.collectingErrors = False
+            self.tokenizer.collectErrors = False
+            # The errors recorded are all in the text read so far
+            self.tokenizer.stream.trackLines = False
 
     def normalizeToken(self, token):
         """ HTML5 specific normalizations to the token stream """
@@ -464,6 +621,17 @@ def getPhases(debug):
         def processSpaceCharacters(self, token):
             self.tree.insertText(token["data"])
 
+        def processSpacesAmongCharacters(self, token):
+            # For phases that ignore characters other than spaces. Once the
+            # tokenizer has emitted a character that isn't a space, it puts
+            # any spaces after it in the same Characters token, so find them
+            # there.
+            spaces = "".join([char for char in token["data"]
+                              if char in spaceCharacters])
+            if spaces:
+                self.processSpaceCharacters(
+                    {"type": tokenTypes["SpaceCharacters"], "data": spaces})
+
         def processStartTag(self, token):
             return self.startTagHandler[token["name"]](token)
 
@@ -1911,6 +2079,7 @@ def getPhases(debug):
             self.endTagColgroup(impliedTagToken("colgroup"))
             if not ignoreEndTag:
                 return token
+            self.processSpacesAmongCharacters(token)
 
         def startTagCol(self, token):
             self.tree.insertElement(token)
@@ -2530,6 +2699,7 @@ def getPhases(debug):
 
         def processCharacters(self, token):
             self.parser.parseError("unexpected-char-in-frameset")
+            self.processSpacesAmongCharacters(token)
 
         def startTagFrameset(self, token):
             self.tree.insertElement(token)
@@ -2583,6 +2753,7 @@ def getPhases(debug):
 
         def processCharacters(self, token):
             self.parser.parseError("unexpected-char-after-frameset")
+            self.processSpacesAmongCharacters(token)
 
         def startTagNoframes(self, token):
             return self.parser.phases["inHead"].processStartTag(token)
@@ -2657,6 +2828,7 @@ def getPhases(debug):
 
         def processCharacters(self, token):
             self.parser.parseError("expected-eof-but-got-char")
+            self.processSpacesAmongCharacters(token)
 
         def startTagHtml(self, token):
             return self.parser.phases["inBody"].processStartTag(token)
@@ -1,13 +1,19 @@
 from __future__ import absolute_import, division, unicode_literals
 from six import text_type
 
+import bisect
 import codecs
+import hashlib
+import mmap
+import os
 import re
 
 from .constants import EOF, spaceCharacters, asciiLetters, asciiUppercase
-from .constants import encodings, ReparseException
+from .constants import asciiUpper2Lower
+from .constants import encodings, ReparseException, NeedMoreDataException
 from . import utils
 
+from array import array
 from io import StringIO
 
 try:
@@ -15,6 +21,14 @@ try:
 except ImportError:
     BytesIO = StringIO
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    try:
+        from ordereddict import OrderedDict
+    except ImportError:
+        OrderedDict = dict
+
 try:
     from io import BufferedIOBase
 except ImportError:
@@ -26,9 +40,24 @@ spaceCharactersBytes = frozenset([item.encode("ascii") for item in spaceCharacte
 asciiLettersBytes = frozenset([item.encode("ascii") for item in asciiLetters])
 asciiUppercaseBytes = frozenset([item.encode("ascii") for item in asciiUppercase])
 spacesAngleBrackets = spaceCharactersBytes | frozenset([b">", b"<"])
+nonAsciiBytesRegexp = re.compile(b"[\x80-\xff]")
 
 invalid_unicode_re = re.compile("[\u0001-\u0008\u000B\u000E-\u001F\u007F-\u009F\uD800-\uDFFF\uFDD0-\uFDEF\uFFFE\uFFFF\U0001FFFE\U0001FFFF\U0002FFFE\U0002FFFF\U0003FFFE\U0003FFFF\U0004FFFE\U0004FFFF\U0005FFFE\U0005FFFF\U0006FFFE\U0006FFFF\U0007FFFE\U0007FFFF\U0008FFFE\U0008FFFF\U0009FFFE\U0009FFFF\U000AFFFE\U000AFFFF\U000BFFFE\U000BFFFF\U000CFFFE\U000CFFFF\U000DFFFE\U000DFFFF\U000EFFFE\U000EFFFF\U000FFFFE\U000FFFFF\U0010FFFE\U0010FFFF]")
 
+# Quicker to search with than invalid_unicode_re, at the cost of also
+# matching some valid characters outside the BMP: listing the invalid ones
+# individually makes the regex several times slower. On UCS2 builds they
+# are covered by the surrogates.
+if len("\U0010FFFF") == 1:
+    invalid_unicode_filter_re = re.compile("[\u0001-\u0008\u000B\u000E-\u001F\u007F-\u009F\uD800-\uDFFF\uFDD0-\uFDEF\uFFFE\uFFFF\U0001FFFE-\U0010FFFF]")
+else:
+    invalid_unicode_filter_re = re.compile("[\u0001-\u0008\u000B\u000E-\u001F\u007F-\u009F\uD800-\uDFFF\uFDD0-\uFDEF\uFFFE\uFFFF]")
+
+# Characters that may mean a chunk needs more than passing through
+normalize_chunk_re = re.compile("[\r" + invalid_unicode_filter_re.pattern[1:])
+
+newline_re = re.compile("\n")
+
 non_bmp_invalid_codepoints = set([0x1FFFE, 0x1FFFF, 0x2FFFE, 0x2FFFF, 0x3FFFE,
                                   0x3FFFF, 0x4FFFE, 0x4FFFF, 0x5FFFE, 0x5FFFF,
                                   0x6FFFE, 0x6FFFF, 0x7FFFE, 0x7FFFF, 0x8FFFE,
@@ -43,51 +72,263 @@ ascii_punctuation_re = re.compile("[\u0009-\u000D\u0020-\u002F\u003A-\u0040\u005
 charsUntilRegEx = {}
 
 
+def switchPoint(oldText, newText, returned, unused):
+    """Work out where to carry on from when switching encoding part way
+    through decoding
+
+    oldText and newText are the same bytes decoded with the old and new
+    encodings, the first returned characters of oldText have been passed
+    on and the last unused of those (counted after newline normalisation)
+    have not been used yet.
+
+    Returns None if the characters used so far differ in the two texts, and
+    otherwise a tuple of the position in newText to carry on from and the
+    number of unused characters to discard. Unused characters that come out
+    the same either way are kept.
+    """
+    position = returned
+    discard = 0
+    limit = len(os.path.commonprefix([oldText, newText]))
+    while position > limit or (position > 0 and newText[position - 1] == "\r" and
+                               newText[position:position + 1] == "\n"):
+        if discard == unused:
+            return None
+        position -= 1
+        if oldText[position] == "\n" and position > 0 and oldText[position - 1] == "\r":
+            position -= 1
+        discard += 1
+    return position, discard
+
+
+def byteOffset(data, encoding, count):
+    """Return the number of bytes at the start of data that decode to the
+    first count characters in encoding"""
+    low = 0
+    high = len(data)
+    while low < high:
+        middle = (low + high) // 2
+        decoder = codecs.getincrementaldecoder(encoding)("replace")
+        if len(decoder.decode(data[:middle])) < count:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+class BufferDecoder(object):
+    """Reads unicode from a buffer of bytes such as an mmap
+
+    Rather than going through a file-like object a few kilobytes at a time,
+    the buffer is decoded in large slices which are then handed out in
+    pieces of the size asked for. (Decoding much more than this at once
+    gets slower again as the text no longer fits in the CPU cache.)
+    """
+
+    sliceSize = 65536
+
+    def __init__(self, buffer, offset, encoding):
+        self.buffer = buffer
+        # Where decoding started and how far it has got
+        self.start = self.offset = offset
+        self.encoding = encoding
+        self.decoder = codecs.getincrementaldecoder(encoding)("replace")
+        self.text = ""
+        self.textOffset = 0
+
+    def readBytes(self, size):
+        data = self.buffer[self.offset:self.offset + size]
+        self.offset += len(data)
+        return data
+
+    def rawBytes(self, start, end):
+        """Return the bytes between start and end again"""
+        return self.buffer[start:end]
+
+    def read(self, size=-1):
+        # Decode more when what is left is short, so that a piece never ends
+        # early at the edge of a slice
+        available = len(self.text) - self.textOffset
+        if (size < 0 or available < size) and self.decoder is not None:
+            # Join the slices once at the end, rather than each time, for
+            # large sizes
+            pieces = [self.text[self.textOffset:]]
+            while (size < 0 or available < size) and self.decoder is not None:
+                data = self.readBytes(self.sliceSize)
+                text = self.decoder.decode(data, not data)
+                pieces.append(text)
+                available += len(text)
+                if not data:
+                    self.decoder = None
+            self.text = "".join(pieces)
+            self.textOffset = 0
+        if size < 0:
+            end = len(self.text)
+        else:
+            end = min(self.textOffset + size, len(self.text))
+        rv = self.text[self.textOffset:end]
+        self.textOffset = end
+        return rv
+
+    def changeEncoding(self, encoding, unused):
+        """Carry on decoding with a different encoding, if the characters
+        used so far are the same in either of them
+
+        unused - the number of characters (after newline normalisation) at
+        the end of those returned by read() that have not been used. Those
+        that come out differently are decoded again and returned by read()
+        again.
+
+        Returns the number of unused characters to discard, or None, leaving
+        the decoder unchanged, if the characters used so far differ.
+        """
+        data = self.rawBytes(self.start, self.offset)
+        final = self.decoder is None
+        oldText = codecs.getincrementaldecoder(self.encoding)("replace").decode(data, final)
+        newDecoder = codecs.getincrementaldecoder(encoding)("replace")
+        newText = newDecoder.decode(data, final)
+        returned = len(oldText) - (len(self.text) - self.textOffset)
+        switch = switchPoint(oldText, newText, returned, unused)
+        if switch is None:
+            return None
+        self.encoding = encoding
+        self.text = newText
+        self.textOffset = switch[0]
+        if not final:
+            self.decoder = newDecoder
+        return switch[1]
+
+
+class StreamDecoder(BufferDecoder):
+    """Reads unicode from a file-like object of bytes
+
+    The stream must be seekable (wrap it in a BufferedStream if not) for
+    changeEncoding to look at the bytes decoded so far again. For a
+    BufferedStream that has stopped buffering, the last keepBytes bytes
+    read are kept instead, and more for reads of more characters (at up to
+    four bytes each), which covers the characters that have been decoded
+    but not yet used.
+    """
+
+    keepBytes = 4 * BufferDecoder.sliceSize
+
+    def __init__(self, buffer, offset, encoding):
+        BufferDecoder.__init__(self, buffer, offset, encoding)
+        self.recentBytes = []
+        self.recentLength = 0
+        self.windowBytes = self.keepBytes
+
+    def read(self, size=-1):
+        if size < 0:
+            self.windowBytes = float("inf")
+        else:
+            self.windowBytes = max(self.windowBytes,
+                                   self.keepBytes + 4 * size)
+        return BufferDecoder.read(self, size)
+
+    def changeEncoding(self, encoding, unused):
+        if not getattr(self.buffer, "discarded", 0):
+            return BufferDecoder.changeEncoding(self, encoding, unused)
+        # The bytes before the last few slices are gone, so the characters
+        # used so far stay as they are, and the rest are decoded again with
+        # the new encoding from the byte the first of them starts at
+        data = b"".join(self.recentBytes)
+        final = self.decoder is None
+        oldText = codecs.getincrementaldecoder(self.encoding)("replace").decode(data, final)
+        position = len(oldText) - (len(self.text) - self.textOffset)
+        for i in range(unused):
+            if position <= 0:
+                return None
+            position -= 1
+            if oldText[position] == "\n" and position > 0 and oldText[position - 1] == "\r":
+                position -= 1
+        start = byteOffset(data, self.encoding, position)
+        newDecoder = codecs.getincrementaldecoder(encoding)("replace")
+        self.encoding = encoding
+        self.text = newDecoder.decode(data[start:], final)
+        self.textOffset = 0
+        if not final:
+            self.decoder = newDecoder
+        return unused
+
+    def readBytes(self, size):
+        data = self.buffer.read(size)
+        self.offset += len(data)
+        if getattr(self.buffer, "buffering", True) is False:
+            recentBytes = self.recentBytes
+            recentBytes.append(data)
+            self.recentLength += len(data)
+            while self.recentLength - len(recentBytes[0]) >= self.windowBytes:
+                self.recentLength -= len(recentBytes.pop(0))
+        return data
+
+    def rawBytes(self, start, end):
+        position = self.buffer.tell()
+        self.buffer.seek(start)
+        data = self.buffer.read(end - start)
+        self.buffer.seek(position)
+        return data
+
+
 class BufferedStream(object):
     """Buffering for streams that do not have buffering of their own
 
     The buffer is implemented as a list of chunks on the assumption that
     joining many strings will be slow since it is O(n**2)
+
+    After stopBuffering() has been called, data read from the stream past
+    the end of the buffer is no longer kept. Memory use then stays the same
+    however much more is read, but it is only possible to seek back to data
+    in the buffer if nothing has been read past it yet, or to seek() back
+    to the end of the data read after reading from the buffer.
     """
 
     def __init__(self, stream):
         self.stream = stream
         self.buffer = []
         self.position = [-1, 0]  # chunk number, offset
+        self.offset = 0  # position in the stream as a whole
+        self.bufferedBytes = 0
+        self.buffering = True
+        # Bytes read from the stream and not kept in the buffer
+        self.discarded = 0
 
     def tell(self):
-        pos = 0
-        for chunk in self.buffer[:self.position[0]]:
-            pos += len(chunk)
-        pos += self.position[1]
-        return pos
+        return self.offset
 
     def seek(self, pos):
-        assert pos <= self._bufferedBytes()
+        if pos >= self.bufferedBytes:
+            # Past the buffer, so the next read comes from the stream
+            assert pos in (self.bufferedBytes, self.bufferedBytes + self.discarded)
+            self.offset = pos
+            return
         offset = pos
         i = 0
-        while len(self.buffer[i]) < offset:
+        while len(self.buffer[i]) <= offset:
             offset -= len(self.buffer[i])
             i += 1
         self.position = [i, offset]
+        self.offset = pos
+
+    def stopBuffering(self):
+        self.buffering = False
 
     def read(self, bytes):
-        if not self.buffer:
-            return self._readStream(bytes)
-        elif (self.position[0] == len(self.buffer) and
-              self.position[1] == len(self.buffer[-1])):
+        if self.offset >= self.bufferedBytes:
             return self._readStream(bytes)
         else:
             return self._readFromBuffer(bytes)
 
-    def _bufferedBytes(self):
-        return sum([len(item) for item in self.buffer])
-
     def _readStream(self, bytes):
+        if self.offset != self.bufferedBytes + self.discarded:
+            raise IOError("Data no longer buffered")
         data = self.stream.read(bytes)
-        self.buffer.append(data)
-        self.position[0] += 1
-        self.position[1] = len(data)
+        if self.buffering:
+            self.buffer.append(data)
+            self.position = [len(self.buffer) - 1, len(data)]
+            self.bufferedBytes += len(data)
+        else:
+            self.discarded += len(data)
+        self.offset += len(data)
         return data
 
     def _readFromBuffer(self, bytes):
@@ -107,6 +348,7 @@ class BufferedStream(object):
                 self.position = [bufferIndex, len(bufferedData)]
                 bufferIndex += 1
             rv.append(bufferedData[bufferOffset:bufferOffset + bytesToRead])
+            self.offset += bytesToRead
             remainingBytes -= bytesToRead
 
             bufferOffset = 0
@@ -117,7 +359,56 @@ class BufferedStream(object):
         return b"".join(rv)
 
 
-def HTMLInputStream(source, encoding=None, parseMeta=True, chardet=True):
+class EncodingCache(object):
+    """Remembers the encodings detected for documents, so that detection can
+    be skipped for documents seen again
+
+    Holds at most maxSize (encoding, confidence) pairs, forgetting the least
+    recently used first. Anything else with get() and __setitem__ methods,
+    such as a dict or a wrapper around an external store, can be used as an
+    encoding cache instead.
+    """
+
+    def __init__(self, maxSize=1000):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            value = self.entries.pop(key)
+        except KeyError:
+            return default
+        self.entries[key] = value
+        return value
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.entries.pop(key, None)
+        while self.entries and len(self.entries) >= self.maxSize:
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = value
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def HTMLInputStream(source, encoding=None, parseMeta=True, chardet=True,
+                    **kwargs):
+    if isinstance(source, HTMLUnicodeInputStream):
+        # Already an input stream, e.g. one set up by HTMLParser.feed
+        return source
+
     if hasattr(source, "read"):
         isUnicode = isinstance(source.read(0), text_type)
     else:
@@ -127,9 +418,10 @@ def HTMLInputStream(source, encoding=None, parseMeta=True, chardet=True):
         if encoding is not None:
             raise TypeError("Cannot explicitly set an encoding with a unicode string")
 
-        return HTMLUnicodeInputStream(source)
+        return HTMLUnicodeInputStream(source, **kwargs)
     else:
-        return HTMLBinaryInputStream(source, encoding, parseMeta, chardet)
+        return HTMLBinaryInputStream(source, encoding, parseMeta, chardet,
+                                     **kwargs)
 
 
 class HTMLUnicodeInputStream(object):
@@ -142,7 +434,9 @@ class HTMLUnicodeInputStream(object):
 
     _defaultChunkSize = 10240
 
-    def __init__(self, source):
+    def __init__(self, source, chunkSize=None, adaptiveChunkSize=False,
+                 boundedBuffer=False, encodingCache=None, cacheKey=None,
+                 numBytesProbe=4096, maxBytesChardet=None):
         """Initialises the HTMLInputStream.
 
         HTMLInputStream(source, [encoding]) -> Normalized stream from source
@@ -157,7 +451,21 @@ class HTMLUnicodeInputStream(object):
 
         parseMeta - Look for a <meta> element containing encoding information
 
+        chunkSize - The number of characters to read from the source at a
+        time
+
+        adaptiveChunkSize - For a string source, double the number of
+        characters read each time, so that a large document is read in a
+        few large chunks while a small one is still read in one small one
+
+        boundedBuffer, encodingCache, cacheKey, numBytesProbe,
+        maxBytesChardet - As for HTMLBinaryInputStream; they only apply to
+        bytes, so are ignored here
+
         """
+        self.firstChunkSize = chunkSize or self._defaultChunkSize
+        self.adaptiveChunkSize = (adaptiveChunkSize and
+                                  not hasattr(source, "read"))
 
         # Craziness
         if len("\U0010FFFF") == 1:
@@ -167,28 +475,38 @@ class HTMLUnicodeInputStream(object):
             self.reportCharacterErrors = self.characterErrorsUCS2
             self.replaceCharactersRegexp = re.compile("([\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?<![\uD800-\uDBFF])[\uDC00-\uDFFF])")
 
-        # List of where new lines occur
-        self.newLines = [0]
-
         self.charEncoding = ("utf-8", "certain")
         self.dataStream = self.openStream(source)
 
+        # Whether to keep the index of newline offsets that positionAt
+        # uses, which takes memory in proportion to the number of lines;
+        # HTMLParser turns it off when it isn't collecting errors
+        self.trackLines = True
+
         self.reset()
 
     def reset(self):
         self.chunk = ""
         self.chunkSize = 0
         self.chunkOffset = 0
+        self.nextChunkSize = self.firstChunkSize
         self.errors = []
+        # Offsets in the whole text of the characters the errors are about
+        self.errorOffsets = []
 
-        # number of (complete) lines in previous chunks
-        self.prevNumLines = 0
-        # number of columns in the last line of the previous chunk
-        self.prevNumCols = 0
+        # Offset in the whole text of the start of the current chunk
+        self.chunkStart = 0
+        # Offsets in the whole text of the newlines read so far, used to
+        # work out line and column numbers only when they are asked for
+        self.newLines = array(str("l"))
 
         # Deal with CR LF and surrogates split over chunk boundaries
         self._bufferedCharacter = None
 
+        # The method and arguments of the last read of a run of characters
+        # cut off by the end of the data fed so far, to carry on with
+        self.cutRun = None
+
     def openStream(self, source):
         """Produces a file object from source.
 
@@ -203,21 +521,38 @@ class HTMLUnicodeInputStream(object):
 
         return stream
 
-    def _position(self, offset):
-        chunk = self.chunk
-        nLines = chunk.count('\n', 0, offset)
-        positionLine = self.prevNumLines + nLines
-        lastLinePos = chunk.rfind('\n', 0, offset)
-        if lastLinePos == -1:
-            positionColumn = self.prevNumCols + offset
+    def offset(self):
+        """Returns the offset of the current position in the whole text"""
+        return self.chunkStart + self.chunkOffset
+
+    def positionAt(self, offset):
+        """Returns (line, col) of an offset returned by offset() that has
+        been read from the stream, which is only right if trackLines was
+        set while the text up to it was read"""
+        newLines = self.newLines
+        line = bisect.bisect_left(newLines, offset)
+        if line:
+            col = offset - newLines[line - 1] - 1
         else:
-            positionColumn = offset - (lastLinePos + 1)
-        return (positionLine, positionColumn)
+            col = offset
+        return (line + 1, col)
 
     def position(self):
         """Returns (line, col) of the current position in the stream."""
-        line, col = self._position(self.chunkOffset)
-        return (line + 1, col)
+        return self.positionAt(self.chunkStart + self.chunkOffset)
+
+    def errorsReached(self):
+        """Return whether the offset of the first of errors has been read up
+        to"""
+        return (bool(self.errors) and
+                self.errorOffsets[0] <= self.chunkStart + self.chunkOffset)
+
+    def indexNewLines(self, data, start):
+        """Add the newlines in data, which starts at offset start in the
+        whole text, to the index used by positionAt"""
+        if self.trackLines and "\n" in data:
+            self.newLines.extend([match.start() + start for match in
+                                  newline_re.finditer(data)])
 
     def char(self):
         """ Read one character from the stream or queue if available. Return
@@ -236,10 +571,11 @@ class HTMLUnicodeInputStream(object):
 
     def readChunk(self, chunkSize=None):
         if chunkSize is None:
-            chunkSize = self._defaultChunkSize
-
-        self.prevNumLines, self.prevNumCols = self._position(self.chunkSize)
+            chunkSize = self.nextChunkSize
+            if self.adaptiveChunkSize:
+                self.nextChunkSize *= 2
 
+        self.chunkStart += self.chunkSize
         self.chunk = ""
         self.chunkSize = 0
         self.chunkOffset = 0
@@ -254,31 +590,63 @@ class HTMLUnicodeInputStream(object):
             # We have no more data, bye-bye stream
             return False
 
-        if len(data) > 1:
-            lastv = ord(data[-1])
-            if lastv == 0x0D or 0xD800 <= lastv <= 0xDBFF:
+        lastv = ord(data[-1])
+        while lastv == 0x0D or 0xD800 <= lastv <= 0xDBFF:
+            if len(data) > 1:
                 self._bufferedCharacter = data[-1]
                 data = data[:-1]
+                break
+            # Only the one character, so read on to see what follows it
+            more = self.dataStream.read(chunkSize)
+            if not more:
+                break
+            data += more
+            lastv = ord(data[-1])
 
-        self.reportCharacterErrors(data)
-
-        # Replace invalid characters
-        # Note U+0000 is dealt with in the tokenizer
-        data = self.replaceCharactersRegexp.sub("\ufffd", data)
-
-        data = data.replace("\r\n", "\n")
-        data = data.replace("\r", "\n")
+        data = self.normalizeChunk(data, self.chunkStart)
+        self.indexNewLines(data, self.chunkStart)
 
         self.chunk = data
         self.chunkSize = len(data)
 
         return True
 
-    def characterErrorsUCS4(self, data):
-        for i in range(len(invalid_unicode_re.findall(data))):
-            self.errors.append("invalid-codepoint")
+    def normalizeChunk(self, data, start=0):
+        """Normalise newlines in data, which starts at offset start in the
+        whole text, report invalid characters in it and replace lone
+        surrogates"""
+        # Most chunks need none of this, which one quick search can tell
+        if normalize_chunk_re.search(data) is None:
+            return data
+
+        # Newlines first, so that the errors get offsets in the normalised
+        # text
+        if "\r" in data:
+            data = data.replace("\r\n", "\n")
+            data = data.replace("\r", "\n")
+
+        if invalid_unicode_filter_re.search(data) is not None:
+            self.reportCharacterErrors(data, start)
+
+            # Replace invalid characters
+            # Note U+0000 is dealt with in the tokenizer
+            data = self.replaceCharactersRegexp.sub("\ufffd", data)
+
+        return data
+
+    def characterError(self, offset):
+        # Recorded just after the character, where the tokenizer reports
+        # errors about the characters it reads
+        self.errors.append("invalid-codepoint")
+        self.errorOffsets.append(offset + 1)
+
+    def characterErrorsUCS4(self, data, start=0):
+        for match in invalid_unicode_filter_re.finditer(data):
+            codepoint = ord(match.group())
+            if codepoint < 0x1FFFE or codepoint in non_bmp_invalid_codepoints:
+                self.characterError(start + match.start())
 
-    def characterErrorsUCS2(self, data):
+    def characterErrorsUCS2(self, data, start=0):
         # Someone picked the wrong compile option
         # You lose
         skip = False
@@ -292,14 +660,14 @@ class HTMLUnicodeInputStream(object):
                 # We have a surrogate pair!
                 char_val = utils.surrogatePairToCodepoint(data[pos:pos + 2])
                 if char_val in non_bmp_invalid_codepoints:
-                    self.errors.append("invalid-codepoint")
+                    self.characterError(start + pos)
                 skip = True
             elif (codepoint >= 0xD800 and codepoint <= 0xDFFF and
                   pos == len(data) - 1):
-                self.errors.append("invalid-codepoint")
+                self.characterError(start + pos)
             else:
                 skip = False
-                self.errors.append("invalid-codepoint")
+                self.characterError(start + pos)
 
     def charsUntil(self, characters, opposite=False):
         """ Returns a string of characters from the stream up to but not
@@ -341,13 +709,145 @@ class HTMLUnicodeInputStream(object):
             # If the whole remainder of the chunk matched,
             # use it all and read the next chunk
             rv.append(self.chunk[self.chunkOffset:])
-            if not self.readChunk():
-                # Reached EOF
+            self.chunkOffset = self.chunkSize
+            try:
+                if not self.readChunk():
+                    # Reached EOF
+                    break
+            except NeedMoreDataException:
+                # The run goes on past the data fed so far
+                self.cutRun = (self.charsUntil, (characters, opposite))
                 break
 
         r = "".join(rv)
         return r
 
+    def matchChars(self, regex):
+        """ Returns the characters matched by the compiled regular expression
+        'regex' at the current position, and moves past them. 'regex' must
+        match any run, including an empty one, of characters from a set, such
+        as "[^>]*", so that a run broken across chunks can be matched in parts.
+        """
+        m = regex.match(self.chunk, self.chunkOffset)
+        end = m.end()
+        if end != self.chunkSize:
+            # The run ends within the chunk, as all but very long ones do
+            rv = self.chunk[self.chunkOffset:end]
+            self.chunkOffset = end
+            return rv
+
+        rv = [self.chunk[self.chunkOffset:]]
+        self.chunkOffset = self.chunkSize
+        try:
+            while self.readChunk():
+                end = regex.match(self.chunk, self.chunkOffset).end()
+                rv.append(self.chunk[self.chunkOffset:end])
+                self.chunkOffset = end
+                if end != self.chunkSize:
+                    break
+        except NeedMoreDataException:
+            # The run goes on past the data fed so far
+            self.cutRun = (self.matchChars, (regex,))
+        return "".join(rv)
+
+    def charsUntilMatch(self, regex, length):
+        """ Returns the characters from the stream up to but not including the
+        first match of the compiled regular expression 'regex', or up to EOF,
+        and moves past them. Matches must be at most 'length' characters long.
+        Only matches that fit wholly in the chunk are trusted, so that one
+        split across chunks is found all the same, and a pattern ending in
+        "\\Z" only matches at EOF.
+        """
+        rv = []
+        atEOF = False
+        while True:
+            m = regex.search(self.chunk, self.chunkOffset)
+            # The last position a match can start and be seen whole
+            limit = self.chunkSize - length
+            if m is not None and (atEOF or m.start() <= limit):
+                rv.append(self.chunk[self.chunkOffset:m.start()])
+                self.chunkOffset = m.start()
+                break
+            if atEOF:
+                rv.append(self.chunk[self.chunkOffset:])
+                self.chunkOffset = self.chunkSize
+                break
+            # Nothing up to limit can start a match
+            end = max(limit + 1, self.chunkOffset)
+            rv.append(self.chunk[self.chunkOffset:end])
+            self.chunkOffset = end
+            try:
+                atEOF = not self.readMore()
+            except NeedMoreDataException:
+                # What is left may be the start of a match, so it waits
+                # for the data after it to be fed
+                self.cutRun = (self.charsUntilMatch, (regex, length))
+                break
+        return "".join(rv)
+
+    def readMore(self):
+        """ Reads the next chunk onto the end of the characters of the current
+        one not yet returned, so that they can be looked at together. Returns
+        False at EOF.
+        """
+        unread = self.chunk[self.chunkOffset:]
+        more = self.readChunk()
+        if unread:
+            self.chunk = unread + self.chunk
+            self.chunkSize += len(unread)
+            self.chunkStart -= len(unread)
+        return more
+
+    def peek(self, n):
+        """ Returns the next n characters, or as many as there are before EOF,
+        without moving past them.
+        """
+        while self.chunkSize - self.chunkOffset < n:
+            if not self.readMore():
+                break
+        return self.chunk[self.chunkOffset:self.chunkOffset + n]
+
+    def startswith(self, prefix, ignorecase=False):
+        """ Returns whether the next characters are 'prefix', comparing ASCII
+        letters case-insensitively if 'ignorecase' is set ('prefix' must then
+        be in lower case), without moving past them.
+        """
+        chars = self.peek(len(prefix))
+        if ignorecase:
+            chars = chars.translate(asciiUpper2Lower)
+        return chars == prefix
+
+    def consume(self, n):
+        """ Returns the next n characters, or as many as there are before EOF,
+        and moves past them.
+        """
+        chars = self.peek(n)
+        self.chunkOffset += len(chars)
+        return chars
+
+    def unusedLength(self):
+        """Return the number of characters read from the data stream but not
+        yet returned"""
+        length = self.chunkSize - self.chunkOffset
+        if self._bufferedCharacter:
+            length += 1
+        return length
+
+    def discardUnused(self, count):
+        """Forget the last count characters read from the data stream but
+        not yet returned"""
+        if count and self._bufferedCharacter:
+            self._bufferedCharacter = None
+            count -= 1
+        self.chunkSize -= count
+        self.chunk = self.chunk[:self.chunkSize]
+        end = self.chunkStart + self.chunkSize
+        del self.newLines[bisect.bisect_left(self.newLines, end):]
+        # The errors in them, not yet passed on, go too
+        kept = bisect.bisect_right(self.errorOffsets, end)
+        del self.errors[kept:]
+        del self.errorOffsets[kept:]
+
     def unget(self, char):
         # Only one character is allowed to be ungotten at once - it must
         # be consumed again before any further call to unget
@@ -360,6 +860,7 @@ class HTMLUnicodeInputStream(object):
                 # chunk:
                 self.chunk = char + self.chunk
                 self.chunkSize += 1
+                self.chunkStart -= 1
             else:
                 self.chunkOffset -= 1
                 assert self.chunk[self.chunkOffset] == char
@@ -373,13 +874,17 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
 
     """
 
-    def __init__(self, source, encoding=None, parseMeta=True, chardet=True):
+    def __init__(self, source, encoding=None, parseMeta=True, chardet=True,
+                 boundedBuffer=False, encodingCache=None, cacheKey=None,
+                 numBytesProbe=4096, maxBytesChardet=None, chunkSize=None,
+                 adaptiveChunkSize=False):
         """Initialises the HTMLInputStream.
 
         HTMLInputStream(source, [encoding]) -> Normalized stream from source
         for use by html5lib.
 
-        source can be either a file-object, local filename or a string.
+        source can be either a file-object, an mmap or a string. An mmap or
+        string is decoded directly rather than through a file-like object.
 
         The optional encoding parameter must be a string that indicates
         the encoding.  If specified, that encoding will be used,
@@ -388,12 +893,52 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
 
         parseMeta - Look for a <meta> element containing encoding information
 
+        boundedBuffer - For a file-like object that can't seek, only keep
+        the data read while detecting the encoding, and the last few slices
+        decoded, rather than the whole document. A later change of encoding
+        then applies from the first character not yet used instead of
+        starting again from the beginning. The offsets of the newlines
+        read, used to work out the line and column of parse errors, are
+        still kept for the whole document unless trackLines is turned off.
+
+        encodingCache - An EncodingCache, or other object with get() and
+        __setitem__ methods, to look up the encoding in before detecting it
+        and to store the detected encoding in afterwards. Not used if the
+        document starts with a BOM.
+
+        cacheKey - The key to use in the encodingCache, for example the
+        site the document came from. Defaults to a hash of the first
+        numBytesMeta bytes of the document.
+
+        numBytesProbe - The number of bytes to check before resorting to
+        chardet. If they are all ASCII the document is taken to be
+        windows-1252, and if they are valid UTF-8 it is taken to be UTF-8.
+        0 skips the check.
+
+        maxBytesChardet - The most bytes chardet may read, or None to let it
+        read as far as it needs to.
+
+        chunkSize, adaptiveChunkSize - As for HTMLUnicodeInputStream, where a
+        string or mmap source counts as a string
+
         """
+        self.encodingCache = encodingCache
+        self.cacheKey = cacheKey
+        self.numBytesProbe = numBytesProbe
+        self.maxBytesChardet = maxBytesChardet
+
         # Raw Stream - for unicode objects this will encode to utf-8 and set
         #              self.charEncoding as appropriate
         self.rawStream = self.openStream(source)
 
-        HTMLUnicodeInputStream.__init__(self, self.rawStream)
+        # Buffer to decode directly once the encoding is known
+        if isinstance(source, (bytes, mmap.mmap)):
+            self.rawBuffer = source
+        else:
+            self.rawBuffer = None
+
+        HTMLUnicodeInputStream.__init__(self, self.rawStream, chunkSize)
+        self.adaptiveChunkSize = adaptiveChunkSize and self.rawBuffer is not None
 
         self.charEncoding = (codecName(encoding), "certain")
 
@@ -410,21 +955,28 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
         if (self.charEncoding[0] is None):
             self.charEncoding = self.detectEncoding(parseMeta, chardet)
 
+        if boundedBuffer and isinstance(self.rawStream, BufferedStream):
+            self.rawStream.stopBuffering()
+
         # Call superclass
         self.reset()
 
     def reset(self):
-        self.dataStream = codecs.getreader(self.charEncoding[0])(self.rawStream,
-                                                                 'replace')
+        if self.rawBuffer is not None:
+            self.dataStream = BufferDecoder(self.rawBuffer, self.rawStream.tell(),
+                                            self.charEncoding[0])
+        else:
+            self.dataStream = StreamDecoder(self.rawStream, self.rawStream.tell(),
+                                            self.charEncoding[0])
         HTMLUnicodeInputStream.reset(self)
 
     def openStream(self, source):
         """Produces a file object from source.
 
-        source can be either a file object, local filename or a string.
+        source can be either a file object, an mmap or a string.
 
         """
-        # Already a file object
+        # Already a file object (or an mmap, which works like one)
         if hasattr(source, 'read'):
             stream = source
         else:
@@ -442,11 +994,23 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
         # This will also read past the BOM if present
         encoding = self.detectBOM()
         confidence = "certain"
+        # Then for the result of detecting the encoding of the same document
+        # before
+        if encoding is None and self.encodingCache is not None:
+            if self.cacheKey is None:
+                self.cacheKey = self.prefixKey()
+            cached = self.encodingCache.get(self.cacheKey)
+            if cached is not None:
+                return tuple(cached)
         # If there is no BOM need to look for meta elements with encoding
         # information
         if encoding is None and parseMeta:
             encoding = self.detectEncodingMeta()
             confidence = "tentative"
+        # Try the cheap check for ASCII and UTF-8 before chardet
+        if encoding is None and chardet and self.numBytesProbe:
+            encoding = self.detectEncodingProbe()
+            confidence = "tentative"
         # Guess with chardet, if avaliable
         if encoding is None and chardet:
             confidence = "tentative"
@@ -455,14 +1019,17 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
                     from charade.universaldetector import UniversalDetector
                 except ImportError:
                     from chardet.universaldetector import UniversalDetector
-                buffers = []
+                bytesRead = 0
                 detector = UniversalDetector()
                 while not detector.done:
-                    buffer = self.rawStream.read(self.numBytesChardet)
+                    size = self.numBytesChardet
+                    if self.maxBytesChardet is not None:
+                        size = min(size, self.maxBytesChardet - bytesRead)
+                    buffer = self.rawStream.read(size)
                     assert isinstance(buffer, bytes)
                     if not buffer:
                         break
-                    buffers.append(buffer)
+                    bytesRead += len(buffer)
                     detector.feed(buffer)
                 detector.close()
                 encoding = detector.result['encoding']
@@ -480,8 +1047,24 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
         if encoding.lower() in encodingSub:
             encoding = encodingSub[encoding.lower()]
 
+        if confidence != "certain" and self.encodingCache is not None:
+            self.encodingCache[self.cacheKey] = (encoding, confidence)
+
         return encoding, confidence
 
+    def prefixKey(self):
+        """Return the default encoding cache key, made from the start of the
+        stream"""
+        prefix = self.rawStream.read(self.numBytesMeta)
+        self.rawStream.seek(0)
+        return hashlib.sha1(prefix).hexdigest()
+
+    def updateEncodingCache(self, encoding):
+        """Remember an encoding declared later in the document, so the next
+        document with the same cache key starts out with it"""
+        if self.encodingCache is not None and self.cacheKey is not None:
+            self.encodingCache[self.cacheKey] = (encoding, "tentative")
+
     def changeEncoding(self, newEncoding):
         assert self.charEncoding[1] != "certain"
         newEncoding = codecName(newEncoding)
@@ -492,10 +1075,23 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
         elif newEncoding == self.charEncoding[0]:
             self.charEncoding = (self.charEncoding[0], "certain")
         else:
+            oldEncoding = self.charEncoding[0]
+            self.charEncoding = (newEncoding, "certain")
+            self.updateEncodingCache(newEncoding)
+            # Only start again if what has been read so far comes out
+            # differently in the new encoding
+            discard = self.dataStream.changeEncoding(newEncoding, self.unusedLength())
+            if discard is not None:
+                self.discardUnused(discard)
+                return
+            if getattr(self.rawStream, "discarded", 0):
+                # The start of the document is gone, so it can't be read
+                # again; carry on with the old encoding instead
+                self.charEncoding = (oldEncoding, "certain")
+                return
             self.rawStream.seek(0)
             self.reset()
-            self.charEncoding = (newEncoding, "certain")
-            raise ReparseException("Encoding changed from %s to %s" % (self.charEncoding[0], newEncoding))
+            raise ReparseException("Encoding changed from %s to %s" % (oldEncoding, newEncoding))
 
     def detectBOM(self):
         """Attempts to detect at BOM at the start of the stream. If
@@ -528,12 +1124,42 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
 
         return encoding
 
+    def detectEncodingProbe(self):
+        """Report windows-1252 if the first numBytesProbe bytes are ASCII, or
+        UTF-8 if they are valid UTF-8, and otherwise None
+        """
+        # Streams such as sockets and pipes may return less than asked for
+        # before the end of the data
+        pieces = []
+        length = 0
+        final = False
+        while length < self.numBytesProbe:
+            data = self.rawStream.read(self.numBytesProbe - length)
+            assert isinstance(data, bytes)
+            if not data:
+                final = True
+                break
+            pieces.append(data)
+            length += len(data)
+        buffer = b"".join(pieces)
+        self.rawStream.seek(0)
+        if nonAsciiBytesRegexp.search(buffer) is None:
+            return self.defaultEncoding
+        # A character cut off by the end of the buffer doesn't count against
+        # it being UTF-8, unless the buffer is the end of the data
+        decoder = codecs.getincrementaldecoder("utf-8")("strict")
+        try:
+            decoder.decode(buffer, final)
+        except UnicodeDecodeError:
+            return None
+        return "utf-8"
+
     def detectEncodingMeta(self):
         """Report the encoding declared by the meta element
         """
         buffer = self.rawStream.read(self.numBytesMeta)
         assert isinstance(buffer, bytes)
-        parser = EncodingParser(buffer)
+        parser = FastEncodingParser(buffer)
         self.rawStream.seek(0)
         encoding = parser.getEncoding()
 
@@ -543,6 +1169,226 @@ class HTMLBinaryInputStream(HTMLUnicodeInputStream):
         return encoding
 
 
+class HTMLIncrementalInputStream(HTMLBinaryInputStream):
+    """Provides a unicode stream of characters to the HTMLTokenizer from data
+    passed in piece by piece with feed(), rather than read from a file-like
+    object.
+
+    The data may be either unicode or bytes, but not a mixture of the two.
+    Bytes are buffered until enough of them have arrived to detect the
+    encoding and are then decoded incrementally.
+
+    When the characters fed so far are used up before close() has been
+    called, reading raises NeedMoreDataException. Everything from the last
+    call to mark() onwards is kept so that the tokenizer can rewind() and
+    carry on from there once more data has been fed. charsUntil, matchChars
+    and charsUntilMatch instead return the part of a run there is so far,
+    so that a long run fed in many pieces is read once rather than again
+    from its start after each of them.
+
+    """
+
+    def __init__(self, encoding=None, parseMeta=True, chardet=True,
+                 encodingCache=None, cacheKey=None, numBytesProbe=4096,
+                 maxBytesChardet=None, **kwargs):
+        """Initialises the HTMLIncrementalInputStream.
+
+        The optional encoding parameter must be a string that indicates
+        the encoding.  If specified, that encoding will be used,
+        regardless of any BOM or later declaration (such as in a meta
+        element)
+
+        parseMeta - Look for a <meta> element containing encoding information
+
+        encodingCache, cacheKey, numBytesProbe, maxBytesChardet - As for
+        HTMLBinaryInputStream, except that only the bytes fed before the
+        encoding is detected can be looked at
+
+        Other keyword arguments accepted by HTMLBinaryInputStream, which
+        have no meaning here, are ignored.
+
+        """
+        self.parseMeta = parseMeta
+        self.chardet = chardet
+        self.encodingCache = encodingCache
+        self.cacheKey = cacheKey
+        self.numBytesProbe = numBytesProbe
+        self.maxBytesChardet = maxBytesChardet
+
+        # Bytes fed so far; kept while the encoding might still change so
+        # that they can be decoded again
+        self.rawBytes = []
+        self.decoder = None
+        self.isUnicode = None
+        self.closed = False
+        self.pendingText = []
+        self.markOffset = 0
+
+        HTMLUnicodeInputStream.__init__(self, None)
+
+        self.charEncoding = (codecName(encoding), "certain")
+
+        self.numBytesMeta = 512
+        self.numBytesChardet = 100
+        self.defaultEncoding = "windows-1252"
+
+    def openStream(self, source):
+        return None
+
+    def reset(self):
+        HTMLUnicodeInputStream.reset(self)
+        self.markOffset = 0
+        if self.decoder is not None:
+            self.pendingText = []
+            self.startDecoding()
+
+    def feed(self, data):
+        """Add data to the end of the stream"""
+        if self.closed:
+            raise ValueError("Cannot feed data to a closed stream")
+        if not data:
+            return
+
+        isUnicode = isinstance(data, text_type)
+        if self.isUnicode is None:
+            self.isUnicode = isUnicode
+            if isUnicode:
+                if self.charEncoding[0] is not None:
+                    raise TypeError("Cannot explicitly set an encoding with a unicode string")
+                self.charEncoding = ("utf-8", "certain")
+                self.rawBytes = None
+        elif isUnicode != self.isUnicode:
+            raise TypeError("Cannot mix unicode and bytes data")
+
+        if isUnicode:
+            self.pendingText.append(data)
+            return
+
+        if self.rawBytes is not None:
+            self.rawBytes.append(data)
+        if self.decoder is not None:
+            self.pendingText.append(self.decoder.decode(data))
+        elif sum([len(item) for item in self.rawBytes]) >= self.numBytesDetect():
+            self.startDecoding()
+
+    def numBytesDetect(self):
+        """Return the number of bytes detecting the encoding may look at, so
+        that it gives the same result as for the whole document at once"""
+        if self.charEncoding[0] is not None:
+            return 0
+        elif self.chardet:
+            return max(self.numBytesMeta, self.numBytesProbe)
+        return self.numBytesMeta
+
+    def close(self):
+        """Mark the end of the stream"""
+        if self.closed:
+            return
+        if self.isUnicode is False and self.decoder is None:
+            self.startDecoding()
+        if self.decoder is not None:
+            self.pendingText.append(self.decoder.decode(b"", True))
+        self.closed = True
+
+    def startDecoding(self):
+        data = b"".join(self.rawBytes)
+        skip = 0
+        if self.charEncoding[0] is None:
+            self.rawStream = BytesIO(data)
+            self.charEncoding = self.detectEncoding(self.parseMeta, self.chardet)
+            # detectEncoding leaves the stream after any BOM
+            skip = self.rawStream.tell()
+            self.rawStream = None
+        if self.charEncoding[1] == "certain":
+            self.rawBytes = None
+        else:
+            self.rawBytes = [data]
+        self.decoder = codecs.getincrementaldecoder(self.charEncoding[0])("replace")
+        self.pendingText.append(self.decoder.decode(data[skip:], self.closed))
+
+    def changeEncoding(self, newEncoding):
+        assert self.charEncoding[1] != "certain"
+        newEncoding = codecName(newEncoding)
+        if newEncoding in ("utf-16", "utf-16-be", "utf-16-le"):
+            newEncoding = "utf-8"
+        if newEncoding is None:
+            return
+        elif newEncoding == self.charEncoding[0]:
+            self.charEncoding = (self.charEncoding[0], "certain")
+            self.rawBytes = None
+        else:
+            oldEncoding = self.charEncoding[0]
+            self.charEncoding = (newEncoding, "certain")
+            self.updateEncodingCache(newEncoding)
+            # Only start again if what has been read so far comes out
+            # differently in the new encoding
+            data = b"".join(self.rawBytes)
+            oldText = codecs.getincrementaldecoder(oldEncoding)("replace").decode(data, self.closed)
+            newDecoder = codecs.getincrementaldecoder(newEncoding)("replace")
+            newText = newDecoder.decode(data, self.closed)
+            returned = len(oldText) - sum([len(item) for item in self.pendingText])
+            switch = switchPoint(oldText, newText, returned, self.unusedLength())
+            if switch is not None:
+                self.discardUnused(switch[1])
+                self.decoder = newDecoder
+                self.pendingText = [newText[switch[0]:]]
+                self.rawBytes = None
+                return
+            self.reset()
+            raise ReparseException("Encoding changed from %s to %s" % (oldEncoding, newEncoding))
+
+    def mark(self):
+        """Remember the current position so that rewind() can return to it"""
+        self.markOffset = self.chunkOffset
+
+    def rewind(self):
+        """Return to the position saved by the last call to mark()"""
+        self.chunkOffset = self.markOffset
+
+    def nearEnd(self, distance):
+        """Return whether fewer than distance of the characters fed so far
+        are left to read, while more may still be fed"""
+        return (self.chunkSize - self.chunkOffset < distance and
+                not self.pendingText and not self.closed)
+
+    def readMore(self):
+        # readChunk already keeps everything from the mark onwards
+        return self.readChunk()
+
+    def readChunk(self, chunkSize=None):
+        data = "".join(self.pendingText)
+        self.pendingText = []
+
+        # Deal with CR LF and surrogates broken across feeds
+        if self._bufferedCharacter:
+            data = self._bufferedCharacter + data
+            self._bufferedCharacter = None
+
+        if data and not self.closed:
+            lastv = ord(data[-1])
+            if lastv == 0x0D or 0xD800 <= lastv <= 0xDBFF:
+                self._bufferedCharacter = data[-1]
+                data = data[:-1]
+
+        if not data:
+            if self.closed:
+                return False
+            raise NeedMoreDataException
+
+        data = self.normalizeChunk(data, self.chunkStart + self.chunkSize)
+        self.indexNewLines(data, self.chunkStart + self.chunkSize)
+
+        # Keep everything from the mark onwards so that we can rewind to it
+        markOffset = self.markOffset
+        self.chunkStart += markOffset
+        self.chunk = self.chunk[markOffset:] + data
+        self.chunkSize = len(self.chunk)
+        self.chunkOffset -= markOffset
+        self.markOffset = 0
+
+        return True
+
+
 class EncodingBytes(bytes):
     """String-like object with an associated position and various extra methods
     If the position is ever greater than the string length then an exception is
@@ -866,6 +1712,190 @@ class ContentAttrParser(object):
             return None
 
 
+class FastEncodingParser(object):
+    """Mini parser for detecting character encoding from meta elements
+
+    Gives exactly the same results as EncodingParser, but finds the bytes it
+    is interested in with bytes.find and regular expressions instead of
+    stepping through the data one byte at a time. Running off the end of the
+    data stops the search in the same places EncodingParser stops it, which
+    is signalled with StopIteration here too."""
+
+    spacesRe = re.compile(b"[\t\n\x0c\r ]*")
+    spaceRe = re.compile(b"[\t\n\x0c\r ]")
+    spacesSlashRe = re.compile(b"[\t\n\x0c\r /]*")
+    spacesAngleBracketsRe = re.compile(b"[\t\n\x0c\r <>]")
+    attrNameRe = re.compile(b"[^\t\n\x0c\r /=>]*")
+
+    def __init__(self, data):
+        """string - the data to work on for encoding detection"""
+        assert isinstance(data, bytes)
+        self.data = data.lower()
+        self.encoding = None
+
+    def getEncoding(self):
+        data = self.data
+        position = 0
+        try:
+            while position is not None:
+                position = data.find(b"<", position)
+                if position == -1:
+                    break
+                if data.startswith(b"<!--", position):
+                    position = self.handleOther(position + 4, b"-->")
+                elif data.startswith(b"<meta", position):
+                    position = self.handleMeta(position + 5)
+                elif data.startswith(b"</", position):
+                    # EncodingParser looks at the byte after the first
+                    # letter of the tag name; match it
+                    position = self.handlePossibleTag(position + 3, True)
+                elif (data.startswith(b"<!", position) or
+                      data.startswith(b"<?", position)):
+                    position = self.handleOther(position + 2, b">")
+                else:
+                    position = self.handlePossibleTag(position + 1, False)
+        except StopIteration:
+            pass
+        return self.encoding
+
+    def handleOther(self, position, end):
+        """Return the position after the next occurrence of end"""
+        if position >= len(self.data):
+            raise StopIteration
+        position = self.data.find(end, position)
+        if position == -1:
+            raise StopIteration
+        return position + len(end)
+
+    def handleMeta(self, position):
+        """Return the position to carry on searching from, or None if the
+        encoding was found"""
+        data = self.data
+        if position >= len(data):
+            raise StopIteration
+        if data[position:position + 1] not in spaceCharactersBytes:
+            # EncodingParser skips the byte after <meta here
+            return position + 1
+        hasPragma = False
+        pendingEncoding = None
+        while True:
+            attr, position = self.getAttribute(position)
+            if attr is None:
+                return position + 1
+            name, value = attr
+            if name == b"http-equiv":
+                hasPragma = value == b"content-type"
+                if hasPragma and pendingEncoding is not None:
+                    self.encoding = pendingEncoding
+                    return None
+            elif name == b"charset":
+                codec = codecName(value)
+                if codec is not None:
+                    self.encoding = codec
+                    return None
+            elif name == b"content":
+                tentativeEncoding = self.parseContent(value)
+                if tentativeEncoding is not None:
+                    codec = codecName(tentativeEncoding)
+                    if codec is not None:
+                        if hasPragma:
+                            self.encoding = codec
+                            return None
+                        else:
+                            pendingEncoding = codec
+
+    def handlePossibleTag(self, position, endTag):
+        data = self.data
+        if position >= len(data):
+            raise StopIteration
+        if data[position:position + 1] not in asciiLettersBytes:
+            if endTag:
+                return self.handleOther(position - 1, b">")
+            return position + 1
+        match = self.spacesAngleBracketsRe.search(data, position)
+        if match is None:
+            raise StopIteration
+        position = match.start()
+        if data[position:position + 1] == b"<":
+            # Reprocess the < byte
+            return position
+        attr, position = self.getAttribute(position)
+        while attr is not None:
+            attr, position = self.getAttribute(position)
+        return position + 1
+
+    def getAttribute(self, position):
+        """Return a (name, value) pair for the attribute at position, or None
+        if there isn't one, along with the position of the last byte
+        looked at"""
+        data = self.data
+        length = len(data)
+        if position >= length:
+            raise StopIteration
+        position = self.spacesSlashRe.match(data, position).end()
+        if position == length:
+            return None, position
+        if data[position:position + 1] == b">":
+            return None, position
+        # The first byte belongs to the name even if it is "="
+        start = position
+        position = self.attrNameRe.match(data, position + 1).end()
+        if position == length:
+            raise StopIteration
+        name = data[start:position]
+        c = data[position:position + 1]
+        if c in (b"/", b">"):
+            return (name, b""), position
+        if c != b"=":
+            position = self.spacesRe.match(data, position).end()
+            if position == length:
+                raise StopIteration
+            if data[position:position + 1] != b"=":
+                return (name, b""), position - 1
+        position += 1
+        if position == length:
+            raise StopIteration
+        position = self.spacesRe.match(data, position).end()
+        if position == length:
+            return None, position
+        c = data[position:position + 1]
+        if c in (b"'", b'"'):
+            end = data.find(c, position + 1)
+            if end == -1 or end + 1 == length:
+                raise StopIteration
+            return (name, data[position + 1:end]), end + 1
+        elif c == b">":
+            return (name, b""), position
+        match = self.spacesAngleBracketsRe.search(data, position + 1)
+        if match is None:
+            raise StopIteration
+        return (name, data[position:match.start()]), match.start()
+
+    def parseContent(self, value):
+        """Return the charset given in the value of a content attribute, as
+        ContentAttrParser would"""
+        length = len(value)
+        position = value.find(b"charset")
+        if position == -1:
+            return None
+        position = self.spacesRe.match(value, position + 7).end()
+        if position >= length or value[position:position + 1] != b"=":
+            return None
+        position = self.spacesRe.match(value, position + 1).end()
+        if position >= length:
+            return None
+        c = value[position:position + 1]
+        if c in (b'"', b"'"):
+            end = value.find(c, position + 1)
+            if end == -1:
+                return None
+            return value[position + 1:end]
+        match = self.spaceRe.search(value, position)
+        if match is None:
+            return value[position:]
+        return value[position:match.start()]
+
+
 def codecName(encoding):
     """Return the python codec name corresponding to an encoding or None if the
     string doesn't correspond to a valid encoding."""
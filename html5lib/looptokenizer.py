@@ -0,0 +1,396 @@
+"""A tokenizer giving the same tokens as HTMLTokenizer, which runs the
+states most of a document is read in, the data state and the tag and
+attribute states, in a single loop.
+
+HTMLTokenizer takes a step by calling the bound method for the current
+state, which stores the method for the next one in self.state. Here those
+states are numbered, and the loop keeps the number of the current one,
+the token being built and the stream's methods in local variables. It
+leaves the loop, and stores the state in self.state, only when it has
+tokens for the parser, which may switch the state, or when it gets to a
+state of some other kind, which it takes a step in as HTMLTokenizer does.
+
+Use it by passing HTMLLoopTokenizer as the tokenizer argument of
+HTMLParser. Data fed to an HTMLIncrementalInputStream is tokenized by
+HTMLTokenizer's own steps, as tokenizing it has to be able to stop and
+start again at any point.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+from .constants import spaceCharacters, asciiLetters, asciiUpper2Lower, EOF
+from .tokenizer import HTMLTokenizer
+from .tokenizer import CharactersToken, SpaceCharactersToken
+from .tokenizer import StartTagToken, EndTagToken
+from .tokenizer import tagNameRun, attributeNameRun
+from .tokenizer import doubleQuotedValueRun, singleQuotedValueRun
+from .tokenizer import unquotedValueRun
+
+# The states run in the loop, numbered in the order the loop tests for them
+loopStates = [
+    "dataState",
+    "tagNameState",
+    "tagOpenState",
+    "closeTagOpenState",
+    "beforeAttributeNameState",
+    "attributeNameState",
+    "beforeAttributeValueState",
+    "attributeValueDoubleQuotedState",
+    "afterAttributeValueState",
+    "attributeValueUnQuotedState",
+    "attributeValueSingleQuotedState",
+    "afterAttributeNameState",
+    "selfClosingStartTagState",
+]
+
+(DATA, TAG_NAME, TAG_OPEN, CLOSE_TAG_OPEN, BEFORE_ATTRIBUTE_NAME,
+ ATTRIBUTE_NAME, BEFORE_ATTRIBUTE_VALUE, ATTRIBUTE_VALUE_DOUBLE_QUOTED,
+ AFTER_ATTRIBUTE_VALUE, ATTRIBUTE_VALUE_UNQUOTED,
+ ATTRIBUTE_VALUE_SINGLE_QUOTED, AFTER_ATTRIBUTE_NAME,
+ SELF_CLOSING_START_TAG) = range(len(loopStates))
+
+stateNumbers = dict([(name, number)
+                     for number, name in enumerate(loopStates)])
+
+
+class HTMLLoopTokenizer(HTMLTokenizer):
+    """HTMLTokenizer, with the data, tag and attribute states run in a
+    single loop"""
+
+    def stepBatches(self):
+        """Yield the tokens from each step of the state machine as a list,
+        as HTMLTokenizer.stepBatches does"""
+        stream = self.stream
+        char = stream.char
+        unget = stream.unget
+        charsUntil = stream.charsUntil
+        matchChars = stream.matchChars
+        errorsReached = stream.errorsReached
+        parseError = self.parseError
+        queue = self.tokenQueue = []
+        while True:
+            state = stateNumbers.get(self.state.__name__)
+            if state is None:
+                if not self.state():
+                    return
+            else:
+                token = self.currentToken
+                while True:
+                    data = char()
+                    if state == DATA:
+                        if data == "&":
+                            if stream.errors and errorsReached():
+                                # Give the errors before the entity's
+                                # tokens, as separate steps would
+                                self.state = self.entityDataState
+                                break
+                            self.consumeEntity()
+                        elif data == "<":
+                            state = TAG_OPEN
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            queue.append({"type": CharactersToken,
+                                          "data": "\u0000"})
+                        elif data is EOF:
+                            return
+                        elif data in spaceCharacters:
+                            queue.append({"type": SpaceCharactersToken,
+                                          "data": data +
+                                          charsUntil(spaceCharacters, True)})
+                        else:
+                            queue.append({"type": CharactersToken,
+                                          "data": data +
+                                          charsUntil(("&", "<", "\u0000"))})
+
+                    elif state == TAG_NAME:
+                        if data in spaceCharacters:
+                            state = BEFORE_ATTRIBUTE_NAME
+                        elif data == ">":
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data is EOF:
+                            parseError("eof-in-tag-name")
+                            state = DATA
+                        elif data == "/":
+                            state = SELF_CLOSING_START_TAG
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["name"] += "\uFFFD"
+                        else:
+                            token["name"] += data + matchChars(tagNameRun)
+
+                    elif state == TAG_OPEN:
+                        if data == "!":
+                            self.state = self.markupDeclarationOpenState
+                            break
+                        elif data == "/":
+                            state = CLOSE_TAG_OPEN
+                        elif data in asciiLetters:
+                            token = self.currentToken = {
+                                "type": StartTagToken,
+                                "name": data + matchChars(tagNameRun),
+                                "data": [],
+                                "selfClosing": False,
+                                "selfClosingAcknowledged": False}
+                            state = TAG_NAME
+                        elif data == ">":
+                            parseError("expected-tag-name-but-got-right-bracket")
+                            queue.append({"type": CharactersToken,
+                                          "data": "<>"})
+                            state = DATA
+                        elif data == "?":
+                            parseError("expected-tag-name-but-got-question-mark")
+                            unget(data)
+                            self.state = self.bogusCommentState
+                            break
+                        else:
+                            parseError("expected-tag-name")
+                            queue.append({"type": CharactersToken,
+                                          "data": "<"})
+                            unget(data)
+                            state = DATA
+
+                    elif state == CLOSE_TAG_OPEN:
+                        if data in asciiLetters:
+                            token = self.currentToken = {
+                                "type": EndTagToken,
+                                "name": data + matchChars(tagNameRun),
+                                "data": [], "selfClosing": False}
+                            state = TAG_NAME
+                        elif data == ">":
+                            parseError("expected-closing-tag-but-got-right-bracket")
+                            state = DATA
+                        elif data is EOF:
+                            parseError("expected-closing-tag-but-got-eof")
+                            queue.append({"type": CharactersToken,
+                                          "data": "</"})
+                            state = DATA
+                        else:
+                            parseError("expected-closing-tag-but-got-char",
+                                       {"data": data})
+                            unget(data)
+                            self.state = self.bogusCommentState
+                            break
+
+                    elif state == BEFORE_ATTRIBUTE_NAME:
+                        if data in spaceCharacters:
+                            charsUntil(spaceCharacters, True)
+                        elif data in asciiLetters:
+                            token["data"].append(
+                                [[data + matchChars(attributeNameRun)], []])
+                            state = ATTRIBUTE_NAME
+                        elif data == ">":
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data == "/":
+                            state = SELF_CLOSING_START_TAG
+                        elif data in ("'", '"', "=", "<"):
+                            parseError("invalid-character-in-attribute-name")
+                            token["data"].append([[data], []])
+                            state = ATTRIBUTE_NAME
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"].append([["\uFFFD"], []])
+                            state = ATTRIBUTE_NAME
+                        elif data is EOF:
+                            parseError("expected-attribute-name-but-got-eof")
+                            state = DATA
+                        else:
+                            token["data"].append(
+                                [[data + matchChars(attributeNameRun)], []])
+                            state = ATTRIBUTE_NAME
+
+                    elif state == ATTRIBUTE_NAME:
+                        if data in asciiLetters:
+                            token["data"][-1][0].append(
+                                data + matchChars(attributeNameRun))
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"][-1][0].append("\uFFFD")
+                        elif data in ("'", '"', "<"):
+                            parseError("invalid-character-in-attribute-name")
+                            token["data"][-1][0].append(data)
+                        elif (data == "=" or data == ">" or data == "/" or
+                              data in spaceCharacters or data is EOF):
+                            # Leaving the state, so the name is complete
+                            if data is EOF:
+                                parseError("eof-in-attribute-name")
+                            attributes = token["data"]
+                            name = "".join(attributes[-1][0])
+                            if self.lowercaseAttrName:
+                                name = name.translate(asciiUpper2Lower)
+                            attributes[-1][0] = name
+                            if len(attributes) == 1:
+                                self.attributeNames = set()
+                            if name in self.attributeNames:
+                                parseError("duplicate-attribute")
+                            else:
+                                self.attributeNames.add(name)
+                            if data == "=":
+                                state = BEFORE_ATTRIBUTE_VALUE
+                            elif data == ">":
+                                self.emitCurrentToken()
+                                state = DATA
+                            elif data == "/":
+                                state = SELF_CLOSING_START_TAG
+                            elif data is EOF:
+                                state = DATA
+                            else:
+                                state = AFTER_ATTRIBUTE_NAME
+                        else:
+                            token["data"][-1][0].append(
+                                data + matchChars(attributeNameRun))
+
+                    elif state == BEFORE_ATTRIBUTE_VALUE:
+                        if data in spaceCharacters:
+                            charsUntil(spaceCharacters, True)
+                        elif data == "\"":
+                            token["data"][-1][1].append(
+                                matchChars(doubleQuotedValueRun))
+                            state = ATTRIBUTE_VALUE_DOUBLE_QUOTED
+                        elif data == "&":
+                            state = ATTRIBUTE_VALUE_UNQUOTED
+                            unget(data)
+                        elif data == "'":
+                            token["data"][-1][1].append(
+                                matchChars(singleQuotedValueRun))
+                            state = ATTRIBUTE_VALUE_SINGLE_QUOTED
+                        elif data == ">":
+                            parseError("expected-attribute-value-but-got-right-bracket")
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"][-1][1].append("\uFFFD")
+                            state = ATTRIBUTE_VALUE_UNQUOTED
+                        elif data in ("=", "<", "`"):
+                            parseError("equals-in-unquoted-attribute-value")
+                            token["data"][-1][1].append(data)
+                            state = ATTRIBUTE_VALUE_UNQUOTED
+                        elif data is EOF:
+                            parseError("expected-attribute-value-but-got-eof")
+                            state = DATA
+                        else:
+                            token["data"][-1][1].append(
+                                data + matchChars(unquotedValueRun))
+                            state = ATTRIBUTE_VALUE_UNQUOTED
+
+                    elif state == ATTRIBUTE_VALUE_DOUBLE_QUOTED:
+                        if data == "\"":
+                            state = AFTER_ATTRIBUTE_VALUE
+                        elif data == "&":
+                            self.processEntityInAttribute('"')
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"][-1][1].append("\uFFFD")
+                        elif data is EOF:
+                            parseError("eof-in-attribute-value-double-quote")
+                            state = DATA
+                        else:
+                            token["data"][-1][1].append(
+                                data + matchChars(doubleQuotedValueRun))
+
+                    elif state == AFTER_ATTRIBUTE_VALUE:
+                        if data in spaceCharacters:
+                            state = BEFORE_ATTRIBUTE_NAME
+                        elif data == ">":
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data == "/":
+                            state = SELF_CLOSING_START_TAG
+                        elif data is EOF:
+                            parseError("unexpected-EOF-after-attribute-value")
+                            unget(data)
+                            state = DATA
+                        else:
+                            parseError("unexpected-character-after-attribute-value")
+                            unget(data)
+                            state = BEFORE_ATTRIBUTE_NAME
+
+                    elif state == ATTRIBUTE_VALUE_UNQUOTED:
+                        if data in spaceCharacters:
+                            state = BEFORE_ATTRIBUTE_NAME
+                        elif data == "&":
+                            self.processEntityInAttribute(">")
+                        elif data == ">":
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data in ('"', "'", "=", "<", "`"):
+                            parseError("unexpected-character-in-unquoted-attribute-value")
+                            token["data"][-1][1].append(data)
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"][-1][1].append("\uFFFD")
+                        elif data is EOF:
+                            parseError("eof-in-attribute-value-no-quotes")
+                            state = DATA
+                        else:
+                            token["data"][-1][1].append(
+                                data + matchChars(unquotedValueRun))
+
+                    elif state == ATTRIBUTE_VALUE_SINGLE_QUOTED:
+                        if data == "'":
+                            state = AFTER_ATTRIBUTE_VALUE
+                        elif data == "&":
+                            self.processEntityInAttribute("'")
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"][-1][1].append("\uFFFD")
+                        elif data is EOF:
+                            parseError("eof-in-attribute-value-single-quote")
+                            state = DATA
+                        else:
+                            token["data"][-1][1].append(
+                                data + matchChars(singleQuotedValueRun))
+
+                    elif state == AFTER_ATTRIBUTE_NAME:
+                        if data in spaceCharacters:
+                            charsUntil(spaceCharacters, True)
+                        elif data == "=":
+                            state = BEFORE_ATTRIBUTE_VALUE
+                        elif data == ">":
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data in asciiLetters:
+                            token["data"].append([[data], []])
+                            state = ATTRIBUTE_NAME
+                        elif data == "/":
+                            state = SELF_CLOSING_START_TAG
+                        elif data == "\u0000":
+                            parseError("invalid-codepoint")
+                            token["data"].append([["\uFFFD"], []])
+                            state = ATTRIBUTE_NAME
+                        elif data in ("'", '"', "<"):
+                            parseError("invalid-character-after-attribute-name")
+                            token["data"].append([[data], []])
+                            state = ATTRIBUTE_NAME
+                        elif data is EOF:
+                            parseError("expected-end-of-tag-but-got-eof")
+                            state = DATA
+                        else:
+                            token["data"].append([[data], []])
+                            state = ATTRIBUTE_NAME
+
+                    else:
+                        if data == ">":
+                            token["selfClosing"] = True
+                            self.emitCurrentToken()
+                            state = DATA
+                        elif data is EOF:
+                            parseError("unexpected-EOF-after-solidus-in-tag")
+                            unget(data)
+                            state = DATA
+                        else:
+                            parseError("unexpected-character-after-solidus-in-tag")
+                            unget(data)
+                            state = BEFORE_ATTRIBUTE_NAME
+
+                    if queue or stream.errors and errorsReached():
+                        self.state = getattr(self, loopStates[state])
+                        break
+
+            if stream.errors:
+                queue[:0] = self.streamErrorTokens()
+            if queue:
+                self.tokenQueue = []
+                yield queue
+                queue = self.tokenQueue
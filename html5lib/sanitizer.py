@@ -258,14 +258,17 @@ class HTMLSanitizerMixin(object):
 
 class HTMLSanitizer(HTMLTokenizer, HTMLSanitizerMixin):
     def __init__(self, stream, encoding=None, parseMeta=True, useChardet=True,
-                 lowercaseElementName=False, lowercaseAttrName=False, parser=None):
+                 lowercaseElementName=False, lowercaseAttrName=False, parser=None,
+                 **kwargs):
         # Change case matching defaults as we only output lowercase html anyway
         # This solution doesn't seem ideal...
         HTMLTokenizer.__init__(self, stream, encoding, parseMeta, useChardet,
-                               lowercaseElementName, lowercaseAttrName, parser=parser)
-
-    def __iter__(self):
-        for token in HTMLTokenizer.__iter__(self):
-            token = self.sanitize_token(token)
-            if token:
-                yield token
+                               lowercaseElementName, lowercaseAttrName, parser=parser,
+                               **kwargs)
+
+    def iterBatches(self, maxTokens=None):
+        for batch in HTMLTokenizer.iterBatches(self, maxTokens):
+            batch = [token for token in map(self.sanitize_token, batch)
+                     if token]
+            if batch:
+                yield batch
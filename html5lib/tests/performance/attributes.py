@@ -0,0 +1,34 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+from html5lib.tokenizer import HTMLTokenizer
+
+# Tokenize and parse markup like an application shell, where most of the
+# text is in tag names and long class and data-* attributes
+item = ('<div class="card card--elevated grid__item grid__item--span-4 '
+        'md:grid__item--span-6 is-interactive js-track-click" '
+        'data-component="ProductCard" data-testid="product-card-item" '
+        'data-props=\'{"id":1234,"sku":"AB-1234-XYZ","price":"19.99",'
+        '"currency":"EUR","tags":["new","sale","featured"]}\' '
+        'aria-labelledby=product-card-title-1234 tabindex=0>'
+        '<img class="card__image lazyload" data-src="/img/p/1234.jpg" '
+        'data-srcset="/img/p/1234@2x.jpg 2x" alt="Product">'
+        '<span class=card__title id=product-card-title-1234>Item</span>'
+        '</div>\n')
+text = "<!DOCTYPE html><body>" + item * 1000
+
+
+def tokenize():
+    for token in HTMLTokenizer(text):
+        pass
+
+
+def parse():
+    HTMLParser().parse(text)
+
+
+for function in (tokenize, parse):
+    r = timeit.repeat(function, repeat=5, number=1)
+    print("%-10s %.4fs" % (function.__name__, min(r)))
@@ -0,0 +1,33 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib.tokenizer import HTMLTokenizer
+
+
+def attributes(n):
+    return "<a " + " ".join(["a%d=%d" % (i, i) for i in range(n)]) + ">"
+
+
+# Tokenize single tags that grow without bound: a value made of many
+# character references, so that it is read in many pieces, a name full of
+# quotes, and a tag with many attributes. Each doubling of size should
+# about double the time taken; the time per item is printed to show it.
+cases = [
+    ("entities in a value", lambda n: '<a href="' + "x&amp;" * n + '">'),
+    ("quotes in a name", lambda n: "<a " + 'x"' * n + ">"),
+    ("attributes", attributes),
+]
+
+
+def tokenize(text):
+    for token in HTMLTokenizer(text):
+        pass
+
+
+for description, make in cases:
+    for n in (5000, 10000, 20000, 40000):
+        text = make(n)
+        r = min(timeit.repeat(lambda: tokenize(text), repeat=3, number=1))
+        print("%-20s %6d %.4fs %.2fus per item" %
+              (description, n, r, r / n * 1e6))
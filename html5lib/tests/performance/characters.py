@@ -0,0 +1,26 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+from html5lib.tokenizer import HTMLTokenizer
+
+# Tokenize and parse prose dense with character references, with and without
+# adjacent character tokens merged, and count the tokens each way
+paragraph = ("<p>Caf&eacute; &amp; cr&egrave;me br&ucirc;l&eacute;e &mdash; "
+             "&ldquo;na&iuml;ve&rdquo; r&eacute;sum&eacute;s, &lt;tags&gt; "
+             "&amp; 5&nbsp;&times;&nbsp;3&nbsp;&ge;&nbsp;15&hellip;</p>\n")
+text = "<!DOCTYPE html><body>" + paragraph * 2000
+
+for coalesceCharacters in (False, True):
+    count = len(list(HTMLTokenizer(text,
+                                   coalesceCharacters=coalesceCharacters)))
+    tokenize = min(timeit.repeat(
+        lambda: list(HTMLTokenizer(text,
+                                   coalesceCharacters=coalesceCharacters)),
+        repeat=5, number=1))
+    parse = min(timeit.repeat(
+        lambda: HTMLParser(coalesceCharacters=coalesceCharacters).parse(text),
+        repeat=5, number=1))
+    print("coalesceCharacters=%-5s %6d tokens tokenize %.4fs parse %.4fs" %
+          (coalesceCharacters, count, tokenize, parse))
@@ -0,0 +1,27 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+
+# Parse a small and a large document, as a string and as bytes, reading
+# the input in chunks of different sizes
+item = ("<div class=item><p>Some <b>text</b> and <a href='/x'>a link</a>"
+        "</p></div>\n")
+documents = [("small", item * 50, 100), ("large", item * 13000, 1)]
+settings = [{"chunkSize": size} for size in (1024, 4096, 10240, 65536, 262144)]
+settings.append({"adaptiveChunkSize": True})
+
+
+def parse(source, kwargs):
+    HTMLParser().parse(source, **kwargs)
+
+
+for name, text, number in documents:
+    for source in (text, text.encode("utf-8")):
+        for kwargs in settings:
+            r = timeit.repeat(lambda: parse(source, kwargs), repeat=5,
+                              number=number)
+            print("%s %-5s %-27s %.4fs" % (name, type(source).__name__,
+                                           sorted(kwargs.items())[0],
+                                           min(r) / number))
@@ -0,0 +1,30 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib.inputstream import EncodingParser, FastEncodingParser
+
+# The 512 bytes HTMLBinaryInputStream looks at: a typical head with the
+# charset declared late, and the same amount of data with no declaration
+# at all, which both parsers have to scan to the end
+head = b"".join([
+    b"<!DOCTYPE html>\n<html lang=en>\n<head>\n",
+    b"<!-- " + b"generated page " * 5 + b"-->\n",
+    b"<title>Benchmark</title>\n",
+    b"<link rel=stylesheet href='/static/site.css' type='text/css'>\n" * 3,
+    b"<script src=\"/static/site.js\"></script>\n",
+    b"<meta name=viewport content=\"width=device-width\">\n",
+    b"<meta http-equiv=Content-Type content=\"text/html; charset=utf-8\">\n"])
+noMeta = (b"<p class=x id=y>Some text <b>bold</b> and <a href=#>a link</a></p>\n"
+          * 10)[:512]
+
+documents = {"head": head[:512], "noMeta": noMeta}
+
+for name, data in sorted(documents.items()):
+    assert (EncodingParser(data).getEncoding() ==
+            FastEncodingParser(data).getEncoding())
+    for parser in ("EncodingParser", "FastEncodingParser"):
+        statement = "%s(documents[%r]).getEncoding()" % (parser, name)
+        t = timeit.Timer(statement, "from __main__ import documents, " + parser)
+        r = t.repeat(3, 1000)
+        print("%s %s %.3f" % (name, parser, min(r)))
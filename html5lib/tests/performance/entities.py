@@ -0,0 +1,33 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import tokenizer
+from html5lib.constants import entities
+from html5lib.tokenizer import HTMLTokenizer
+from html5lib.trie import trieBackends
+from html5lib.trie.calibration import timeBackends
+
+# Tokenize an escaped code listing, dense with named character references,
+# with the entities looked up in each trie backend, and time building each
+# trie from the entities and the lookups the backends are calibrated by
+line = ("if (a &lt; b &amp;&amp; c &gt;= d) { s = &quot;&eacute;t&eacute; "
+        "&copy 2014 &notit; &CounterClockwiseContourIntegral;&quot;; }\n")
+text = "<pre>" + line * 2000 + "</pre>"
+
+
+def tokenize():
+    for token in HTMLTokenizer(text):
+        pass
+
+
+original = tokenizer.entitiesTrie
+calibration = timeBackends()
+for name in sorted(trieBackends):
+    backend = trieBackends[name]
+    tokenizer.entitiesTrie = backend(entities)
+    build = min(timeit.repeat(lambda: backend(entities), repeat=5, number=1))
+    r = timeit.repeat(tokenize, repeat=5, number=1)
+    print("%-7s build %.4fs tokenize %.4fs calibration %.4fs" %
+          (name, build, min(r), calibration[name]))
+tokenizer.entitiesTrie = original
@@ -0,0 +1,26 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+
+# Parse documents of the same length with no parse errors and with a parse
+# errors on every line, read in the default chunk size and in one chunk
+clean = "<p class=x>Some text, <b>some bold</b> and <a href=#>a link</a>.</p>\n"
+errors = "<p class=x class=y>Some text, <b>some bold</b> &copy <a href=#>link</a>.</p>\n"
+documents = [("clean", clean * 2000), ("errors", errors * 2000)]
+settings = [{}, {"chunkSize": 1 << 20}]
+
+
+def parse(text, kwargs):
+    parser = HTMLParser()
+    parser.parse(text, **kwargs)
+    return parser.errors
+
+
+for name, text in documents:
+    for kwargs in settings:
+        count = len(parse(text, kwargs))
+        r = timeit.repeat(lambda: parse(text, kwargs), repeat=3, number=3)
+        print("%-6s %-20s %5d errors %.4fs" % (name, sorted(kwargs.items()),
+                                               count, min(r) / 3))
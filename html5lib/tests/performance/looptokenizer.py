@@ -0,0 +1,28 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+from html5lib.tokenizer import HTMLTokenizer
+from html5lib.looptokenizer import HTMLLoopTokenizer
+
+# Tokenize and parse markup made mostly of tags and attributes, and prose,
+# with each tokenizer, and give the throughput in characters a second
+row = ('<tr class="row odd" data-id=42><td align=left><a href="/items/42" '
+       'title=\'Item 42\'>Item</a></td><td><input type=checkbox checked '
+       'name=x42/></td><td>Some text &amp; more</td></tr>\n')
+paragraph = ("<p>It was the best of times, it was the worst of times, it was "
+             "the age of <em>wisdom</em>, the age of foolishness.</p>\n")
+texts = [("tags", "<!DOCTYPE html><table>" + row * 1000 + "</table>"),
+         ("prose", "<!DOCTYPE html><body>" + paragraph * 2000)]
+
+for name, text in texts:
+    for tokenizer in (HTMLTokenizer, HTMLLoopTokenizer):
+        tokenize = min(timeit.repeat(lambda: list(tokenizer(text)),
+                                     repeat=5, number=1))
+        parse = min(timeit.repeat(
+            lambda: HTMLParser(tokenizer=tokenizer).parse(text),
+            repeat=5, number=1))
+        print("%-5s %-17s tokenize %.4fs %7.0f chars/s parse %.4fs" %
+              (name, tokenizer.__name__, tokenize, len(text) / tokenize,
+               parse))
@@ -0,0 +1,44 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser, treewalkers
+from html5lib.serializer import HTMLSerializer
+from html5lib.tokenizer import HTMLTokenizer
+
+# Time each stage a document goes through on its way from text back to
+# text: tokenizing, building the tree (which includes tokenizing), walking
+# the tree and serializing the walked tokens
+item = ("<div class=item><p>Some <b>text</b> &amp; <a href='/x?a=1&b=2'>a "
+        "link</a><br><img src=x.png alt=''></p><!-- note --></div>\n")
+text = "<!DOCTYPE html><title>Benchmark</title>" + item * 2000
+walker = treewalkers.getTreeWalker("etree")
+tree = HTMLParser().parse(text)
+tokens = list(walker(tree))
+
+
+def tokenize():
+    for token in HTMLTokenizer(text):
+        pass
+
+
+def parse():
+    HTMLParser().parse(text)
+
+
+def walk():
+    for token in walker(tree):
+        pass
+
+
+def serialize():
+    HTMLSerializer().render(iter(tokens))
+
+
+def pipeline():
+    HTMLSerializer().render(walker(HTMLParser().parse(text)))
+
+
+for function in (tokenize, parse, walk, serialize, pipeline):
+    r = timeit.repeat(function, repeat=5, number=3)
+    print("%-10s %.4fs" % (function.__name__, min(r) / 3))
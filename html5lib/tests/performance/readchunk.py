@@ -0,0 +1,50 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import inputstream
+
+# Decode and normalise documents through HTMLBinaryInputStream.readChunk,
+# and normalise the same text the way readChunk used to: reporting errors,
+# replacing surrogates and the two newline replaces one after the other
+text = "<p class=x>Some text, <b>some bold</b> and <a href=#>a link</a>.</p>\n" * 16000
+documents = {
+    "lf": text.encode("utf-8"),
+    "crlf": text.replace("\n", "\r\n").encode("utf-8"),
+    "nonascii": text.replace("text", "t\u00e9xt").encode("utf-8"),
+    "invalid": text.replace("</p>", "\x01</p>").encode("utf-8"),
+}
+
+
+def readAll(data):
+    stream = inputstream.HTMLBinaryInputStream(data, encoding="utf-8")
+    while stream.readChunk():
+        pass
+
+
+def normalizeAll(chunks):
+    stream = inputstream.HTMLUnicodeInputStream("")
+    for chunk in chunks:
+        stream.normalizeChunk(chunk)
+
+
+def normalizeAllUnfused(chunks):
+    stream = inputstream.HTMLUnicodeInputStream("")
+    for data in chunks:
+        stream.reportCharacterErrors(data)
+        data = stream.replaceCharactersRegexp.sub("\ufffd", data)
+        data = data.replace("\r\n", "\n")
+        data = data.replace("\r", "\n")
+
+
+for name, data in sorted(documents.items()):
+    size = len(data) / 1e6
+    decoded = data.decode("utf-8")
+    chunkSize = inputstream.HTMLUnicodeInputStream._defaultChunkSize
+    chunks = [decoded[i:i + chunkSize]
+              for i in range(0, len(decoded), chunkSize)]
+    for function, argument in ((readAll, data), (normalizeAll, chunks),
+                               (normalizeAllUnfused, chunks)):
+        r = timeit.repeat(lambda: function(argument), repeat=3, number=5)
+        print("%-8s %-20s %7.1f MB/s" %
+              (name, function.__name__, size * 5 / min(r)))
@@ -0,0 +1,31 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import timeit
+
+from html5lib import HTMLParser
+
+# Parse a page shaped like much of the web by bytes: most of it inline
+# scripts, styles and JSON, with comparisons, markup in strings and the odd
+# comment, around a little markup
+script = ("!function(e,t){for(var n=0;n<e.length;n++){var r=e[n];if(r.a<t&&"
+          "r.b<=t.c){t.push('<div class=\"x'+n+'\">'+r.d+'</div>')}}}(w,d);"
+          "var s=document.createElement('script');s.src='/a.js';"
+          "document.write('<scr'+'ipt src=/b.js></scr'+'ipt>');\n")
+style = (".card>a:not(.x)~b{margin:0 auto;color:#333}"
+         "@media (max-width:600px){.card{display:none}}\n")
+state = ('{"items":[{"id":1,"html":"<b>bold<\\/b>","n":3}],'
+         '"a":"x<y","b":"\\u003c!-- not a comment --\\u003e"}\n')
+text = ("<!DOCTYPE html><html><head><title>Page &amp; title</title>" +
+        ("<style>" + style * 40 + "</style>" +
+         "<script>" + script * 40 + "</script>" +
+         "<script type=application/json>" + state * 40 + "</script>" +
+         "<!-- build " + "- " * 50 + "-->") * 20 +
+        "</head><body><textarea>a < b &lt; c</textarea></body></html>")
+
+
+def parse():
+    HTMLParser().parse(text)
+
+
+r = timeit.repeat(parse, repeat=5, number=1)
+print("%d characters %.4fs" % (len(text), min(r)))
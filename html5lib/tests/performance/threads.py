@@ -0,0 +1,45 @@
+from __future__ import absolute_import, division, unicode_literals
+
+import threading
+import timeit
+
+from html5lib import tokenizer
+from html5lib.constants import entities
+from html5lib.tokenizer import HTMLTokenizer
+from html5lib.trie import DAFSATrie, PyTrie
+
+# Tokenize entity-dense documents one after another and spread over
+# threads sharing each trie implementation as the entities trie, checking
+# that every thread gets the same tokens
+line = ("<p title='&eacute;t&eacute; &amp; &notin; &noti'>&lt;a&gt; "
+        "&copy 2014 &notit; &CounterClockwiseContourIntegral;</p>\n")
+text = line * 200
+documents = 16
+expected = list(HTMLTokenizer(text))
+
+
+def tokenize(count, failures):
+    for i in range(count):
+        if list(HTMLTokenizer(text)) != expected:
+            failures.append(i)
+
+
+def run(threadCount):
+    failures = []
+    threads = [threading.Thread(target=tokenize,
+                                args=(documents // threadCount, failures))
+               for i in range(threadCount)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not failures
+
+
+original = tokenizer.loadEntitiesTrie()
+for name, backend in [("PyTrie", PyTrie), ("DAFSATrie", DAFSATrie)]:
+    tokenizer.entitiesTrie = backend(entities)
+    for threadCount in (1, 2, 4, 8):
+        r = timeit.repeat(lambda: run(threadCount), repeat=3, number=1)
+        print("%-10s %d threads %.4fs" % (name, threadCount, min(r)))
+tokenizer.entitiesTrie = original
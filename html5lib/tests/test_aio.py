@@ -0,0 +1,84 @@
+from __future__ import absolute_import, division, unicode_literals
+
+from . import support  # flake8: noqa
+import unittest
+
+try:
+    import asyncio
+    from html5lib import aio
+except (ImportError, SyntaxError):
+    aio = None
+
+from html5lib import html5parser, treebuilders
+
+
+class ChunkReader(object):
+    """Minimal StreamReader lookalike returning data in small pieces"""
+    def __init__(self, data):
+        self.data = data
+
+    def read(self, n):
+        data, self.data = self.data[:min(n, 7)], self.data[min(n, 7):]
+        return asyncio.sleep(0, result=data)
+
+
+class ChunkIterator(object):
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        if not self.chunks:
+            raise StopAsyncIteration
+        return asyncio.sleep(0, result=self.chunks.pop(0))
+
+
+@unittest.skipIf(aio is None, "asyncio parsing needs Python 3.5")
+class AsyncParseTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_parse(self, source, **kwargs):
+        return self.loop.run_until_complete(
+            aio.parse(source, treebuilder="dom", **kwargs))
+
+    def expected(self, data):
+        return html5parser.parse(data, treebuilder="dom").toxml()
+
+    def test_reader(self):
+        data = b"<!doctype html><title>x</title><p class=a>\xc3\xa9<p>b</p>"
+        doc = self.run_parse(ChunkReader(data), encoding="utf-8")
+        self.assertEqual(doc.toxml(), self.expected(data.decode("utf-8")))
+
+    def test_iterator(self):
+        data = "<table><tr><td>a<td>b</table><!-- c -->"
+        chunks = [data[i:i + 5] for i in range(0, len(data), 5)]
+        doc = self.run_parse(ChunkIterator(chunks))
+        self.assertEqual(doc.toxml(), self.expected(data))
+
+    def test_yields_to_loop(self):
+        data = "<p>" + "<b>x</b>" * 500
+        ticks = []
+
+        def tick():
+            ticks.append(1)
+            if not task.done():
+                self.loop.call_soon(tick)
+
+        task = self.loop.create_task(
+            aio.parse(ChunkIterator([data]), tokensPerYield=10))
+        self.loop.call_soon(tick)
+        self.loop.run_until_complete(task)
+        self.assertTrue(len(ticks) > 50)
+        self.assertEqual(len(task.result().findall(".//{http://www.w3.org/1999/xhtml}b")), 500)
+
+    def test_parser_reuse(self):
+        parser = html5parser.HTMLParser(tree=treebuilders.getTreeBuilder("dom"))
+        for data in ("<p>a", "<ul><li>b</ul>"):
+            doc = self.loop.run_until_complete(aio.feed(parser, ChunkIterator([data])))
+            self.assertEqual(doc.toxml(), self.expected(data))
@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, unicode_literals
 
 import os
 import unittest
+from io import BytesIO
 
 try:
     unittest.TestCase.assertEqual
@@ -9,7 +10,7 @@ except AttributeError:
     unittest.TestCase.assertEqual = unittest.TestCase.assertEquals
 
 from .support import get_data_files, TestData, test_dir, errorMessage
-from html5lib import HTMLParser, inputstream
+from html5lib import HTMLParser, inputstream, treebuilders
 
 
 class Html5EncodingTestCase(unittest.TestCase):
@@ -26,6 +27,248 @@ class Html5EncodingTestCase(unittest.TestCase):
         self.assertEqual(inputstream.codecName("ISO_8859--1"), "windows-1252")
 
 
+class FastEncodingParserTest(unittest.TestCase):
+    # Each of these should give the same result from both parsers,
+    # including the places EncodingParser deviates from the spec
+    cases = [
+        (b'<meta charset="utf-8">', "utf-8"),
+        (b"<META CHARSET=ISO-8859-2>", "iso8859-2"),
+        (b'<meta http-equiv="Content-Type" content="text/html; charset=koi8-r">', "koi8-r"),
+        (b'<meta content="text/html; charset=koi8-r" http-equiv="Content-Type">', "koi8-r"),
+        (b'<meta content="text/html; charset=koi8-r">', None),
+        (b"<meta content='charset = \"big5\"' http-equiv=content-type>", "big5"),
+        (b"<meta content='charset=\"big5' http-equiv=content-type>", None),
+        (b'<!-- <meta charset="utf-8"> --><meta charset=koi8-r>', "koi8-r"),
+        (b'<!--> <meta charset="utf-8"> -->', None),
+        (b'<!--', None),
+        (b'<? <meta charset=utf-8> ?><meta charset=koi8-r>', "koi8-r"),
+        (b'<?php ?><meta charset=koi8-r>', "koi8-r"),
+        (b'<a title=">" charset=utf-8><meta charset=koi8-r>', "koi8-r"),
+        (b'<a<meta charset=utf-8>', "utf-8"),
+        (b'<<meta charset=utf-8>', None),
+        (b'<meta<meta charset=utf-8>', None),
+        (b'</a <meta charset=utf-8>', None),
+        (b'</ab <meta charset=utf-8>', None),
+        (b'<meta/charset=utf-8>', None),
+        (b'<meta =charset=utf-8 charset=koi8-r>', "koi8-r"),
+        (b'<meta charset = utf-8 >', "utf-8"),
+        (b'<meta charset=bogus charset=koi8-r>', "koi8-r"),
+        (b'<meta charset="utf-8"', None),
+        (b'<meta charset=utf-8', None),
+        (b'<meta charset=', None),
+    ]
+
+    def test_same_results(self):
+        for data, expected in self.cases:
+            for parser in (inputstream.EncodingParser,
+                           inputstream.FastEncodingParser):
+                self.assertEqual(parser(data).getEncoding(), expected,
+                                 (parser, data))
+
+    def test_truncated(self):
+        for data, expected in self.cases:
+            for i in range(len(data)):
+                self.assertEqual(
+                    inputstream.FastEncodingParser(data[:i]).getEncoding(),
+                    inputstream.EncodingParser(data[:i]).getEncoding())
+
+
+class UnseekableStream(object):
+    def __init__(self, data):
+        self.stream = BytesIO(data)
+
+    def read(self, size=-1):
+        return self.stream.read(size)
+
+
+class ShortReadStream(UnseekableStream):
+    """Returns at most readSize bytes per read, as sockets and pipes may"""
+    def __init__(self, data, readSize):
+        UnseekableStream.__init__(self, data)
+        self.readSize = readSize
+
+    def read(self, size=-1):
+        if size < 0 or size > self.readSize:
+            size = self.readSize
+        return self.stream.read(size)
+
+
+class LateEncodingChangeTest(unittest.TestCase):
+    # Beyond the bytes looked at by the prescan
+    padding = b"<!--" + b"x" * 600 + b"-->"
+
+    def parse(self, data, feed=False, **kwargs):
+        p = HTMLParser(tree=treebuilders.getTreeBuilder("etree"),
+                       namespaceHTMLElements=False)
+        if feed:
+            p.begin(useChardet=False)
+            for i in range(0, len(data), 100):
+                p.feed(data[i:i + 100])
+            doc = p.close()
+        else:
+            doc = p.parse(data, useChardet=False, **kwargs)
+        self.assertEqual(p.tokenizer.stream.charEncoding, ("utf-8", "certain"))
+        return p, doc
+
+    def test_switch_in_place(self):
+        data = (b"<title>a\r\nb</title>" + self.padding +
+                b"<meta charset=utf-8>\r\n<p>\xc3\xa9</p>")
+        for source in (data, BytesIO(data)):
+            p, doc = self.parse(source)
+            self.assertEqual(p.reparseCount, 0)
+            self.assertEqual(doc.find("html/body/p").text, "\u00e9")
+            self.assertEqual(doc.find("html/head/title").text, "a\nb")
+
+    def test_switch_in_place_feed(self):
+        data = b"<title>a</title>" + self.padding + b"<meta charset=utf-8><p>\xc3\xa9</p>"
+        p, doc = self.parse(data, feed=True)
+        self.assertEqual(p.reparseCount, 0)
+        self.assertEqual(doc.find("html/body/p").text, "\u00e9")
+
+    def test_switch_in_place_bounded(self):
+        # The bytes before the meta have been read and discarded, and the
+        # text after it decoded in the old encoding, by the time it is seen
+        for length in (5000, 200000):
+            data = (b"<title>a</title><!--" + b"x" * length +
+                    b"--><meta charset=utf-8>\r\n<p>\xc3\xa9</p>")
+            p, doc = self.parse(UnseekableStream(data), boundedBuffer=True)
+            self.assertEqual(p.reparseCount, 0)
+            self.assertEqual(doc.find("html/body/p").text, "\u00e9")
+
+    def test_switch_bounded_large_chunks(self):
+        # The characters read but not yet used can be more than the bytes
+        # kept otherwise
+        data = (b"<!--" + b"x" * 6000 + b"--><meta charset=utf-8><p>\xc3\xa9" +
+                b"y" * 1200000)
+        p, doc = self.parse(UnseekableStream(data), boundedBuffer=True,
+                            chunkSize=10 ** 6)
+        self.assertEqual(p.reparseCount, 0)
+        self.assertEqual(doc.find("html/body/p").text[:2], "\u00e9y")
+
+    def test_switch_bounded_too_late(self):
+        # If the text can't be decoded again the old encoding is kept, as
+        # the start of the document can't be read again to reparse it
+        data = (b"<!--" + b"x" * 6000 + b"--><meta charset=utf-8><p>\xc3\xa9" +
+                b"y" * 400000)
+        changeEncoding = inputstream.StreamDecoder.changeEncoding
+        inputstream.StreamDecoder.changeEncoding = lambda *args: None
+        try:
+            p = HTMLParser(namespaceHTMLElements=False)
+            doc = p.parse(UnseekableStream(data), useChardet=False,
+                          boundedBuffer=True)
+        finally:
+            inputstream.StreamDecoder.changeEncoding = changeEncoding
+        self.assertEqual(p.reparseCount, 0)
+        self.assertEqual(p.tokenizer.stream.charEncoding,
+                         ("windows-1252", "certain"))
+        self.assertEqual(doc.find("html/body/p").text[:3], "\u00c3\u00a9y")
+
+    def test_switch_bounded_used_text(self):
+        # The title can't be decoded again, but what comes after the meta is
+        data = (b"<title>\xc3\xa9</title>" + self.padding * 10 +
+                b"<meta charset=utf-8><p>\xc3\xa9</p>")
+        p, doc = self.parse(UnseekableStream(data), boundedBuffer=True)
+        self.assertEqual(p.reparseCount, 0)
+        self.assertEqual(doc.find("html/head/title").text, "\u00c3\u00a9")
+        self.assertEqual(doc.find("html/body/p").text, "\u00e9")
+
+    def test_reparse(self):
+        data = b"<title>\xc3\xa9</title>" + self.padding + b"<meta charset=utf-8><p>\xc3\xa9</p>"
+        for feed in (False, True):
+            p, doc = self.parse(data, feed)
+            self.assertEqual(p.reparseCount, 1)
+            self.assertEqual(doc.find("html/head/title").text, "\u00e9")
+            self.assertEqual(doc.find("html/body/p").text, "\u00e9")
+
+
+class EncodingCacheTest(unittest.TestCase):
+    def test_lru(self):
+        cache = inputstream.EncodingCache(2)
+        cache["a"] = ("utf-8", "tentative")
+        cache["b"] = ("koi8-r", "tentative")
+        self.assertEqual(cache.get("a"), ("utf-8", "tentative"))
+        cache["c"] = ("big5", "tentative")
+        self.assertEqual(len(cache), 2)
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertEqual(cache.get("b"), None)
+        self.assertRaises(KeyError, lambda: cache["b"])
+
+    def test_prefix_key(self):
+        cache = inputstream.EncodingCache()
+        data = b"<meta charset=koi8-r><p>x"
+        stream = inputstream.HTMLBinaryInputStream(data, encodingCache=cache)
+        self.assertEqual(stream.charEncoding, ("koi8-r", "tentative"))
+        self.assertEqual(len(cache), 1)
+        # Detection isn't repeated for the same start of document
+        cache[stream.cacheKey] = ("iso8859-2", "tentative")
+        stream = inputstream.HTMLBinaryInputStream(data, encodingCache=cache)
+        self.assertEqual(stream.charEncoding, ("iso8859-2", "tentative"))
+        stream = inputstream.HTMLBinaryInputStream(data + b"y", encodingCache=cache)
+        self.assertEqual(stream.charEncoding, ("koi8-r", "tentative"))
+
+    def test_cache_key(self):
+        cache = {"example.com": ("koi8-r", "tentative")}
+        for feed in (False, True):
+            p = HTMLParser()
+            if feed:
+                p.begin(encodingCache=cache, cacheKey="example.com")
+                p.feed(b"<p>x")
+                p.close()
+            else:
+                p.parse(b"<p>x", encodingCache=cache, cacheKey="example.com")
+            self.assertEqual(p.tokenizer.stream.charEncoding,
+                             ("koi8-r", "tentative"))
+
+    def test_bom(self):
+        cache = {"example.com": ("koi8-r", "tentative")}
+        stream = inputstream.HTMLBinaryInputStream(
+            b"\xef\xbb\xbf<p>x", encodingCache=cache, cacheKey="example.com")
+        self.assertEqual(stream.charEncoding, ("utf-8", "certain"))
+
+    def test_late_meta(self):
+        cache = {}
+        data = (b"<p>x</p>" + LateEncodingChangeTest.padding +
+                b"<meta charset=koi8-r>")
+        p = HTMLParser()
+        p.parse(data, useChardet=False, encodingCache=cache, cacheKey="a")
+        self.assertEqual(cache["a"], ("koi8-r", "tentative"))
+
+
+class EncodingProbeTest(unittest.TestCase):
+    def probe(self, data, numBytesProbe=4096):
+        stream = inputstream.HTMLBinaryInputStream(data, chardet=False,
+                                                   numBytesProbe=numBytesProbe)
+        return stream.detectEncodingProbe()
+
+    def test_ascii(self):
+        self.assertEqual(self.probe(b"<p>x"), "windows-1252")
+        self.assertEqual(self.probe(b"<p>x" * 10 + b"\xe9", 40), "windows-1252")
+
+    def test_utf8(self):
+        self.assertEqual(self.probe(b"<p>\xc3\xa9"), "utf-8")
+        # Cut off by the end of the bytes looked at
+        self.assertEqual(self.probe(b"<p>\xc3\xa9", 4), "utf-8")
+
+    def test_not_utf8(self):
+        self.assertEqual(self.probe(b"<p>\xe9"), None)
+        self.assertEqual(self.probe(b"<p>\xe9x"), None)
+
+    def test_short_reads(self):
+        # The same bytes give the same answer however they are read
+        for data in (b"<p>" + b"x" * 2000 + "\u2018".encode("utf-8"),
+                     b"<p>\xc3\xa9"):
+            for readSize in (1, 4, 1000):
+                self.assertEqual(self.probe(ShortReadStream(data, readSize)),
+                                 "utf-8")
+        self.assertEqual(self.probe(ShortReadStream(b"<p>\xc3", 2)), None)
+
+    def test_detect(self):
+        stream = inputstream.HTMLBinaryInputStream(b"<p>\xc3\xa9")
+        self.assertEqual(stream.charEncoding, ("utf-8", "tentative"))
+        self.assertEqual(stream.charsUntil("\x00"), "<p>\u00e9")
+
+
 def runParserEncodingTest(data, encoding):
     p = HTMLParser()
     p.parse(data, useChardet=False)
@@ -45,12 +288,19 @@ def runPreScanEncodingTest(data, encoding):
     assert encoding == stream.charEncoding[0], errorMessage(data, encoding, stream.charEncoding[0])
 
 
+def runFastPreScanTest(data):
+    expected = inputstream.EncodingParser(data).getEncoding()
+    encoding = inputstream.FastEncodingParser(data).getEncoding()
+    assert encoding == expected, errorMessage(data, expected, encoding)
+
+
 def test_encoding():
     for filename in get_data_files("encoding"):
         tests = TestData(filename, b"data", encoding=None)
         for idx, test in enumerate(tests):
             yield (runParserEncodingTest, test[b'data'], test[b'encoding'])
             yield (runPreScanEncodingTest, test[b'data'], test[b'encoding'])
+            yield (runFastPreScanTest, test[b'data'])
 
 try:
     try:
@@ -64,3 +314,16 @@ else:
         with open(os.path.join(test_dir, "encoding" , "chardet", "test_big5.txt"), "rb") as fp:
             encoding = inputstream.HTMLInputStream(fp.read()).charEncoding
             assert encoding[0].lower() == "big5"
+
+    def test_chardet_limit():
+        class CountingStream(UnseekableStream):
+            bytesRead = 0
+
+            def read(self, size=-1):
+                data = UnseekableStream.read(self, size)
+                self.bytesRead += len(data)
+                return data
+
+        source = CountingStream(b"<p>\xe9" * 1000)
+        inputstream.HTMLInputStream(source, numBytesProbe=0, maxBytesChardet=1000)
+        assert source.bytesRead <= 1000, source.bytesRead
@@ -4,7 +4,8 @@ import io
 
 from . import support  # flake8: noqa
 from html5lib import html5parser
-from html5lib.constants import namespaces
+from html5lib.constants import namespaces, tokenTypes
+from html5lib.tokenizer import HTMLTokenizer
 from html5lib import treebuilders
 
 import unittest
@@ -27,6 +28,183 @@ class MoreParserTests(unittest.TestCase):
         parser = html5parser.HTMLParser(tree=self.dom_tree)
         parser.parse("<pre>\nx\n&gt;\n</pre>")
 
+    def test_error_positions(self):
+        data = "<p>\n<p>a</b>\n\n  <x>\n</p></p>"
+        expected = [((1, 3), "expected-doctype-but-got-start-tag"),
+                    ((2, 8), "unexpected-end-tag"),
+                    ((5, 4), "unexpected-end-tag"),
+                    ((5, 8), "unexpected-end-tag")]
+        parser = html5parser.HTMLParser()
+        parser.parse(data)
+        self.assertEqual([error[:2] for error in parser.errors], expected)
+        self.assertTrue(parser.errors is parser.errors)
+        for size in (1, 4):
+            parser = html5parser.HTMLParser()
+            for i in range(0, len(data), size):
+                parser.feed(data[i:i + size])
+            parser.close()
+            self.assertEqual([error[:2] for error in parser.errors], expected)
+
+    def test_stream_error_positions(self):
+        # Invalid characters are reported where they are, however far ahead
+        # of the tokenizer the stream has read
+        for data, expected in (("<p>ab\x01c\n\x0bd", [(1, 6), (2, 1)]),
+                               ("<title>" + "x" * 30 + "\x01</title>\x01",
+                                [(1, 38), (1, 47)])):
+            for chunkSize in (None, 4):
+                parser = html5parser.HTMLParser()
+                parser.parse(data, chunkSize=chunkSize)
+                self.assertEqual([error[0] for error in parser.errors
+                                  if error[1] == "invalid-codepoint"],
+                                 expected)
+            parser = html5parser.HTMLParser()
+            for c in data:
+                parser.feed(c)
+            parser.close()
+            self.assertEqual([error[0] for error in parser.errors
+                              if error[1] == "invalid-codepoint"], expected)
+
+    def test_error_order(self):
+        # Errors the input stream finds ahead of the tokenizer are given in
+        # order with the rest
+        for data in ("&<textarea><P\x01<A B=C>\r\nx\r\x01y</textarea>",
+                     "<p>a\x01b<b c=\x01d>\x0b</i>"):
+            for coalesceCharacters in (True, False):
+                for chunkSize in (None, 4):
+                    parser = html5parser.HTMLParser(
+                        coalesceCharacters=coalesceCharacters)
+                    parser.parse(data, chunkSize=chunkSize)
+                    positions = [error[0] for error in parser.errors]
+                    self.assertEqual(positions, sorted(positions))
+                parser = html5parser.HTMLParser(
+                    coalesceCharacters=coalesceCharacters)
+                for c in data:
+                    parser.feed(c)
+                parser.close()
+                positions = [error[0] for error in parser.errors]
+                self.assertEqual(positions, sorted(positions))
+
+    def test_collect_errors(self):
+        data = "<p a=1 a=2>&copy </b><x></p></p>"
+        parser = html5parser.HTMLParser()
+        expected = parser.tree.testSerializer(parser.parse(data))
+        errors = parser.errors
+        self.assertEqual(len(errors), 6)
+        parser = html5parser.HTMLParser(collectErrors=False)
+        self.assertEqual(parser.tree.testSerializer(parser.parse(data)),
+                         expected)
+        self.assertEqual(parser.errors, [])
+        tokenizer = HTMLTokenizer(data + "\x01", collectErrors=False)
+        self.assertEqual([token for token in tokenizer
+                          if token["type"] == tokenTypes["ParseError"]], [])
+        for maxErrors in (0, 1, 4, 10):
+            parser = html5parser.HTMLParser(maxErrors=maxErrors)
+            parser.parse(data)
+            self.assertEqual(parser.errors, errors[:maxErrors])
+            parser = html5parser.HTMLParser(maxErrors=maxErrors)
+            for c in data:
+                parser.feed(c)
+            parser.close()
+            self.assertEqual([error[1] for error in parser.errors],
+                             [error[1] for error in errors[:maxErrors]])
+        tokenizer = HTMLTokenizer(data, maxErrors=2)
+        self.assertEqual(len([token for token in tokenizer
+                              if token["type"] == tokenTypes["ParseError"]]), 2)
+
+    def test_newline_index(self):
+        data = "<p>\n\n</b>\n\n</i>\n" * 3
+        parser = html5parser.HTMLParser(collectErrors=False)
+        parser.parse(data)
+        self.assertEqual(len(parser.tokenizer.stream.newLines), 0)
+        # Lines after the last error recorded aren't indexed
+        parser = html5parser.HTMLParser(maxErrors=2)
+        parser.parse(data, chunkSize=4)
+        self.assertEqual([error[0] for error in parser.errors],
+                         [(1, 3), (3, 4)])
+        self.assertTrue(len(parser.tokenizer.stream.newLines) < 5)
+
+    def test_token_batches(self):
+        data = "<!DOCTYPE html><p a=1 a=2>x &amp; y<!--c--></p>\x01</b>"
+        tokens = list(HTMLTokenizer(data))
+        batches = list(HTMLTokenizer(data).iterBatches())
+        self.assertTrue(all(batches))
+        self.assertEqual([token for batch in batches for token in batch],
+                         tokens)
+        batches = list(HTMLTokenizer(data).iterBatches(1))
+        self.assertEqual(batches, [[token] for token in tokens])
+
+    def test_coalesce_characters(self):
+        Characters = tokenTypes["Characters"]
+        SpaceCharacters = tokenTypes["SpaceCharacters"]
+        ParseError = tokenTypes["ParseError"]
+        data = "a &amp; b&copy c\x00d<p> &#10;x &lt;"
+        tokens = list(HTMLTokenizer(data, coalesceCharacters=True))
+        self.assertEqual([(token["type"], token["data"]) for token in tokens
+                          if token["type"] != tokenTypes["StartTag"]],
+                         [(Characters, "a & b"),
+                          (ParseError, "named-entity-without-semicolon"),
+                          (Characters, "\xa9 c"),
+                          (ParseError, "invalid-codepoint"),
+                          (Characters, "\x00"),
+                          (Characters, "d"),
+                          (SpaceCharacters, " \n"),
+                          (Characters, "x <")])
+        for data in ("<frameset> a &amp; b </frameset>", "<pre>&#10;\nx",
+                     "<table> a &amp; <td>&#0;b\x00</table><p>\x00"):
+            trees = []
+            for coalesceCharacters in (False, True):
+                parser = html5parser.HTMLParser(
+                    coalesceCharacters=coalesceCharacters)
+                trees.append(parser.tree.testSerializer(parser.parse(data)))
+            self.assertEqual(trees[0], trees[1])
+            errors = [error[1] for error in parser.errors]
+            parser = html5parser.HTMLParser()
+            for c in data:
+                parser.feed(c)
+            self.assertEqual(parser.tree.testSerializer(parser.close()),
+                             trees[1])
+            self.assertEqual([error[1] for error in parser.errors], errors)
+
+    def test_coalesce_characters_errors(self):
+        # Errors about a run of text are reported where it starts, and in
+        # the order of the tokens
+        for data in ("-</xmp>", "a&amp;b<p>c&copy d</b>\x01e</p>",
+                     "<table>a&amp;b<tr>"):
+            errors = []
+            for coalesceCharacters in (False, True):
+                parser = html5parser.HTMLParser(
+                    coalesceCharacters=coalesceCharacters)
+                parser.parse(data)
+                errors.append(parser.errors)
+            self.assertEqual(errors[0], errors[1])
+        parser = html5parser.HTMLParser()
+        parser.parse("-</xmp>")
+        self.assertEqual([error[:2] for error in parser.errors],
+                         [((1, 1), "expected-doctype-but-got-chars"),
+                          ((1, 7), "unexpected-end-tag")])
+        # Invalid characters the input stream finds end a run too, and the
+        # text is handled the same however it is fed
+        data = "<frameset>ab\x0bcd</frameset>"
+        parser = html5parser.HTMLParser()
+        parser.parse(data)
+        errors = parser.errors
+        parser = html5parser.HTMLParser()
+        for c in data:
+            parser.feed(c)
+        parser.close()
+        self.assertEqual(parser.errors, errors)
+
+    def test_tokenizer_iter_override(self):
+        class NoComments(HTMLTokenizer):
+            def __iter__(self):
+                for token in HTMLTokenizer.__iter__(self):
+                    if token["type"] != tokenTypes["Comment"]:
+                        yield token
+        parser = html5parser.HTMLParser(tokenizer=NoComments)
+        document = parser.parse("<p>a<!--b-->c")
+        self.assertEqual(parser.tree.testSerializer(document),
+                         parser.tree.testSerializer(parser.parse("<p>ac")))
+
     def test_namespace_html_elements_0_dom(self):
         parser = html5parser.HTMLParser(tree=self.dom_tree, namespaceHTMLElements=True)
         doc = parser.parse("<html></html>")
@@ -51,6 +229,90 @@ class MoreParserTests(unittest.TestCase):
         parser = html5parser.HTMLParser()
         parser.parse(io.StringIO("a"))
 
+    def test_feed_matches_parse(self):
+        data = ("<!DOCTYPE html><title>a &amp; b</title><p class=x>one\r\ntwo "
+                "&notin; <!-- c --> <script>if (a < b) {}</script><table>x<tr>"
+                "<td>y</table><frameset> a </frameset>")
+        parser = html5parser.HTMLParser()
+        expected = parser.tree.testSerializer(parser.parse(data))
+        for size in (1, 2, 3, 7, 64):
+            parser = html5parser.HTMLParser()
+            for i in range(0, len(data), size):
+                parser.feed(data[i:i + size])
+            doc = parser.close()
+            self.assertEqual(parser.tree.testSerializer(doc), expected)
+
+    def test_feed_bytes(self):
+        parser = html5parser.HTMLParser(namespaceHTMLElements=False)
+        data = "<meta charset=utf-8><p>\u2603".encode("utf-8")
+        for byte in range(len(data)):
+            parser.feed(data[byte:byte + 1])
+        doc = parser.close()
+        self.assertEqual(parser.tokenizer.stream.charEncoding,
+                         ("utf-8", "certain"))
+        self.assertEqual(doc.find("html/body/p").text, "\u2603")
+
+    def test_feed_reparse(self):
+        parser = html5parser.HTMLParser(namespaceHTMLElements=False)
+        parser.begin(useChardet=False)
+        parser.feed(b"<!--" + b"x" * 600 + b"-->")
+        parser.feed(b"<meta charset=utf-8><p>")
+        parser.feed("\u2603".encode("utf-8"))
+        doc = parser.close()
+        self.assertEqual(parser.tokenizer.stream.charEncoding,
+                         ("utf-8", "certain"))
+        self.assertEqual(doc.find("html/body/p").text, "\u2603")
+
+    def test_feed_long_runs(self):
+        # Feeding a long run of text, a comment or an attribute value in
+        # pieces reads each piece about once, not the whole run again each
+        # time
+        for data in ("<p>" + "x" * 20000, "<script>" + "x" * 20000,
+                     "<!--" + "x" * 20000 + "-->",
+                     "<a title='" + "x" * 20000 + "'>", "<?" + "x" * 20000):
+            parser = html5parser.HTMLParser()
+            parser.begin()
+            stream = parser.tokenizer.stream
+            chunkSizes = []
+            readChunk = stream.readChunk
+
+            def countingReadChunk(chunkSize=None):
+                more = readChunk(chunkSize)
+                chunkSizes.append(stream.chunkSize)
+                return more
+            stream.readChunk = countingReadChunk
+            for i in range(0, len(data), 100):
+                parser.feed(data[i:i + 100])
+            parser.close()
+            self.assertTrue(sum(chunkSizes) < 2 * len(data))
+
+    def test_feed_error_positions(self):
+        for data in ("<?x>", "<p>a<b c=d e>f</p  x>",
+                     "abc><img src=x /></SCRIPT></b>",
+                     "<table>ab  c&amp;d <td><title>x&y</title>\x00 z"):
+            for coalesceCharacters in (True, False):
+                parser = html5parser.HTMLParser(
+                    coalesceCharacters=coalesceCharacters)
+                parser.parse(data)
+                expected = parser.errors
+                for size in (1, 2, 3):
+                    parser = html5parser.HTMLParser(
+                        coalesceCharacters=coalesceCharacters)
+                    for i in range(0, len(data), size):
+                        parser.feed(data[i:i + size])
+                    parser.close()
+                    self.assertEqual(parser.errors, expected)
+
+    def test_feed_builds_tree_incrementally(self):
+        parser = html5parser.HTMLParser(namespaceHTMLElements=False)
+        parser.feed("<ul><li>a<li>b")
+        ul = parser.tree.openElements[-2]._element
+        self.assertEqual([li.text for li in ul], ["a", None])
+        parser.feed("<li>c</ul>")
+        doc = parser.close()
+        self.assertEqual([li.text for li in doc.find("html/body/ul")],
+                         ["a", "b", "c"])
+
 
 def buildTestSuite():
     return unittest.defaultTestLoader.loadTestsFromName(__name__)
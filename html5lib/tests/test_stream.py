@@ -3,10 +3,15 @@ from __future__ import absolute_import, division, unicode_literals
 from . import support  # flake8: noqa
 import unittest
 import codecs
+import mmap
+import re
+import tempfile
 from io import BytesIO
 
-from html5lib.inputstream import (BufferedStream, HTMLInputStream,
-                                  HTMLUnicodeInputStream, HTMLBinaryInputStream)
+from html5lib.constants import EOF, NeedMoreDataException
+from html5lib.inputstream import (BufferedStream, BufferDecoder, HTMLInputStream,
+                                  HTMLUnicodeInputStream, HTMLBinaryInputStream,
+                                  HTMLIncrementalInputStream)
 
 class BufferedStreamTest(unittest.TestCase):
     def test_basic(self):
@@ -69,6 +74,23 @@ class BufferedStreamTest(unittest.TestCase):
         read5 = fp.read(2)
         assert fp.tell() == 6
 
+    def test_stop_buffering(self):
+        fp = BufferedStream(BytesIO(b"abcdefgh"))
+        self.assertEqual(fp.read(2), b"ab")
+        fp.seek(0)
+        fp.stopBuffering()
+        self.assertEqual(fp.read(3), b"abc")
+        self.assertEqual(fp.tell(), 3)
+        self.assertEqual(fp.read(3), b"def")
+        self.assertEqual(fp.tell(), 6)
+        self.assertEqual(fp.bufferedBytes, 2)
+        fp.seek(0)
+        self.assertEqual(fp.read(2), b"ab")
+        self.assertRaises(IOError, fp.read, 1)
+        fp.seek(6)
+        self.assertEqual(fp.read(4), b"gh")
+        self.assertEqual(fp.tell(), 8)
+
 
 class HTMLUnicodeInputStreamShortChunk(HTMLUnicodeInputStream):
     _defaultChunkSize = 2
@@ -122,6 +144,63 @@ class HTMLInputStreamTest(unittest.TestCase):
         stream = HTMLInputStream("\r" * size + "\n")
         self.assertEqual(stream.charsUntil('x'), "\n" * size)
 
+    def test_newlines_small_chunks(self):
+        data = "a\r\nb\r\r\n\rc\r"
+        for chunkSize in (1, 2, 3):
+            for source in (data, data.encode("ascii")):
+                stream = HTMLInputStream(source, chunkSize=chunkSize)
+                self.assertEqual(stream.charsUntil("\x00"), "a\nb\n\n\nc\n")
+
+    def test_normalize_chunk(self):
+        stream = HTMLUnicodeInputStream("")
+        data = "a\nb"
+        self.assertTrue(stream.normalizeChunk(data) is data)
+        self.assertEqual(stream.normalizeChunk("a\r\nb\rc"), "a\nb\nc")
+        self.assertEqual(stream.errors, [])
+        self.assertEqual(stream.normalizeChunk("a\x01\r\ufffe"), "a\x01\n\ufffe")
+        self.assertEqual(stream.errors, ["invalid-codepoint"] * 2)
+        self.assertEqual(stream.normalizeChunk("a\udc00b", 10), "a\ufffdb")
+        self.assertEqual(stream.errors, ["invalid-codepoint"] * 3)
+        # Offsets just after each character, in the normalised text
+        self.assertEqual(stream.errorOffsets, [2, 4, 12])
+        # Valid and invalid characters outside the BMP
+        self.assertEqual(stream.normalizeChunk("\U00020000\U0002fffe"),
+                         "\U00020000\U0002fffe")
+        self.assertEqual(stream.errors, ["invalid-codepoint"] * 4)
+
+    def chunkSizes(self, stream):
+        sizes = []
+        while stream.readChunk():
+            sizes.append(stream.chunkSize)
+        return sizes
+
+    def test_chunk_size(self):
+        stream = HTMLInputStream("a" * 20, chunkSize=4)
+        self.assertEqual(self.chunkSizes(stream), [4] * 5)
+        stream = HTMLInputStream(b"a" * 20, encoding="ascii", chunkSize=8)
+        self.assertEqual(self.chunkSizes(stream), [8, 8, 4])
+
+    def test_adaptive_chunk_size(self):
+        for source in ("a" * 20, b"a" * 20):
+            stream = HTMLInputStream(source, chunkSize=2,
+                                     adaptiveChunkSize=True)
+            self.assertEqual(self.chunkSizes(stream), [2, 4, 8, 6])
+        # Only for sources in memory
+        stream = HTMLInputStream(BytesIO(b"a" * 20), chunkSize=8,
+                                 adaptiveChunkSize=True)
+        self.assertEqual(self.chunkSizes(stream), [8, 8, 4])
+
+    def test_keyword_arguments(self):
+        # Options for bytes are ignored for text, but unknown ones are
+        # rejected either way
+        for source in ("a", b"a"):
+            stream = HTMLInputStream(source, boundedBuffer=True,
+                                     encodingCache={}, cacheKey="x",
+                                     numBytesProbe=0, maxBytesChardet=10)
+            self.assertEqual(stream.charsUntil("b"), "a")
+            self.assertRaises(TypeError, HTMLInputStream, source,
+                              chunksize=10)
+
     def test_position(self):
         stream = HTMLBinaryInputStreamShortChunk(codecs.BOM_UTF8 + b"a\nbb\nccc\nddde\nf\ngh")
         self.assertEqual(stream.position(), (1, 0))
@@ -154,6 +233,199 @@ class HTMLInputStreamTest(unittest.TestCase):
         self.assertEqual(stream.char(), "d")
         self.assertEqual(stream.position(), (2, 1))
 
+    def test_position_at(self):
+        stream = HTMLUnicodeInputStreamShortChunk("ab\ncd\r\n\nefghij\nk")
+        offsets = []
+        while stream.char() is not EOF:
+            offsets.append(stream.offset())
+        self.assertEqual(offsets, list(range(1, 16)))
+        self.assertEqual([stream.positionAt(offset) for offset in (0, 2, 3, 6, 7, 15)],
+                         [(1, 0), (1, 2), (2, 0), (3, 0), (4, 0), (5, 1)])
+
+    def test_unget_position(self):
+        stream = HTMLUnicodeInputStreamShortChunk("abcdefghij\nk")
+        self.assertEqual(stream.charsUntil("x"), "abcdefghij\nk")
+        self.assertEqual(stream.char(), EOF)
+        stream.unget("k")
+        self.assertEqual(stream.position(), (2, 0))
+        stream.unget("\n")
+        self.assertEqual(stream.position(), (1, 10))
+
+    def test_match_chars(self):
+        stream = HTMLUnicodeInputStreamShortChunk("abcdefg>h")
+        regex = re.compile("[^>]*")
+        self.assertEqual(stream.char(), "a")
+        self.assertEqual(stream.matchChars(regex), "bcdefg")
+        self.assertEqual(stream.matchChars(regex), "")
+        self.assertEqual(stream.char(), ">")
+        self.assertEqual(stream.matchChars(regex), "h")
+        self.assertEqual(stream.char(), EOF)
+        self.assertEqual(stream.matchChars(regex), "")
+
+    def test_peek(self):
+        stream = HTMLUnicodeInputStreamShortChunk("ab\r\ncDoCtYpE")
+        self.assertEqual(stream.char(), "a")
+        self.assertEqual(stream.peek(3), "b\nc")
+        self.assertTrue(stream.startswith("b\nc"))
+        self.assertEqual(stream.consume(3), "b\nc")
+        self.assertEqual(stream.position(), (2, 1))
+        self.assertTrue(stream.startswith("doctype", True))
+        self.assertFalse(stream.startswith("doctype"))
+        self.assertFalse(stream.startswith("doctypes", True))
+        self.assertEqual(stream.consume(10), "DoCtYpE")
+        self.assertEqual(stream.position(), (2, 8))
+        self.assertEqual(stream.peek(1), "")
+        self.assertEqual(stream.char(), EOF)
+
+    def test_chars_until_match(self):
+        regex = re.compile(r"</[sS][cC][rR][iI][pP][tT][\t\n\x0c\r />]|\x00")
+        stream = HTMLUnicodeInputStreamShortChunk("a<b</scripts</SCRIPT>c")
+        self.assertEqual(stream.charsUntilMatch(regex, 9), "a<b</scripts")
+        self.assertEqual(stream.consume(9), "</SCRIPT>")
+        self.assertEqual(stream.charsUntilMatch(regex, 9), "c")
+        self.assertEqual(stream.char(), EOF)
+        regex = re.compile(r"--|-\Z")
+        stream = HTMLUnicodeInputStreamShortChunk("a-b-c--d-")
+        self.assertEqual(stream.charsUntilMatch(regex, 2), "a-b-c")
+        self.assertEqual(stream.consume(2), "--")
+        self.assertEqual(stream.charsUntilMatch(regex, 2), "d")
+        self.assertEqual(stream.char(), "-")
+        self.assertEqual(stream.position(), (1, 9))
+
+    def mapBytes(self, data):
+        f = tempfile.TemporaryFile()
+        self.addCleanup(f.close)
+        f.write(data)
+        f.flush()
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.addCleanup(m.close)
+        return m
+
+    def test_mmap(self):
+        data = "<meta charset=windows-1252>\xa9\r\n\u2019".encode("windows-1252")
+        stream = HTMLInputStream(self.mapBytes(data))
+        self.assertTrue(isinstance(stream.dataStream, BufferDecoder))
+        self.assertEqual(stream.charEncoding[1], "tentative")
+        self.assertEqual(stream.charsUntil("\x00"), "<meta charset=windows-1252>\xa9\n\u2019")
+
+    def test_mmap_bom(self):
+        stream = HTMLInputStream(self.mapBytes(codecs.BOM_UTF8 + "\u2018'".encode("utf-8")))
+        self.assertEqual(stream.charEncoding, ("utf-8", "certain"))
+        self.assertEqual(stream.charsUntil(" "), "\u2018'")
+
+    def test_bytes_decoded_directly(self):
+        stream = HTMLInputStream(codecs.BOM_UTF8 + "\u2018\r\n'".encode("utf-8"))
+        self.assertTrue(isinstance(stream.dataStream, BufferDecoder))
+        self.assertEqual(stream.charsUntil("\x00"), "\u2018\n'")
+
+    def test_buffer_decoder_slices(self):
+        data = ("\u2018x\r\n" * 10).encode("utf-8")
+        reader = BufferDecoder(data, 0, "utf-8")
+        reader.sliceSize = 3
+        pieces = []
+        while True:
+            piece = reader.read(4)
+            if not piece:
+                break
+            pieces.append(piece)
+        self.assertEqual(pieces[:-1], ["\u2018x\r\n"] * 9)
+        self.assertEqual("".join(pieces), "\u2018x\r\n" * 10)
+
+
+class HTMLIncrementalInputStreamTest(unittest.TestCase):
+
+    def test_need_more_data(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("ab")
+        self.assertEqual(stream.char(), "a")
+        self.assertEqual(stream.char(), "b")
+        self.assertRaises(NeedMoreDataException, stream.char)
+        stream.feed("c")
+        self.assertEqual(stream.char(), "c")
+        stream.close()
+        self.assertEqual(stream.char(), EOF)
+
+    def test_rewind(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("ab")
+        stream.char()
+        stream.mark()
+        self.assertEqual(stream.char(), "b")
+        self.assertRaises(NeedMoreDataException, stream.char)
+        stream.rewind()
+        stream.feed("cd")
+        self.assertEqual(stream.charsUntil("d"), "bc")
+
+    def test_match_chars(self):
+        regex = re.compile("[^>]*")
+        stream = HTMLIncrementalInputStream()
+        stream.feed("ab")
+        stream.char()
+        self.assertEqual(stream.matchChars(regex), "b")
+        stream.feed("c>d")
+        self.assertEqual(stream.matchChars(regex), "c")
+        self.assertEqual(stream.char(), ">")
+
+    def test_partial_runs(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("abc")
+        self.assertEqual(stream.charsUntil("x"), "abc")
+        stream.feed("d-")
+        # The "-" may be the start of a match, so is left until more is fed
+        self.assertEqual(stream.charsUntilMatch(re.compile("--"), 2), "d")
+        stream.feed("-x")
+        self.assertEqual(stream.charsUntilMatch(re.compile("--"), 2), "")
+        self.assertEqual(stream.consume(2), "--")
+
+    def test_peek(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("<!DOC")
+        self.assertEqual(stream.consume(2), "<!")
+        stream.mark()
+        self.assertRaises(NeedMoreDataException, stream.startswith,
+                          "doctype", True)
+        stream.rewind()
+        stream.feed("TYPE html>")
+        self.assertTrue(stream.startswith("doctype", True))
+        self.assertEqual(stream.consume(7), "DOCTYPE")
+        stream.close()
+        self.assertEqual(stream.peek(10), " html>")
+
+    def test_crlf_split(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("a\r")
+        self.assertEqual(stream.char(), "a")
+        self.assertRaises(NeedMoreDataException, stream.char)
+        stream.feed("\nb")
+        stream.close()
+        self.assertEqual(stream.charsUntil("x"), "\nb")
+        self.assertEqual(stream.position(), (2, 1))
+
+    def test_bytes_encoding(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed(codecs.BOM_UTF8 + "\u2018".encode("utf-8")[:2])
+        stream.feed("\u2018".encode("utf-8")[2:])
+        stream.close()
+        self.assertEqual(stream.charEncoding, ("utf-8", "certain"))
+        self.assertEqual(stream.char(), "\u2018")
+
+    def test_probe_window(self):
+        # The same bytes are looked at as when parsing all at once
+        data = b"<p>" + b"x" * 1000 + "\u2018".encode("utf-8")
+        stream = HTMLIncrementalInputStream()
+        for i in range(0, len(data), 100):
+            stream.feed(data[i:i + 100])
+            self.assertRaises(NeedMoreDataException, stream.char)
+        stream.close()
+        self.assertEqual(stream.charEncoding,
+                         HTMLInputStream(data).charEncoding)
+        self.assertEqual(stream.charEncoding, ("utf-8", "tentative"))
+
+    def test_mixed_types(self):
+        stream = HTMLIncrementalInputStream()
+        stream.feed("a")
+        self.assertRaises(TypeError, stream.feed, b"b")
+
 
 def buildTestSuite():
     return unittest.defaultTestLoader.loadTestsFromName(__name__)
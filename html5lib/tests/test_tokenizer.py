@@ -7,12 +7,14 @@ import re
 from .support import get_data_files
 
 from html5lib.tokenizer import HTMLTokenizer
+from html5lib.looptokenizer import HTMLLoopTokenizer
 from html5lib import constants
 
 
 class TokenizerTestParser(object):
-    def __init__(self, initialState, lastStartTag=None):
-        self.tokenizer = HTMLTokenizer
+    def __init__(self, initialState, lastStartTag=None,
+                 tokenizer=HTMLTokenizer):
+        self.tokenizer = tokenizer
         self._state = initialState
         self._lastStartTag = lastStartTag
 
@@ -139,7 +141,7 @@ def unescape(test):
     return test
 
 
-def runTokenizerTest(test):
+def runTokenizerTest(test, tokenizer=HTMLTokenizer):
     warnings.resetwarnings()
     warnings.simplefilter("error")
 
@@ -147,7 +149,7 @@ def runTokenizerTest(test):
     if 'lastStartTag' not in test:
         test['lastStartTag'] = None
     parser = TokenizerTestParser(test['initialState'],
-                                 test['lastStartTag'])
+                                 test['lastStartTag'], tokenizer)
     tokens = parser.parse(test['input'])
     tokens = concatenateCharacterTokens(tokens)
     received = normalizeTokens(tokens)
@@ -185,4 +187,23 @@ def testTokenizer():
                         test = unescape(test)
                     for initialState in test["initialStates"]:
                         test["initialState"] = capitalize(initialState)
-                        yield runTokenizerTest, test
+                        for tokenizer in (HTMLTokenizer, HTMLLoopTokenizer):
+                            yield runTokenizerTest, test, tokenizer
+
+
+def testLoopTokenizer():
+    # The loop tokenizer gives the same tokens, in the same batches
+    for data in ("<!DOCTYPE html><p class=a id='b' title=\"c &amp; d\">x",
+                 "<a b c=d e = 'f' g=\"h\"/><br/ ><x y=1 y=2 Z>&copy; &notin",
+                 "a\x00<\x00><A\x00B C\x00D=\x00 e=`f<g=h\"> </p </ >",
+                 "<a b=c&amp;d e='&lt' f=\"&#65;\" g=&#x;>&#1114112;\x01",
+                 "<script>a</script><!--b--><?c><a b='", "<a b=\"c", "<a b",
+                 "<a b=", "<a/", "<a b=c", "</", "<", "</a b>", "</a/>"):
+        for initialState in ("dataState", "rcdataState", "scriptDataState"):
+            batches = []
+            for tokenizer in (HTMLTokenizer, HTMLLoopTokenizer):
+                tokenizer = tokenizer(data)
+                tokenizer.state = getattr(tokenizer, initialState)
+                tokenizer.currentToken = {"type": "startTag", "name": "a"}
+                batches.append(list(tokenizer.iterBatches()))
+            assert batches[0] == batches[1], (data, initialState)
@@ -0,0 +1,203 @@
+from __future__ import absolute_import, division, unicode_literals
+
+from . import support  # flake8: noqa
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+from html5lib import tokenizer
+from html5lib.constants import entities
+from html5lib.tokenizer import HTMLTokenizer
+from html5lib.trie import DAFSATrie, PyTrie, getTrieBackend, trieBackends
+from html5lib.trie import _entities, calibration
+from html5lib.trie.dafsa import DAFSA
+
+
+def reader(text):
+    chars = iter(text)
+    return lambda: next(chars, None)
+
+
+class DAFSATest(unittest.TestCase):
+
+    def test_shared_endings(self):
+        dafsa = DAFSA(["tap", "taps", "top", "tops"])
+        # t, ta/to, tap/top, taps/tops and the start state
+        self.assertEqual(len(dafsa.transitions), 5)
+        for word in ("tap", "taps", "top", "tops"):
+            self.assertTrue(word in dafsa)
+        for word in ("", "t", "ta", "tapss", "x"):
+            self.assertFalse(word in dafsa)
+
+    def test_longest_prefix_length(self):
+        dafsa = DAFSA(["not", "notin;"])
+        self.assertEqual(dafsa.longestPrefixLength("notin;x"), 6)
+        self.assertEqual(dafsa.longestPrefixLength("notit;"), 3)
+        self.assertEqual(dafsa.longestPrefixLength("no"), None)
+
+    def test_prebuilt_entities(self):
+        # Regenerate trie/_entities.py with utils/entities.py if this fails
+        dafsa = DAFSA(entities)
+        self.assertEqual(dafsa.transitions, _entities.transitions)
+        self.assertEqual(dafsa.final, _entities.final)
+
+
+class TrieTest(unittest.TestCase):
+    backends = [trieBackends[name] for name in sorted(trieBackends)]
+
+    def test_entities(self):
+        tries = [backend(entities) for backend in self.backends]
+        for text in ("n", "not", "noti", "notin", "notin;", "notit;",
+                     "amp;x", "ampx", "CounterClockwiseContourIntegral;",
+                     "x", "zwnj;", "zz"):
+            results = []
+            for trie in tries:
+                try:
+                    longest = trie.longest_prefix(text)
+                except KeyError:
+                    longest = None
+                chars = [text[0]]
+                length = trie.match_longest(chars, reader(text[1:]))
+                results.append((trie.has_keys_with_prefix(text), longest,
+                                length, chars))
+            self.assertEqual(results[1:], results[:-1])
+
+    def test_match_longest(self):
+        for backend in self.backends:
+            trie = backend({"not": "\xac", "notin;": "\u2209"})
+            chars = ["n"]
+            self.assertEqual(trie.match_longest(chars, reader("otit;")), 3)
+            self.assertEqual(chars, ["n", "o", "t", "i", "t"])
+            chars = ["n"]
+            self.assertEqual(trie.match_longest(chars, reader("oti")), 3)
+            self.assertEqual(chars, ["n", "o", "t", "i", None])
+            chars = ["x"]
+            self.assertEqual(trie.match_longest(chars, reader("y")), 0)
+            self.assertEqual(chars, ["x"])
+
+    def test_keys(self):
+        for backend in self.backends:
+            trie = backend({"a": 1, "ab": 2, "b": 3})
+            self.assertEqual(set(trie.keys()), set(["a", "ab", "b"]))
+            self.assertEqual(set(trie.keys("a")), set(["a", "ab"]))
+            self.assertEqual(set(trie.keys("b")), set(["b"]))
+            self.assertEqual(set(trie.keys("c")), set())
+
+    def test_pure_lookups(self):
+        for backend in self.backends:
+            trie = backend(entities)
+            state = dict(vars(trie))
+            trie.keys("no")
+            trie.has_keys_with_prefix("not")
+            trie.longest_prefix("notin")
+            trie.match_longest(["n"], reader("otin;"))
+            self.assertEqual(vars(trie), state)
+
+    def test_threads(self):
+        # Threads share one trie, as parsers in threads share entitiesTrie
+        prefixes = sorted(set([name[:i] for name in entities
+                               for i in range(1, len(name) + 1)]))[::25]
+        prefixes += [prefix + "#" for prefix in prefixes[::10]]
+
+        def lookups(trie, prefixes):
+            return [(trie.has_keys_with_prefix(prefix),
+                     trie.keys(prefix),
+                     trie.match_longest([prefix[0]], reader(prefix[1:])))
+                    for prefix in prefixes]
+
+        def check(trie, results):
+            order = list(range(len(prefixes)))
+            random.shuffle(order)
+            found = lookups(trie, [prefixes[i] for i in order])
+            for i, result in zip(order, found):
+                if result != results[i]:
+                    failures.append((trie, prefixes[i], result))
+
+        # Switch threads often to make any race likely to show
+        if hasattr(sys, "setswitchinterval"):
+            interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-5)
+        else:
+            interval = sys.getcheckinterval()
+            sys.setcheckinterval(10)
+        try:
+            for backend in self.backends:
+                trie = backend(entities)
+                results = lookups(trie, prefixes)
+                failures = []
+                threads = [threading.Thread(target=check,
+                                            args=(trie, results))
+                           for i in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(failures, [])
+        finally:
+            if hasattr(sys, "setswitchinterval"):
+                sys.setswitchinterval(interval)
+            else:
+                sys.setcheckinterval(interval)
+
+
+class BackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.environ = os.environ.get("HTML5LIB_TRIE")
+        self.entitiesTrie = tokenizer.entitiesTrie
+        self.directory = tempfile.mkdtemp()
+        self.cacheFile = os.path.join(self.directory, "cache", "trie.json")
+
+    def tearDown(self):
+        if self.environ is None:
+            os.environ.pop("HTML5LIB_TRIE", None)
+        else:
+            os.environ["HTML5LIB_TRIE"] = self.environ
+        tokenizer.entitiesTrie = self.entitiesTrie
+        calibration.calibrated.pop(self.cacheFile, None)
+        shutil.rmtree(self.directory)
+
+    def test_get_trie_backend(self):
+        self.assertTrue(getTrieBackend("py") is PyTrie)
+        self.assertTrue(getTrieBackend("DAFSA") is DAFSATrie)
+        self.assertRaises(ValueError, getTrieBackend, "unknown")
+        os.environ["HTML5LIB_TRIE"] = "py"
+        self.assertTrue(getTrieBackend() is PyTrie)
+        os.environ.pop("HTML5LIB_TRIE")
+        self.assertTrue(getTrieBackend() is DAFSATrie)
+
+    def test_load_entities_trie(self):
+        for name in trieBackends:
+            trie = tokenizer.loadEntitiesTrie(name)
+            self.assertTrue(isinstance(trie, trieBackends[name]))
+            self.assertTrue(tokenizer.loadEntitiesTrie() is trie)
+            self.assertEqual(list(HTMLTokenizer("&notin;&noti")),
+                             [{"type": tokenizer.CharactersToken,
+                               "data": "\u2209"},
+                              {"type": tokenizer.ParseErrorToken,
+                               "data": "named-entity-without-semicolon"},
+                              {"type": tokenizer.CharactersToken,
+                               "data": "\xaci"}])
+
+    def test_calibrate(self):
+        backend = calibration.calibrate(self.cacheFile)
+        self.assertTrue(backend in trieBackends)
+        with open(self.cacheFile) as fp:
+            choices = json.load(fp)
+        self.assertEqual(choices, {calibration.interpreterKey(): backend})
+
+        # The choice is kept in the file
+        choices[calibration.interpreterKey()] = "py"
+        with open(self.cacheFile, "w") as fp:
+            json.dump(choices, fp)
+        del calibration.calibrated[self.cacheFile]
+        self.assertEqual(calibration.calibrate(self.cacheFile), "py")
+        backend = calibration.calibrate(self.cacheFile, recalibrate=True)
+        with open(self.cacheFile) as fp:
+            choices = json.load(fp)
+        self.assertEqual(choices, {calibration.interpreterKey(): backend})
@@ -1,24 +1,212 @@
 from __future__ import absolute_import, division, unicode_literals
 
+import re
+
 try:
     chr = unichr # flake8: noqa
 except NameError:
     pass
 
-from collections import deque
-
 from .constants import spaceCharacters
 from .constants import entities
-from .constants import asciiLetters, asciiUpper2Lower
+from .constants import asciiLetters, asciiLowercase, asciiUpper2Lower
 from .constants import digits, hexDigits, EOF
 from .constants import tokenTypes, tagTokenTypes
 from .constants import replacementCharacters
-
-from .inputstream import HTMLInputStream
-
-from .trie import Trie
-
-entitiesTrie = Trie(entities)
+from .constants import NeedMoreDataException
+
+from .inputstream import HTMLInputStream, HTMLIncrementalInputStream
+
+from .trie import DAFSATrie, getTrieBackend
+
+# The trie of named character references, loaded by loadEntitiesTrie when
+# the first one is met
+entitiesTrie = None
+
+# Token types, looked up once here rather than every time a token is made
+CharactersToken = tokenTypes["Characters"]
+SpaceCharactersToken = tokenTypes["SpaceCharacters"]
+StartTagToken = tokenTypes["StartTag"]
+EndTagToken = tokenTypes["EndTag"]
+CommentToken = tokenTypes["Comment"]
+DoctypeToken = tokenTypes["Doctype"]
+ParseErrorToken = tokenTypes["ParseError"]
+
+# Runs of characters that the tag name, attribute name and attribute value
+# states take in one go, up to the next character they handle differently
+tagNameRun = re.compile(r"[^\t\n\x0c\r />\x00]*")
+attributeNameRun = re.compile(r"[^\t\n\x0c\r /=>\x00\"'<]*")
+doubleQuotedValueRun = re.compile(r'[^"&\x00]*')
+singleQuotedValueRun = re.compile(r"[^'&\x00]*")
+unquotedValueRun = re.compile(r"[^\t\n\x0c\r &>\"'=<`\x00]*")
+
+# The end of a comment's text: "--", the end of the data after a single "-",
+# or a NUL
+commentTextEnd = re.compile(r"--|\x00|-\Z")
+
+# The patterns found by textEnd, by the characters they stop at and the
+# name of the element whose end tag also stops them
+textEnds = {}
+
+# States in which the tokenizer holds no partially built token, so that it
+# can safely be suspended there while waiting for more data
+resumableStates = frozenset(("dataState", "rcdataState", "rawtextState",
+                             "scriptDataState", "plaintextState"))
+
+# How close to the end of the data fed so far incrementalBatches records
+# where to resume from after every step, in whatever state: further than
+# any step looks ahead, so that running out of data only means doing one
+# step again rather than all of a long tag or comment
+resumeDistance = 64
+
+
+def loadEntitiesTrie(backend=None):
+    """Return entitiesTrie, loading it the first time, or again if backend
+    is given
+
+    backend - the name of the trie backend to use, as taken by
+              trie.getTrieBackend, which picks one when it isn't given.
+              A DAFSATrie is loaded from the automaton prebuilt in
+              trie._entities rather than being built.
+
+    Threads may race to load it, but each loads an equal trie, and
+    looking things up in a trie never changes it, so that one trie can be
+    shared by any number of threads.
+    """
+    global entitiesTrie
+    if entitiesTrie is None or backend is not None:
+        trieClass = getTrieBackend(backend)
+        if trieClass is DAFSATrie:
+            from .trie import _entities
+            entitiesTrie = DAFSATrie(entities, (_entities.transitions,
+                                                _entities.final))
+        else:
+            entitiesTrie = trieClass(entities)
+    return entitiesTrie
+
+
+def textEnd(stops, name):
+    """Return a compiled regular expression matching whichever comes first of
+    the strings in stops and an end tag that may close the element called
+    name (if it isn't None), with ASCII letters in either case, and the most
+    characters it can match
+    """
+    key = (stops, name)
+    if key not in textEnds:
+        patterns = [re.escape(stop) for stop in stops]
+        length = max([len(stop) for stop in stops])
+        if name is not None:
+            name = name.lower()
+            patterns.append("</%s[\t\n\x0c\r />]" % "".join([
+                "[%s%s]" % (char, char.upper()) if char in asciiLowercase
+                else re.escape(char) for char in name]))
+            length = max(length, len(name) + 3)
+        textEnds[key] = (re.compile("|".join(patterns)), length)
+    return textEnds[key]
+
+
+def copyToken(token):
+    """Return a copy of a token that is being built, which the states can
+    go on adding to without changing the original"""
+    if token is None:
+        return None
+    token = dict(token)
+    data = token.get("data")
+    if isinstance(data, list):
+        if token["type"] in tagTokenTypes:
+            token["data"] = [[name[:], value[:]] for name, value in data]
+        else:
+            token["data"] = data[:]
+    return token
+
+
+def splitBatches(batches, maxTokens):
+    """Yield the lists of tokens from batches, split into lists of at most
+    maxTokens tokens"""
+    for batch in batches:
+        if len(batch) <= maxTokens:
+            yield batch
+        else:
+            for i in range(0, len(batch), maxTokens):
+                yield batch[i:i + maxTokens]
+
+
+def coalesceCharacters(batches, held=None, hold=False, offset=None):
+    """Yield the lists of tokens from batches with each run of adjacent
+    character tokens merged into one token
+
+    A run starting with a Characters token takes in all the Characters and
+    SpaceCharacters tokens after it, as once the parser has seen the first
+    of those characters it treats any spaces after them as text. A run of
+    SpaceCharacters tokens only takes in more SpaceCharacters tokens, so
+    that the parser can still tell leading whitespace from text. A
+    Characters token for a single U+0000 is never merged, as the parser
+    drops or replaces those only when they are on their own. ParseError
+    tokens end a run, so that errors stay in the order of the text they are
+    about.
+
+    The last run in a list is held back until the next list shows whether
+    it goes on. The parser never switches the tokenizer's state because of
+    character tokens, so this doesn't change how the rest is tokenized.
+
+    held - a list of the last run from an earlier call and the parts of its
+    text, to carry on with
+
+    hold - leave the last run in held rather than yielding it, for when
+    more batches are to come. This keeps the tokens for a document fed to
+    an HTMLIncrementalInputStream the same however it is split up.
+
+    offset - a function giving the offset the input stream has got to. A
+    run held back past the list it starts in is given this as its
+    "offset", if it has none, for parse errors about the text to be
+    reported where it starts rather than where it ends.
+    """
+    run = None
+    if held:
+        # The run's parts are held rather than joined, so that a run fed
+        # in many pieces is only joined once
+        run, parts = held
+        del held[:]
+    for batch in batches:
+        if run is None and len(batch) == 1:
+            type = batch[0]["type"]
+            if type != CharactersToken and type != SpaceCharactersToken:
+                yield batch
+                continue
+        tokens = []
+        for token in batch:
+            type = token["type"]
+            if (type != CharactersToken and type != SpaceCharactersToken or
+                    token["data"] == "\u0000"):
+                type = None
+            elif run is None:
+                run = token
+                parts = [token["data"]]
+                continue
+            elif run["type"] == CharactersToken or run["type"] == type:
+                parts.append(token["data"])
+                continue
+            if run is not None:
+                if len(parts) > 1:
+                    run["data"] = "".join(parts)
+                tokens.append(run)
+                run = None
+            if type is None:
+                tokens.append(token)
+            else:
+                run = token
+                parts = [token["data"]]
+        if run is not None and offset is not None and "offset" not in run:
+            run["offset"] = offset()
+        if tokens:
+            yield tokens
+    if run is not None:
+        if hold:
+            held.extend((run, parts))
+        else:
+            if len(parts) > 1:
+                run["data"] = "".join(parts)
+            yield [run]
 
 
 class HTMLTokenizer(object):
@@ -35,9 +223,26 @@ class HTMLTokenizer(object):
     """
 
     def __init__(self, stream, encoding=None, parseMeta=True, useChardet=True,
-                 lowercaseElementName=True, lowercaseAttrName=True, parser=None):
+                 lowercaseElementName=True, lowercaseAttrName=True, parser=None,
+                 collectErrors=True, maxErrors=None, coalesceCharacters=False,
+                 **kwargs):
+        """Initialises the HTMLTokenizer.
+
+        collectErrors - produce ParseError tokens; if False no ParseError
+        tokens are even created, for when the errors aren't wanted
+
+        maxErrors - stop producing ParseError tokens after this many
 
-        self.stream = HTMLInputStream(stream, encoding, parseMeta, useChardet)
+        coalesceCharacters - merge adjacent Characters and SpaceCharacters
+        tokens, as coalesceCharacters describes, rather than producing one
+        for each stretch of text between character references, "<"s and
+        the like. HTMLParser turns this on.
+
+        Other keyword arguments are passed on to HTMLInputStream.
+        """
+
+        self.stream = HTMLInputStream(stream, encoding, parseMeta, useChardet,
+                                      **kwargs)
         self.parser = parser
 
         # Perform case conversions?
@@ -52,6 +257,24 @@ class HTMLTokenizer(object):
 
         # The current token being created
         self.currentToken = None
+
+        # The names of the current tag's attributes so far, to find duplicates
+        self.attributeNames = set()
+
+        # Used by incrementalBatches to stop every tokenLimit tokens
+        self.tokenLimit = None
+        self.tokenCount = 0
+        self.paused = False
+
+        self.collectErrors = collectErrors
+        self.maxErrors = maxErrors
+        self.errorCount = 0
+        self.coalesceCharacters = coalesceCharacters
+        # Character tokens held back until the data after them is fed
+        self.heldCharacters = []
+        # The token for a run of text cut off by the end of the data fed so
+        # far, and the stream's cutRun to carry on reading it with
+        self.openRun = None
         super(HTMLTokenizer, self).__init__()
 
     def __iter__(self):
@@ -61,19 +284,210 @@ class HTMLTokenizer(object):
         to return we yield the token which pauses processing until the next token
         is requested.
         """
-        self.tokenQueue = deque([])
+        for batch in self.iterBatches():
+            for token in batch:
+                yield token
+
+    def iterBatches(self, maxTokens=None):
+        """Return an iterator over the tokens in lists, rather than one at a
+        time.
+
+        Each list holds the tokens from one step of the state machine (for
+        an HTMLIncrementalInputStream, from one resumable state to the
+        next), after which the parser may need to switch the tokenizer's
+        state before it goes on. If coalesceCharacters is set, character
+        tokens are merged across the lists, and if maxTokens is set, longer
+        lists are split into lists of at most that many tokens.
+        """
+        if isinstance(self.stream, HTMLIncrementalInputStream):
+            batches = self.incrementalBatches()
+        else:
+            batches = self.stepBatches()
+        if self.coalesceCharacters:
+            hold = (isinstance(self.stream, HTMLIncrementalInputStream) and
+                    not self.stream.closed)
+            batches = coalesceCharacters(batches, self.heldCharacters, hold,
+                                         self.stream.offset)
+        if maxTokens is not None:
+            batches = splitBatches(batches, maxTokens)
+        return batches
+
+    def stepBatches(self):
+        """Yield the tokens from each step of the state machine as a list"""
+        stream = self.stream
+        self.tokenQueue = []
         # Start processing. When EOF is reached self.state will return False
         # instead of True and the loop will terminate.
         while self.state():
-            while self.stream.errors:
-                yield {"type": tokenTypes["ParseError"], "data": self.stream.errors.pop(0)}
-            while self.tokenQueue:
-                yield self.tokenQueue.popleft()
+            if stream.errors:
+                self.tokenQueue[:0] = self.streamErrorTokens()
+            if self.tokenQueue:
+                batch = self.tokenQueue
+                self.tokenQueue = []
+                yield batch
+
+    def incrementalBatches(self):
+        """Yield the tokens for the data fed to an HTMLIncrementalInputStream
+        so far, as a list for each stretch between resumable states.
+
+        Tokens are held back until the tokenizer reaches one of the
+        resumableStates, or until it is within resumeDistance characters of
+        the end of the data, where it records how far it has got through
+        the token it is building after every step. If the stream runs out of
+        data, everything since the last such point is thrown away and the
+        stream rewound, ready to tokenize it again once more data has been
+        fed. Tokens held back past the step that made them are given the
+        "offset" the stream had got to then, for parse errors to be
+        reported at.
+
+        A run of text in a resumable state cut off by the end of the data
+        is held back in openRun and read on with continueRun once more has
+        been fed, so that its token, and the errors before it, are given as
+        the step that started it would have given them with all the data.
+
+        If tokenLimit is set, this also stops (setting paused) at the first
+        resumable state after every tokenLimit tokens.
+        """
+        stream = self.stream
+        self.paused = False
+        self.tokenQueue = heldTokens = []
+        stream.mark()
+        checkpoint = self.saveState()
+        while True:
+            count = len(heldTokens)
+            stream.cutRun = None
+            try:
+                if self.openRun is None:
+                    more = self.state()
+                else:
+                    more = self.continueRun()
+            except NeedMoreDataException:
+                stream.rewind()
+                self.restoreState(checkpoint)
+                return
+            resumable = self.state.__name__ in resumableStates
+            if more and not resumable and len(heldTokens) > count:
+                offset = stream.offset()
+                for token in heldTokens[count:]:
+                    token["offset"] = offset
+            if stream.errors:
+                heldTokens[count:count] = self.streamErrorTokens()
+            if (more and resumable and self.openRun is None and
+                    stream.cutRun is not None and len(heldTokens) > count and
+                    heldTokens[-1]["type"] in (CharactersToken,
+                                               SpaceCharactersToken)):
+                token = heldTokens.pop()
+                self.openRun = (token, [token["data"]], []) + stream.cutRun
+            if (more and not resumable and
+                    not stream.nearEnd(resumeDistance)):
+                continue
+
+            if heldTokens:
+                yield heldTokens
+            if not more:
+                return
+            self.tokenCount += len(heldTokens)
+            self.tokenQueue = heldTokens = []
+            if (resumable and self.tokenLimit is not None and
+                    self.tokenCount >= self.tokenLimit):
+                self.tokenCount = 0
+                self.paused = True
+                return
+            # The parser may have switched the state while handling the
+            # tokens, so only now is it safe to record where to resume
+            stream.mark()
+            checkpoint = self.saveState()
+
+    def continueRun(self):
+        """Read on with the run of text in openRun, and once it ends give
+        its token, after the errors the input stream found in it"""
+        token, parts, errorTokens, method, args = self.openRun
+        stream = self.stream
+        data = method(*args)
+        if not data and stream.cutRun is not None:
+            # Nothing more has been fed yet
+            raise NeedMoreDataException
+        parts.append(data)
+        if stream.errors:
+            errorTokens.extend(self.streamErrorTokens())
+        if stream.cutRun is not None:
+            self.openRun = (token, parts, errorTokens) + stream.cutRun
+        else:
+            self.openRun = None
+            token["data"] = "".join(parts)
+            self.tokenQueue.extend(errorTokens)
+            self.tokenQueue.append(token)
+        return True
+
+    def saveState(self):
+        """Return what restoreState needs to take the tokenizer back to
+        where it is now"""
+        currentToken = self.currentToken
+        attributeNames = self.attributeNames
+        if self.state.__name__ not in resumableStates:
+            # Part way through building a token, which the states will go
+            # on adding to
+            currentToken = copyToken(currentToken)
+            attributeNames = set(attributeNames)
+        return (self.state, currentToken, self.errorCount,
+                getattr(self, "temporaryBuffer", None), attributeNames)
+
+    def restoreState(self, saved):
+        """Go back to where the tokenizer was when saveState returned saved"""
+        (self.state, currentToken, self.errorCount, self.temporaryBuffer,
+         attributeNames) = saved
+        # Copy them again, as the states will go on changing them
+        self.currentToken = copyToken(currentToken)
+        self.attributeNames = set(attributeNames)
+
+    def errorToken(self, errorcode, datavars=None):
+        """Return a ParseError token, or None if errors aren't being
+        collected or maxErrors of them have been already"""
+        if not self.collectErrors or self.errorCount == self.maxErrors:
+            return None
+        self.errorCount += 1
+        token = {"type": ParseErrorToken, "data": errorcode}
+        if datavars is not None:
+            token["datavars"] = datavars
+        return token
+
+    def parseError(self, errorcode, datavars=None):
+        """Queue a ParseError token, if errors are being collected"""
+        token = self.errorToken(errorcode, datavars)
+        if token is not None:
+            self.tokenQueue.append(token)
+
+    def streamErrorTokens(self):
+        """Return ParseError tokens for the errors the input stream has
+        found in the characters read so far, with the "offset" of the
+        character each is about
+
+        The stream finds errors in a chunk when it reads it, which may be
+        well ahead of the tokenizer, so the rest are kept back until it
+        gets to them, to keep the errors in order.
+        """
+        stream = self.stream
+        errors = stream.errors
+        errorOffsets = stream.errorOffsets
+        reached = stream.offset()
+        tokens = []
+        count = 0
+        for errorcode, offset in zip(errors, errorOffsets):
+            if offset > reached:
+                break
+            count += 1
+            token = self.errorToken(errorcode)
+            if token is not None:
+                token["offset"] = offset
+                tokens.append(token)
+        del errors[:count]
+        del errorOffsets[:count]
+        return tokens
 
     def consumeNumberEntity(self, isHex):
         """This function returns either U+FFFD or the character based on the
         decimal or hexadecimal representation. It also discards ";" if present.
-        If not present self.tokenQueue.append({"type": tokenTypes["ParseError"]}) is invoked.
+        If not present self.parseError is invoked.
         """
 
         allowed = digits
@@ -97,15 +511,11 @@ class HTMLTokenizer(object):
         # Certain characters get replaced with others
         if charAsInt in replacementCharacters:
             char = replacementCharacters[charAsInt]
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "illegal-codepoint-for-numeric-entity",
-                                    "datavars": {"charAsInt": charAsInt}})
+            self.parseError("illegal-codepoint-for-numeric-entity", {"charAsInt": charAsInt})
         elif ((0xD800 <= charAsInt <= 0xDFFF) or
               (charAsInt > 0x10FFFF)):
             char = "\uFFFD"
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "illegal-codepoint-for-numeric-entity",
-                                    "datavars": {"charAsInt": charAsInt}})
+            self.parseError("illegal-codepoint-for-numeric-entity", {"charAsInt": charAsInt})
         else:
             # Should speed up this check somehow (e.g. move the set to a constant)
             if ((0x0001 <= charAsInt <= 0x0008) or
@@ -121,10 +531,7 @@ class HTMLTokenizer(object):
                                         0xBFFFF, 0xCFFFE, 0xCFFFF, 0xDFFFE,
                                         0xDFFFF, 0xEFFFE, 0xEFFFF, 0xFFFFE,
                                         0xFFFFF, 0x10FFFE, 0x10FFFF])):
-                self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                        "data":
-                                        "illegal-codepoint-for-numeric-entity",
-                                        "datavars": {"charAsInt": charAsInt}})
+                self.parseError("illegal-codepoint-for-numeric-entity", {"charAsInt": charAsInt})
             try:
                 # Try/except needed as UCS-2 Python builds' unichar only works
                 # within the BMP.
@@ -136,8 +543,7 @@ class HTMLTokenizer(object):
         # Discard the ; if present. Otherwise, put it back on the queue and
         # invoke parseError on parser.
         if c != ";":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "numeric-entity-without-semicolon"})
+            self.parseError("numeric-entity-without-semicolon")
             self.stream.unget(c)
 
         return char
@@ -167,8 +573,7 @@ class HTMLTokenizer(object):
                 output = self.consumeNumberEntity(hex)
             else:
                 # No digits found
-                self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                        "data": "expected-numeric-entity"})
+                self.parseError("expected-numeric-entity")
                 self.stream.unget(charStack.pop())
                 output = "&" + "".join(charStack)
 
@@ -176,27 +581,21 @@ class HTMLTokenizer(object):
             # At this point in the process might have named entity. Entities
             # are stored in the global variable "entities".
             #
-            # Consume characters and compare to these to a substring of the
-            # entity names in the list until the substring no longer matches.
-            while (charStack[-1] is not EOF):
-                if not entitiesTrie.has_keys_with_prefix("".join(charStack)):
-                    break
-                charStack.append(self.stream.char())
-
-            # At this point we have a string that starts with some characters
-            # that may match an entity
-            # Try to find the longest entity the string will match to take care
+            # Consume characters until they are no longer the start of any
+            # entity name, finding the longest entity they match to take care
             # of &noti for instance.
-            try:
-                entityName = entitiesTrie.longest_prefix("".join(charStack[:-1]))
-                entityLength = len(entityName)
-            except KeyError:
+            trie = entitiesTrie
+            if trie is None:
+                trie = loadEntitiesTrie()
+            entityLength = trie.match_longest(charStack, self.stream.char)
+            if entityLength:
+                entityName = "".join(charStack[:entityLength])
+            else:
                 entityName = None
 
             if entityName is not None:
                 if entityName[-1] != ";":
-                    self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                            "named-entity-without-semicolon"})
+                    self.parseError("named-entity-without-semicolon")
                 if (entityName[-1] != ";" and fromAttribute and
                     (charStack[entityLength] in asciiLetters or
                      charStack[entityLength] in digits or
@@ -208,13 +607,12 @@ class HTMLTokenizer(object):
                     self.stream.unget(charStack.pop())
                     output += "".join(charStack[entityLength:])
             else:
-                self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                        "expected-named-entity"})
+                self.parseError("expected-named-entity")
                 self.stream.unget(charStack.pop())
                 output = "&" + "".join(charStack)
 
         if fromAttribute:
-            self.currentToken["data"][-1][1] += output
+            self.currentToken["data"][-1][1].append(output)
         else:
             if output in spaceCharacters:
                 tokenType = "SpaceCharacters"
@@ -237,16 +635,43 @@ class HTMLTokenizer(object):
         if (token["type"] in tagTokenTypes):
             if self.lowercaseElementName:
                 token["name"] = token["name"].translate(asciiUpper2Lower)
-            if token["type"] == tokenTypes["EndTag"]:
+            # Attribute values are built up as lists of parts, so that a long
+            # value read in many pieces isn't copied again for each of them
+            for attribute in token["data"]:
+                attribute[1] = "".join(attribute[1])
+            if token["type"] == EndTagToken:
                 if token["data"]:
-                    self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                            "data": "attributes-in-end-tag"})
+                    self.parseError("attributes-in-end-tag")
                 if token["selfClosing"]:
-                    self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                            "data": "self-closing-flag-on-end-tag"})
+                    self.parseError("self-closing-flag-on-end-tag")
+        elif token["type"] == CommentToken:
+            # So is the text of a comment
+            token["data"] = "".join(token["data"])
         self.tokenQueue.append(token)
         self.state = self.dataState
 
+    def consumeAppropriateEndTagName(self):
+        """Having read the first letter of an end tag name in RCDATA, RAWTEXT
+        or script data into temporaryBuffer, move past the rest of it if it
+        is the name of the element those are the contents of, so that the end
+        tag name state doesn't have to read the name a letter at a time.
+        """
+        if self.currentToken:
+            name = self.currentToken["name"].translate(asciiUpper2Lower)
+            if (self.temporaryBuffer.translate(asciiUpper2Lower) == name[:1] and
+                    self.stream.startswith(name[1:], True)):
+                self.temporaryBuffer += self.stream.consume(len(name) - 1)
+
+    def charsUntilEndTag(self, stops):
+        """Return the characters up to the next of the strings in stops or
+        the next end tag that may close the element whose RCDATA, RAWTEXT or
+        script data is being read, and move past them. Any other "<" is
+        taken along with the rest, rather than each one being a step of its
+        own.
+        """
+        name = self.currentToken.get("name") if self.currentToken else None
+        return self.stream.charsUntilMatch(*textEnd(stops, name))
+
     # Below are the various tokenizer states worked out.
     def dataState(self):
         data = self.stream.char()
@@ -255,9 +680,8 @@ class HTMLTokenizer(object):
         elif data == "<":
             self.state = self.tagOpenState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\u0000"})
         elif data is EOF:
             # Tokenization ends.
@@ -266,14 +690,14 @@ class HTMLTokenizer(object):
             # Directly after emitting a token you switch back to the "data
             # state". At that point spaceCharacters are important so they are
             # emitted separately.
-            self.tokenQueue.append({"type": tokenTypes["SpaceCharacters"], "data":
+            self.tokenQueue.append({"type": SpaceCharactersToken, "data":
                                     data + self.stream.charsUntil(spaceCharacters, True)})
             # No need to update lastFourChars here, since the first space will
             # have already been appended to lastFourChars and will have broken
             # any <!-- or --> sequences
         else:
             chars = self.stream.charsUntil(("&", "<", "\u0000"))
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + chars})
         return True
 
@@ -292,22 +716,21 @@ class HTMLTokenizer(object):
             # Tokenization ends.
             return False
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         elif data in spaceCharacters:
             # Directly after emitting a token you switch back to the "data
             # state". At that point spaceCharacters are important so they are
             # emitted separately.
-            self.tokenQueue.append({"type": tokenTypes["SpaceCharacters"], "data":
+            self.tokenQueue.append({"type": SpaceCharactersToken, "data":
                                     data + self.stream.charsUntil(spaceCharacters, True)})
             # No need to update lastFourChars here, since the first space will
             # have already been appended to lastFourChars and will have broken
             # any <!-- or --> sequences
         else:
-            chars = self.stream.charsUntil(("&", "<", "\u0000"))
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            chars = self.charsUntilEndTag(("&", "\u0000"))
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + chars})
         return True
 
@@ -321,16 +744,15 @@ class HTMLTokenizer(object):
         if data == "<":
             self.state = self.rawtextLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         elif data == EOF:
             # Tokenization ends.
             return False
         else:
-            chars = self.stream.charsUntil(("<", "\u0000"))
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            chars = self.charsUntilEndTag(("\u0000",))
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + chars})
         return True
 
@@ -339,16 +761,15 @@ class HTMLTokenizer(object):
         if data == "<":
             self.state = self.scriptDataLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         elif data == EOF:
             # Tokenization ends.
             return False
         else:
-            chars = self.stream.charsUntil(("<", "\u0000"))
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            chars = self.charsUntilEndTag(("\u0000", "<!--"))
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + chars})
         return True
 
@@ -358,12 +779,11 @@ class HTMLTokenizer(object):
             # Tokenization ends.
             return False
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + self.stream.charsUntil("\u0000")})
         return True
 
@@ -374,30 +794,29 @@ class HTMLTokenizer(object):
         elif data == "/":
             self.state = self.closeTagOpenState
         elif data in asciiLetters:
-            self.currentToken = {"type": tokenTypes["StartTag"],
-                                 "name": data, "data": [],
+            self.currentToken = {"type": StartTagToken,
+                                 "name": data +
+                                 self.stream.matchChars(tagNameRun),
+                                 "data": [],
                                  "selfClosing": False,
                                  "selfClosingAcknowledged": False}
             self.state = self.tagNameState
         elif data == ">":
             # XXX In theory it could be something besides a tag name. But
             # do we really care?
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-tag-name-but-got-right-bracket"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<>"})
+            self.parseError("expected-tag-name-but-got-right-bracket")
+            self.tokenQueue.append({"type": CharactersToken, "data": "<>"})
             self.state = self.dataState
         elif data == "?":
             # XXX In theory it could be something besides a tag name. But
             # do we really care?
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-tag-name-but-got-question-mark"})
+            self.parseError("expected-tag-name-but-got-question-mark")
             self.stream.unget(data)
             self.state = self.bogusCommentState
         else:
             # XXX
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-tag-name"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.parseError("expected-tag-name")
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.stream.unget(data)
             self.state = self.dataState
         return True
@@ -405,23 +824,21 @@ class HTMLTokenizer(object):
     def closeTagOpenState(self):
         data = self.stream.char()
         if data in asciiLetters:
-            self.currentToken = {"type": tokenTypes["EndTag"], "name": data,
+            self.currentToken = {"type": EndTagToken,
+                                 "name": data +
+                                 self.stream.matchChars(tagNameRun),
                                  "data": [], "selfClosing": False}
             self.state = self.tagNameState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-closing-tag-but-got-right-bracket"})
+            self.parseError("expected-closing-tag-but-got-right-bracket")
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-closing-tag-but-got-eof"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "</"})
+            self.parseError("expected-closing-tag-but-got-eof")
+            self.tokenQueue.append({"type": CharactersToken, "data": "</"})
             self.state = self.dataState
         else:
             # XXX data can be _'_...
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-closing-tag-but-got-char",
-                                    "datavars": {"data": data}})
+            self.parseError("expected-closing-tag-but-got-char", {"data": data})
             self.stream.unget(data)
             self.state = self.bogusCommentState
         return True
@@ -433,19 +850,16 @@ class HTMLTokenizer(object):
         elif data == ">":
             self.emitCurrentToken()
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-tag-name"})
+            self.parseError("eof-in-tag-name")
             self.state = self.dataState
         elif data == "/":
             self.state = self.selfClosingStartTagState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["name"] += "\uFFFD"
         else:
-            self.currentToken["name"] += data
-            # (Don't use charsUntil here, because tag names are
-            # very short and it's faster to not do anything fancy)
+            self.currentToken["name"] += data + \
+                self.stream.matchChars(tagNameRun)
         return True
 
     def rcdataLessThanSignState(self):
@@ -454,7 +868,7 @@ class HTMLTokenizer(object):
             self.temporaryBuffer = ""
             self.state = self.rcdataEndTagOpenState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.stream.unget(data)
             self.state = self.rcdataState
         return True
@@ -463,9 +877,10 @@ class HTMLTokenizer(object):
         data = self.stream.char()
         if data in asciiLetters:
             self.temporaryBuffer += data
+            self.consumeAppropriateEndTagName()
             self.state = self.rcdataEndTagNameState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "</"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "</"})
             self.stream.unget(data)
             self.state = self.rcdataState
         return True
@@ -474,17 +889,17 @@ class HTMLTokenizer(object):
         appropriate = self.currentToken and self.currentToken["name"].lower() == self.temporaryBuffer.lower()
         data = self.stream.char()
         if data in spaceCharacters and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.beforeAttributeNameState
         elif data == "/" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.selfClosingStartTagState
         elif data == ">" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.emitCurrentToken()
@@ -492,7 +907,7 @@ class HTMLTokenizer(object):
         elif data in asciiLetters:
             self.temporaryBuffer += data
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "</" + self.temporaryBuffer})
             self.stream.unget(data)
             self.state = self.rcdataState
@@ -504,7 +919,7 @@ class HTMLTokenizer(object):
             self.temporaryBuffer = ""
             self.state = self.rawtextEndTagOpenState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.stream.unget(data)
             self.state = self.rawtextState
         return True
@@ -513,9 +928,10 @@ class HTMLTokenizer(object):
         data = self.stream.char()
         if data in asciiLetters:
             self.temporaryBuffer += data
+            self.consumeAppropriateEndTagName()
             self.state = self.rawtextEndTagNameState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "</"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "</"})
             self.stream.unget(data)
             self.state = self.rawtextState
         return True
@@ -524,17 +940,17 @@ class HTMLTokenizer(object):
         appropriate = self.currentToken and self.currentToken["name"].lower() == self.temporaryBuffer.lower()
         data = self.stream.char()
         if data in spaceCharacters and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.beforeAttributeNameState
         elif data == "/" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.selfClosingStartTagState
         elif data == ">" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.emitCurrentToken()
@@ -542,7 +958,7 @@ class HTMLTokenizer(object):
         elif data in asciiLetters:
             self.temporaryBuffer += data
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "</" + self.temporaryBuffer})
             self.stream.unget(data)
             self.state = self.rawtextState
@@ -554,10 +970,10 @@ class HTMLTokenizer(object):
             self.temporaryBuffer = ""
             self.state = self.scriptDataEndTagOpenState
         elif data == "!":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<!"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<!"})
             self.state = self.scriptDataEscapeStartState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.stream.unget(data)
             self.state = self.scriptDataState
         return True
@@ -566,9 +982,10 @@ class HTMLTokenizer(object):
         data = self.stream.char()
         if data in asciiLetters:
             self.temporaryBuffer += data
+            self.consumeAppropriateEndTagName()
             self.state = self.scriptDataEndTagNameState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "</"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "</"})
             self.stream.unget(data)
             self.state = self.scriptDataState
         return True
@@ -577,17 +994,17 @@ class HTMLTokenizer(object):
         appropriate = self.currentToken and self.currentToken["name"].lower() == self.temporaryBuffer.lower()
         data = self.stream.char()
         if data in spaceCharacters and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.beforeAttributeNameState
         elif data == "/" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.selfClosingStartTagState
         elif data == ">" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.emitCurrentToken()
@@ -595,7 +1012,7 @@ class HTMLTokenizer(object):
         elif data in asciiLetters:
             self.temporaryBuffer += data
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "</" + self.temporaryBuffer})
             self.stream.unget(data)
             self.state = self.scriptDataState
@@ -604,7 +1021,7 @@ class HTMLTokenizer(object):
     def scriptDataEscapeStartState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataEscapeStartDashState
         else:
             self.stream.unget(data)
@@ -614,7 +1031,7 @@ class HTMLTokenizer(object):
     def scriptDataEscapeStartDashState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataEscapedDashDashState
         else:
             self.stream.unget(data)
@@ -624,62 +1041,59 @@ class HTMLTokenizer(object):
     def scriptDataEscapedState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataEscapedDashState
         elif data == "<":
             self.state = self.scriptDataEscapedLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         elif data == EOF:
             self.state = self.dataState
         else:
             chars = self.stream.charsUntil(("<", "-", "\u0000"))
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data":
+            self.tokenQueue.append({"type": CharactersToken, "data":
                                     data + chars})
         return True
 
     def scriptDataEscapedDashState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataEscapedDashDashState
         elif data == "<":
             self.state = self.scriptDataEscapedLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
             self.state = self.scriptDataEscapedState
         elif data == EOF:
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.state = self.scriptDataEscapedState
         return True
 
     def scriptDataEscapedDashDashState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
         elif data == "<":
             self.state = self.scriptDataEscapedLessThanSignState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": ">"})
+            self.tokenQueue.append({"type": CharactersToken, "data": ">"})
             self.state = self.scriptDataState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
             self.state = self.scriptDataEscapedState
         elif data == EOF:
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.state = self.scriptDataEscapedState
         return True
 
@@ -689,11 +1103,11 @@ class HTMLTokenizer(object):
             self.temporaryBuffer = ""
             self.state = self.scriptDataEscapedEndTagOpenState
         elif data in asciiLetters:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<" + data})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<" + data})
             self.temporaryBuffer = data
             self.state = self.scriptDataDoubleEscapeStartState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.stream.unget(data)
             self.state = self.scriptDataEscapedState
         return True
@@ -702,9 +1116,10 @@ class HTMLTokenizer(object):
         data = self.stream.char()
         if data in asciiLetters:
             self.temporaryBuffer = data
+            self.consumeAppropriateEndTagName()
             self.state = self.scriptDataEscapedEndTagNameState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "</"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "</"})
             self.stream.unget(data)
             self.state = self.scriptDataEscapedState
         return True
@@ -713,17 +1128,17 @@ class HTMLTokenizer(object):
         appropriate = self.currentToken and self.currentToken["name"].lower() == self.temporaryBuffer.lower()
         data = self.stream.char()
         if data in spaceCharacters and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.beforeAttributeNameState
         elif data == "/" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.state = self.selfClosingStartTagState
         elif data == ">" and appropriate:
-            self.currentToken = {"type": tokenTypes["EndTag"],
+            self.currentToken = {"type": EndTagToken,
                                  "name": self.temporaryBuffer,
                                  "data": [], "selfClosing": False}
             self.emitCurrentToken()
@@ -731,7 +1146,7 @@ class HTMLTokenizer(object):
         elif data in asciiLetters:
             self.temporaryBuffer += data
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "</" + self.temporaryBuffer})
             self.stream.unget(data)
             self.state = self.scriptDataEscapedState
@@ -740,13 +1155,13 @@ class HTMLTokenizer(object):
     def scriptDataDoubleEscapeStartState(self):
         data = self.stream.char()
         if data in (spaceCharacters | frozenset(("/", ">"))):
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             if self.temporaryBuffer.lower() == "script":
                 self.state = self.scriptDataDoubleEscapedState
             else:
                 self.state = self.scriptDataEscapedState
         elif data in asciiLetters:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.temporaryBuffer += data
         else:
             self.stream.unget(data)
@@ -756,76 +1171,70 @@ class HTMLTokenizer(object):
     def scriptDataDoubleEscapedState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataDoubleEscapedDashState
         elif data == "<":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.state = self.scriptDataDoubleEscapedLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
         elif data == EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-script-in-script"})
+            self.parseError("eof-in-script-in-script")
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
         return True
 
     def scriptDataDoubleEscapedDashState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
             self.state = self.scriptDataDoubleEscapedDashDashState
         elif data == "<":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.state = self.scriptDataDoubleEscapedLessThanSignState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
             self.state = self.scriptDataDoubleEscapedState
         elif data == EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-script-in-script"})
+            self.parseError("eof-in-script-in-script")
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.state = self.scriptDataDoubleEscapedState
         return True
 
     def scriptDataDoubleEscapedDashDashState(self):
         data = self.stream.char()
         if data == "-":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "-"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "-"})
         elif data == "<":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "<"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "<"})
             self.state = self.scriptDataDoubleEscapedLessThanSignState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": ">"})
+            self.tokenQueue.append({"type": CharactersToken, "data": ">"})
             self.state = self.scriptDataState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.parseError("invalid-codepoint")
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": "\uFFFD"})
             self.state = self.scriptDataDoubleEscapedState
         elif data == EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-script-in-script"})
+            self.parseError("eof-in-script-in-script")
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.state = self.scriptDataDoubleEscapedState
         return True
 
     def scriptDataDoubleEscapedLessThanSignState(self):
         data = self.stream.char()
         if data == "/":
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": "/"})
+            self.tokenQueue.append({"type": CharactersToken, "data": "/"})
             self.temporaryBuffer = ""
             self.state = self.scriptDataDoubleEscapeEndState
         else:
@@ -836,13 +1245,13 @@ class HTMLTokenizer(object):
     def scriptDataDoubleEscapeEndState(self):
         data = self.stream.char()
         if data in (spaceCharacters | frozenset(("/", ">"))):
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             if self.temporaryBuffer.lower() == "script":
                 self.state = self.scriptDataEscapedState
             else:
                 self.state = self.scriptDataDoubleEscapedState
         elif data in asciiLetters:
-            self.tokenQueue.append({"type": tokenTypes["Characters"], "data": data})
+            self.tokenQueue.append({"type": CharactersToken, "data": data})
             self.temporaryBuffer += data
         else:
             self.stream.unget(data)
@@ -854,28 +1263,27 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             self.stream.charsUntil(spaceCharacters, True)
         elif data in asciiLetters:
-            self.currentToken["data"].append([data, ""])
+            self.currentToken["data"].append(
+                [[data + self.stream.matchChars(attributeNameRun)], []])
             self.state = self.attributeNameState
         elif data == ">":
             self.emitCurrentToken()
         elif data == "/":
             self.state = self.selfClosingStartTagState
         elif data in ("'", '"', "=", "<"):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "invalid-character-in-attribute-name"})
-            self.currentToken["data"].append([data, ""])
+            self.parseError("invalid-character-in-attribute-name")
+            self.currentToken["data"].append([[data], []])
             self.state = self.attributeNameState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"].append(["\uFFFD", ""])
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append([["\uFFFD"], []])
             self.state = self.attributeNameState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-attribute-name-but-got-eof"})
+            self.parseError("expected-attribute-name-but-got-eof")
             self.state = self.dataState
         else:
-            self.currentToken["data"].append([data, ""])
+            self.currentToken["data"].append(
+                [[data + self.stream.matchChars(attributeNameRun)], []])
             self.state = self.attributeNameState
         return True
 
@@ -886,8 +1294,8 @@ class HTMLTokenizer(object):
         if data == "=":
             self.state = self.beforeAttributeValueState
         elif data in asciiLetters:
-            self.currentToken["data"][-1][0] += data +\
-                self.stream.charsUntil(asciiLetters, True)
+            self.currentToken["data"][-1][0].append(
+                data + self.stream.matchChars(attributeNameRun))
             leavingThisState = False
         elif data == ">":
             # XXX If we emit here the attributes are converted to a dict
@@ -899,36 +1307,39 @@ class HTMLTokenizer(object):
         elif data == "/":
             self.state = self.selfClosingStartTagState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"][-1][0] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"][-1][0].append("\uFFFD")
             leavingThisState = False
         elif data in ("'", '"', "<"):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data":
-                                    "invalid-character-in-attribute-name"})
-            self.currentToken["data"][-1][0] += data
+            self.parseError("invalid-character-in-attribute-name")
+            self.currentToken["data"][-1][0].append(data)
             leavingThisState = False
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "eof-in-attribute-name"})
+            self.parseError("eof-in-attribute-name")
             self.state = self.dataState
         else:
-            self.currentToken["data"][-1][0] += data
+            self.currentToken["data"][-1][0].append(
+                data + self.stream.matchChars(attributeNameRun))
             leavingThisState = False
 
         if leavingThisState:
             # Attributes are not dropped at this stage. That happens when the
             # start tag token is emitted so values can still be safely appended
             # to attributes, but we do want to report the parse error in time.
+            # The name is complete, so join its parts, and check it against
+            # the set of the names before it, started afresh by the first
+            # attribute of each tag.
+            attributes = self.currentToken["data"]
+            name = "".join(attributes[-1][0])
             if self.lowercaseAttrName:
-                self.currentToken["data"][-1][0] = (
-                    self.currentToken["data"][-1][0].translate(asciiUpper2Lower))
-            for name, value in self.currentToken["data"][:-1]:
-                if self.currentToken["data"][-1][0] == name:
-                    self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                            "duplicate-attribute"})
-                    break
+                name = name.translate(asciiUpper2Lower)
+            attributes[-1][0] = name
+            if len(attributes) == 1:
+                self.attributeNames = set()
+            if name in self.attributeNames:
+                self.parseError("duplicate-attribute")
+            else:
+                self.attributeNames.add(name)
             # XXX Fix for above XXX
             if emitToken:
                 self.emitCurrentToken()
@@ -943,26 +1354,23 @@ class HTMLTokenizer(object):
         elif data == ">":
             self.emitCurrentToken()
         elif data in asciiLetters:
-            self.currentToken["data"].append([data, ""])
+            self.currentToken["data"].append([[data], []])
             self.state = self.attributeNameState
         elif data == "/":
             self.state = self.selfClosingStartTagState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"].append(["\uFFFD", ""])
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append([["\uFFFD"], []])
             self.state = self.attributeNameState
         elif data in ("'", '"', "<"):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "invalid-character-after-attribute-name"})
-            self.currentToken["data"].append([data, ""])
+            self.parseError("invalid-character-after-attribute-name")
+            self.currentToken["data"].append([[data], []])
             self.state = self.attributeNameState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-end-of-tag-but-got-eof"})
+            self.parseError("expected-end-of-tag-but-got-eof")
             self.state = self.dataState
         else:
-            self.currentToken["data"].append([data, ""])
+            self.currentToken["data"].append([[data], []])
             self.state = self.attributeNameState
         return True
 
@@ -971,32 +1379,33 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             self.stream.charsUntil(spaceCharacters, True)
         elif data == "\"":
+            self.currentToken["data"][-1][1].append(
+                self.stream.matchChars(doubleQuotedValueRun))
             self.state = self.attributeValueDoubleQuotedState
         elif data == "&":
             self.state = self.attributeValueUnQuotedState
             self.stream.unget(data)
         elif data == "'":
+            self.currentToken["data"][-1][1].append(
+                self.stream.matchChars(singleQuotedValueRun))
             self.state = self.attributeValueSingleQuotedState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-attribute-value-but-got-right-bracket"})
+            self.parseError("expected-attribute-value-but-got-right-bracket")
             self.emitCurrentToken()
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"][-1][1] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"][-1][1].append("\uFFFD")
             self.state = self.attributeValueUnQuotedState
         elif data in ("=", "<", "`"):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "equals-in-unquoted-attribute-value"})
-            self.currentToken["data"][-1][1] += data
+            self.parseError("equals-in-unquoted-attribute-value")
+            self.currentToken["data"][-1][1].append(data)
             self.state = self.attributeValueUnQuotedState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-attribute-value-but-got-eof"})
+            self.parseError("expected-attribute-value-but-got-eof")
             self.state = self.dataState
         else:
-            self.currentToken["data"][-1][1] += data
+            self.currentToken["data"][-1][1].append(
+                data + self.stream.matchChars(unquotedValueRun))
             self.state = self.attributeValueUnQuotedState
         return True
 
@@ -1007,16 +1416,14 @@ class HTMLTokenizer(object):
         elif data == "&":
             self.processEntityInAttribute('"')
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"][-1][1] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"][-1][1].append("\uFFFD")
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-attribute-value-double-quote"})
+            self.parseError("eof-in-attribute-value-double-quote")
             self.state = self.dataState
         else:
-            self.currentToken["data"][-1][1] += data +\
-                self.stream.charsUntil(("\"", "&", "\u0000"))
+            self.currentToken["data"][-1][1].append(
+                data + self.stream.matchChars(doubleQuotedValueRun))
         return True
 
     def attributeValueSingleQuotedState(self):
@@ -1026,16 +1433,14 @@ class HTMLTokenizer(object):
         elif data == "&":
             self.processEntityInAttribute("'")
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"][-1][1] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"][-1][1].append("\uFFFD")
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-attribute-value-single-quote"})
+            self.parseError("eof-in-attribute-value-single-quote")
             self.state = self.dataState
         else:
-            self.currentToken["data"][-1][1] += data +\
-                self.stream.charsUntil(("'", "&", "\u0000"))
+            self.currentToken["data"][-1][1].append(
+                data + self.stream.matchChars(singleQuotedValueRun))
         return True
 
     def attributeValueUnQuotedState(self):
@@ -1047,20 +1452,17 @@ class HTMLTokenizer(object):
         elif data == ">":
             self.emitCurrentToken()
         elif data in ('"', "'", "=", "<", "`"):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-character-in-unquoted-attribute-value"})
-            self.currentToken["data"][-1][1] += data
+            self.parseError("unexpected-character-in-unquoted-attribute-value")
+            self.currentToken["data"][-1][1].append(data)
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"][-1][1] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"][-1][1].append("\uFFFD")
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-attribute-value-no-quotes"})
+            self.parseError("eof-in-attribute-value-no-quotes")
             self.state = self.dataState
         else:
-            self.currentToken["data"][-1][1] += data + self.stream.charsUntil(
-                frozenset(("&", ">", '"', "'", "=", "<", "`", "\u0000")) | spaceCharacters)
+            self.currentToken["data"][-1][1].append(
+                data + self.stream.matchChars(unquotedValueRun))
         return True
 
     def afterAttributeValueState(self):
@@ -1072,13 +1474,11 @@ class HTMLTokenizer(object):
         elif data == "/":
             self.state = self.selfClosingStartTagState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-EOF-after-attribute-value"})
+            self.parseError("unexpected-EOF-after-attribute-value")
             self.stream.unget(data)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-character-after-attribute-value"})
+            self.parseError("unexpected-character-after-attribute-value")
             self.stream.unget(data)
             self.state = self.beforeAttributeNameState
         return True
@@ -1089,14 +1489,11 @@ class HTMLTokenizer(object):
             self.currentToken["selfClosing"] = True
             self.emitCurrentToken()
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data":
-                                    "unexpected-EOF-after-solidus-in-tag"})
+            self.parseError("unexpected-EOF-after-solidus-in-tag")
             self.stream.unget(data)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-character-after-solidus-in-tag"})
+            self.parseError("unexpected-character-after-solidus-in-tag")
             self.stream.unget(data)
             self.state = self.beforeAttributeNameState
         return True
@@ -1104,60 +1501,46 @@ class HTMLTokenizer(object):
     def bogusCommentState(self):
         # Make a new comment token and give it as value all the characters
         # until the first > or EOF (charsUntil checks for EOF automatically)
-        # and emit it.
-        data = self.stream.charsUntil(">")
-        data = data.replace("\u0000", "\uFFFD")
-        self.tokenQueue.append(
-            {"type": tokenTypes["Comment"], "data": data})
+        # and emit it. They are read a run at a time by
+        # bogusCommentDataState.
+        self.currentToken = {"type": CommentToken, "data": []}
+        self.state = self.bogusCommentDataState
+        return True
 
-        # Eat the character directly after the bogus comment which is either a
-        # ">" or an EOF.
-        self.stream.char()
-        self.state = self.dataState
+    def bogusCommentDataState(self):
+        data = self.stream.charsUntil(">")
+        if data:
+            self.currentToken["data"].append(data.replace("\u0000", "\uFFFD"))
+        else:
+            # Eat the character directly after the bogus comment which is
+            # either a ">" or an EOF.
+            self.stream.char()
+            self.emitCurrentToken()
         return True
 
     def markupDeclarationOpenState(self):
-        charStack = [self.stream.char()]
-        if charStack[-1] == "-":
-            charStack.append(self.stream.char())
-            if charStack[-1] == "-":
-                self.currentToken = {"type": tokenTypes["Comment"], "data": ""}
-                self.state = self.commentStartState
-                return True
-        elif charStack[-1] in ('d', 'D'):
-            matched = True
-            for expected in (('o', 'O'), ('c', 'C'), ('t', 'T'),
-                             ('y', 'Y'), ('p', 'P'), ('e', 'E')):
-                charStack.append(self.stream.char())
-                if charStack[-1] not in expected:
-                    matched = False
-                    break
-            if matched:
-                self.currentToken = {"type": tokenTypes["Doctype"],
-                                     "name": "",
-                                     "publicId": None, "systemId": None,
-                                     "correct": True}
-                self.state = self.doctypeState
-                return True
-        elif (charStack[-1] == "[" and
-              self.parser is not None and
+        if self.stream.startswith("--"):
+            self.stream.consume(2)
+            self.currentToken = {"type": CommentToken, "data": []}
+            self.state = self.commentStartState
+            return True
+        elif self.stream.startswith("doctype", True):
+            self.stream.consume(7)
+            self.currentToken = {"type": DoctypeToken,
+                                 "name": "",
+                                 "publicId": None, "systemId": None,
+                                 "correct": True}
+            self.state = self.doctypeState
+            return True
+        elif (self.parser is not None and
               self.parser.tree.openElements and
-              self.parser.tree.openElements[-1].namespace != self.parser.tree.defaultNamespace):
-            matched = True
-            for expected in ["C", "D", "A", "T", "A", "["]:
-                charStack.append(self.stream.char())
-                if charStack[-1] != expected:
-                    matched = False
-                    break
-            if matched:
-                self.state = self.cdataSectionState
-                return True
-
-        self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                "expected-dashes-or-doctype"})
+              self.parser.tree.openElements[-1].namespace != self.parser.tree.defaultNamespace and
+              self.stream.startswith("[CDATA[")):
+            self.stream.consume(7)
+            self.state = self.cdataSectionState
+            return True
 
-        while charStack:
-            self.stream.unget(charStack.pop())
+        self.parseError("expected-dashes-or-doctype")
         self.state = self.bogusCommentState
         return True
 
@@ -1166,21 +1549,16 @@ class HTMLTokenizer(object):
         if data == "-":
             self.state = self.commentStartDashState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("\uFFFD")
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "incorrect-comment"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("incorrect-comment")
+            self.emitCurrentToken()
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-comment"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment")
+            self.emitCurrentToken()
         else:
-            self.currentToken["data"] += data
+            self.currentToken["data"].append(data)
             self.state = self.commentState
         return True
 
@@ -1189,21 +1567,16 @@ class HTMLTokenizer(object):
         if data == "-":
             self.state = self.commentEndState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "-\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("-\uFFFD")
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "incorrect-comment"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("incorrect-comment")
+            self.emitCurrentToken()
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-comment"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment")
+            self.emitCurrentToken()
         else:
-            self.currentToken["data"] += "-" + data
+            self.currentToken["data"].append("-" + data)
             self.state = self.commentState
         return True
 
@@ -1212,17 +1585,14 @@ class HTMLTokenizer(object):
         if data == "-":
             self.state = self.commentEndDashState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("\uFFFD")
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "eof-in-comment"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment")
+            self.emitCurrentToken()
         else:
-            self.currentToken["data"] += data + \
-                self.stream.charsUntil(("-", "\u0000"))
+            self.currentToken["data"].append(
+                data + self.stream.charsUntilMatch(commentTextEnd, 2))
         return True
 
     def commentEndDashState(self):
@@ -1230,71 +1600,57 @@ class HTMLTokenizer(object):
         if data == "-":
             self.state = self.commentEndState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "-\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("-\uFFFD")
             self.state = self.commentState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-comment-end-dash"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment-end-dash")
+            self.emitCurrentToken()
         else:
-            self.currentToken["data"] += "-" + data
+            self.currentToken["data"].append("-" + data)
             self.state = self.commentState
         return True
 
     def commentEndState(self):
         data = self.stream.char()
         if data == ">":
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.emitCurrentToken()
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "--\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("--\uFFFD")
             self.state = self.commentState
         elif data == "!":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-bang-after-double-dash-in-comment"})
+            self.parseError("unexpected-bang-after-double-dash-in-comment")
             self.state = self.commentEndBangState
         elif data == "-":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-dash-after-double-dash-in-comment"})
-            self.currentToken["data"] += data
+            self.parseError("unexpected-dash-after-double-dash-in-comment")
+            self.currentToken["data"].append(data)
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-comment-double-dash"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment-double-dash")
+            self.emitCurrentToken()
         else:
             # XXX
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-comment"})
-            self.currentToken["data"] += "--" + data
+            self.parseError("unexpected-char-in-comment")
+            self.currentToken["data"].append("--" + data)
             self.state = self.commentState
         return True
 
     def commentEndBangState(self):
         data = self.stream.char()
         if data == ">":
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.emitCurrentToken()
         elif data == "-":
-            self.currentToken["data"] += "--!"
+            self.currentToken["data"].append("--!")
             self.state = self.commentEndDashState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
-            self.currentToken["data"] += "--!\uFFFD"
+            self.parseError("invalid-codepoint")
+            self.currentToken["data"].append("--!\uFFFD")
             self.state = self.commentState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-comment-end-bang-state"})
-            self.tokenQueue.append(self.currentToken)
-            self.state = self.dataState
+            self.parseError("eof-in-comment-end-bang-state")
+            self.emitCurrentToken()
         else:
-            self.currentToken["data"] += "--!" + data
+            self.currentToken["data"].append("--!" + data)
             self.state = self.commentState
         return True
 
@@ -1303,14 +1659,12 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             self.state = self.beforeDoctypeNameState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-doctype-name-but-got-eof"})
+            self.parseError("expected-doctype-name-but-got-eof")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "need-space-after-doctype"})
+            self.parseError("need-space-after-doctype")
             self.stream.unget(data)
             self.state = self.beforeDoctypeNameState
         return True
@@ -1320,19 +1674,16 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             pass
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-doctype-name-but-got-right-bracket"})
+            self.parseError("expected-doctype-name-but-got-right-bracket")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["name"] = "\uFFFD"
             self.state = self.doctypeNameState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-doctype-name-but-got-eof"})
+            self.parseError("expected-doctype-name-but-got-eof")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1351,13 +1702,11 @@ class HTMLTokenizer(object):
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["name"] += "\uFFFD"
             self.state = self.doctypeNameState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype-name"})
+            self.parseError("eof-in-doctype-name")
             self.currentToken["correct"] = False
             self.currentToken["name"] = self.currentToken["name"].translate(asciiUpper2Lower)
             self.tokenQueue.append(self.currentToken)
@@ -1376,42 +1725,21 @@ class HTMLTokenizer(object):
         elif data is EOF:
             self.currentToken["correct"] = False
             self.stream.unget(data)
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            if data in ("p", "P"):
-                matched = True
-                for expected in (("u", "U"), ("b", "B"), ("l", "L"),
-                                 ("i", "I"), ("c", "C")):
-                    data = self.stream.char()
-                    if data not in expected:
-                        matched = False
-                        break
-                if matched:
-                    self.state = self.afterDoctypePublicKeywordState
-                    return True
-            elif data in ("s", "S"):
-                matched = True
-                for expected in (("y", "Y"), ("s", "S"), ("t", "T"),
-                                 ("e", "E"), ("m", "M")):
-                    data = self.stream.char()
-                    if data not in expected:
-                        matched = False
-                        break
-                if matched:
-                    self.state = self.afterDoctypeSystemKeywordState
-                    return True
-
-            # All the characters read before the current 'data' will be
-            # [a-zA-Z], so they're garbage in the bogus doctype and can be
-            # discarded; only the latest character might be '>' or EOF
-            # and needs to be ungetted
+            if data in ("p", "P") and self.stream.startswith("ublic", True):
+                self.stream.consume(5)
+                self.state = self.afterDoctypePublicKeywordState
+                return True
+            elif data in ("s", "S") and self.stream.startswith("ystem", True):
+                self.stream.consume(5)
+                self.state = self.afterDoctypeSystemKeywordState
+                return True
+
             self.stream.unget(data)
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "expected-space-or-right-bracket-in-doctype", "datavars":
-                                    {"data": data}})
+            self.parseError("expected-space-or-right-bracket-in-doctype", {"data": data})
             self.currentToken["correct"] = False
             self.state = self.bogusDoctypeState
 
@@ -1422,13 +1750,11 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             self.state = self.beforeDoctypePublicIdentifierState
         elif data in ("'", '"'):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.stream.unget(data)
             self.state = self.beforeDoctypePublicIdentifierState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1448,20 +1774,17 @@ class HTMLTokenizer(object):
             self.currentToken["publicId"] = ""
             self.state = self.doctypePublicIdentifierSingleQuotedState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-end-of-doctype"})
+            self.parseError("unexpected-end-of-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["correct"] = False
             self.state = self.bogusDoctypeState
         return True
@@ -1471,18 +1794,15 @@ class HTMLTokenizer(object):
         if data == "\"":
             self.state = self.afterDoctypePublicIdentifierState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["publicId"] += "\uFFFD"
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-end-of-doctype"})
+            self.parseError("unexpected-end-of-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1495,18 +1815,15 @@ class HTMLTokenizer(object):
         if data == "'":
             self.state = self.afterDoctypePublicIdentifierState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["publicId"] += "\uFFFD"
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-end-of-doctype"})
+            self.parseError("unexpected-end-of-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1522,24 +1839,20 @@ class HTMLTokenizer(object):
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data == '"':
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["systemId"] = ""
             self.state = self.doctypeSystemIdentifierDoubleQuotedState
         elif data == "'":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["systemId"] = ""
             self.state = self.doctypeSystemIdentifierSingleQuotedState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["correct"] = False
             self.state = self.bogusDoctypeState
         return True
@@ -1558,14 +1871,12 @@ class HTMLTokenizer(object):
             self.currentToken["systemId"] = ""
             self.state = self.doctypeSystemIdentifierSingleQuotedState
         elif data == EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["correct"] = False
             self.state = self.bogusDoctypeState
         return True
@@ -1575,13 +1886,11 @@ class HTMLTokenizer(object):
         if data in spaceCharacters:
             self.state = self.beforeDoctypeSystemIdentifierState
         elif data in ("'", '"'):
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.stream.unget(data)
             self.state = self.beforeDoctypeSystemIdentifierState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1601,20 +1910,17 @@ class HTMLTokenizer(object):
             self.currentToken["systemId"] = ""
             self.state = self.doctypeSystemIdentifierSingleQuotedState
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.currentToken["correct"] = False
             self.state = self.bogusDoctypeState
         return True
@@ -1624,18 +1930,15 @@ class HTMLTokenizer(object):
         if data == "\"":
             self.state = self.afterDoctypeSystemIdentifierState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["systemId"] += "\uFFFD"
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-end-of-doctype"})
+            self.parseError("unexpected-end-of-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1648,18 +1951,15 @@ class HTMLTokenizer(object):
         if data == "'":
             self.state = self.afterDoctypeSystemIdentifierState
         elif data == "\u0000":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                    "data": "invalid-codepoint"})
+            self.parseError("invalid-codepoint")
             self.currentToken["systemId"] += "\uFFFD"
         elif data == ">":
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-end-of-doctype"})
+            self.parseError("unexpected-end-of-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
@@ -1675,14 +1975,12 @@ class HTMLTokenizer(object):
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         elif data is EOF:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "eof-in-doctype"})
+            self.parseError("eof-in-doctype")
             self.currentToken["correct"] = False
             self.tokenQueue.append(self.currentToken)
             self.state = self.dataState
         else:
-            self.tokenQueue.append({"type": tokenTypes["ParseError"], "data":
-                                    "unexpected-char-in-doctype"})
+            self.parseError("unexpected-char-in-doctype")
             self.state = self.bogusDoctypeState
         return True
 
@@ -1701,31 +1999,35 @@ class HTMLTokenizer(object):
         return True
 
     def cdataSectionState(self):
-        data = []
-        while True:
-            data.append(self.stream.charsUntil("]"))
-            data.append(self.stream.charsUntil(">"))
-            char = self.stream.char()
-            if char == EOF:
-                break
-            else:
-                assert char == ">"
-                if data[-1][-2:] == "]]":
-                    data[-1] = data[-1][:-2]
-                    break
-                else:
-                    data.append(char)
+        # The text is read a run at a time, up to each "]", by
+        # cdataSectionDataState
+        self.currentToken = {"type": CharactersToken, "data": []}
+        self.state = self.cdataSectionDataState
+        return True
+
+    def cdataSectionDataState(self):
+        data = self.stream.charsUntil("]")
+        if data:
+            self.currentToken["data"].append(data)
+            return True
+        char = self.stream.char()
+        if char is EOF:
+            pass
+        elif self.stream.startswith("]>"):
+            self.stream.consume(2)
+        else:
+            self.currentToken["data"].append(char)
+            return True
 
-        data = "".join(data)
+        data = "".join(self.currentToken["data"])
         # Deal with null here rather than in the parser
         nullCount = data.count("\u0000")
         if nullCount > 0:
             for i in range(nullCount):
-                self.tokenQueue.append({"type": tokenTypes["ParseError"],
-                                        "data": "invalid-codepoint"})
+                self.parseError("invalid-codepoint")
             data = data.replace("\u0000", "\uFFFD")
         if data:
-            self.tokenQueue.append({"type": tokenTypes["Characters"],
+            self.tokenQueue.append({"type": CharactersToken,
                                     "data": data})
         self.state = self.dataState
         return True
@@ -1,12 +1,46 @@
 from __future__ import absolute_import, division, unicode_literals
 
+import os
+
 from .py import Trie as PyTrie
+from .dafsa import Trie as DAFSATrie
 
 Trie = PyTrie
 
+# The trie implementations available, by name
+trieBackends = {
+    "py": PyTrie,
+    "dafsa": DAFSATrie,
+}
+
 try:
     from .datrie import Trie as DATrie
 except ImportError:
     pass
 else:
     Trie = DATrie
+    trieBackends["datrie"] = DATrie
+
+defaultBackend = "dafsa"
+
+
+def getTrieBackend(name=None):
+    """Get a Trie class by the name of its backend
+
+    name - the name of the backend (case-insensitive). Supported values are:
+           "dafsa" - a minimal automaton of the keys, in pure Python
+           "py" - a sorted list of the keys searched with bisect
+           "datrie" - a double-array trie, from the datrie package
+           "calibrated" - whichever of these calibration.calibrate
+                          measures to be fastest on this interpreter
+           If name isn't given, the HTML5LIB_TRIE environment variable is
+           used, or defaultBackend if that isn't set either."""
+    if name is None:
+        name = os.environ.get("HTML5LIB_TRIE") or defaultBackend
+    name = name.lower()
+    if name == "calibrated":
+        from .calibration import calibrate
+        name = calibrate()
+    if name not in trieBackends:
+        raise ValueError("""Unrecognised trie backend "%s" """ % name)
+    return trieBackends[name]
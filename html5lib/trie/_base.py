@@ -35,3 +35,18 @@ class Trie(Mapping):
     def longest_prefix_item(self, prefix):
         lprefix = self.longest_prefix(prefix)
         return (lprefix, self[lprefix])
+
+    def match_longest(self, chars, read):
+        """Append characters from read() to the list chars until they
+        aren't the start of any key, or read() returns None at the end of
+        the input, and return the length of the longest key the characters
+        start with (0 if there is none)"""
+        while chars[-1] is not None:
+            if not self.has_keys_with_prefix("".join(chars)):
+                break
+            chars.append(read())
+
+        try:
+            return len(self.longest_prefix("".join(chars[:-1])))
+        except KeyError:
+            return 0
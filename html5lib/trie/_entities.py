@@ -0,0 +1,2325 @@
+"""The automaton matching the names in constants.entities, built by
+utils/entities.py so that it doesn't need building at run time
+
+It is kept as JSON because, without a .pyc file, compiling the same lists
+written in Python would take longer than building the automaton."""
+from __future__ import absolute_import, division, unicode_literals
+
+import json
+
+transitions = json.loads("""[
+    {"A": 52, "B": 79, "C": 202, "D": 331, "E": 381, "F": 395, "G": 427,
+     "H": 462, "I": 493, "J": 498, "K": 502, "L": 588, "M": 600, "N": 724,
+     "O": 754, "P": 783, "Q": 786, "R": 829, "S": 865, "T": 882, "U": 905,
+     "V": 923, "W": 926, "X": 927, "Y": 929, "Z": 937, "a": 970, "b": 1084,
+     "c": 1172, "d": 1249, "e": 1306, "f": 1334, "g": 1375, "h": 1401,
+     "i": 1434, "j": 1436, "k": 1441, "l": 1568, "m": 1602, "n": 1703,
+     "o": 1729, "p": 1776, "q": 1784, "r": 1828, "s": 1903, "t": 1941,
+     "u": 1958, "v": 1999, "w": 2005, "x": 2011, "y": 2015, "z": 2019},
+    {},
+    {";": 1},
+    {"g": 2},
+    {"i": 3},
+    {"l": 4},
+    {"P": 2},
+    {"e": 2},
+    {"t": 7},
+    {"u": 8},
+    {"c": 9},
+    {";": 1},
+    {"e": 11},
+    {"v": 12},
+    {"e": 13},
+    {"r": 14},
+    {"c": 2},
+    {"r": 16},
+    {"i": 17, "y": 11},
+    {"r": 11},
+    {"v": 7},
+    {"a": 20},
+    {"r": 21},
+    {"a": 11},
+    {"h": 23},
+    {"p": 24},
+    {"c": 19},
+    {"a": 26},
+    {"d": 11},
+    {"n": 11},
+    {"o": 29},
+    {"f": 11},
+    {"g": 30, "p": 31},
+    {"i": 30},
+    {"t": 33},
+    {"c": 34},
+    {"n": 35},
+    {"u": 36},
+    {"F": 37},
+    {"y": 38},
+    {"l": 39},
+    {"p": 40},
+    {"n": 3},
+    {"i": 42},
+    {"g": 29},
+    {"i": 44},
+    {"c": 19, "s": 45},
+    {"d": 7},
+    {"l": 47},
+    {"i": 48},
+    {"l": 2},
+    {"m": 50},
+    {"E": 5, "M": 6, "a": 10, "b": 15, "c": 18, "f": 19, "g": 22, "l": 25,
+     "m": 27, "n": 28, "o": 32, "p": 41, "r": 43, "s": 46, "t": 49, "u": 51},
+    {"h": 11},
+    {"s": 53},
+    {"a": 54},
+    {"l": 55},
+    {"s": 56},
+    {"k": 57},
+    {"e": 28},
+    {"v": 11, "w": 59},
+    {"c": 58, "r": 60},
+    {"y": 11},
+    {"s": 12},
+    {"u": 63},
+    {"a": 64},
+    {"s": 11},
+    {"i": 66},
+    {"l": 67},
+    {"l": 68},
+    {"u": 69},
+    {"o": 70},
+    {"n": 71},
+    {"c": 65, "r": 72, "t": 23},
+    {"p": 31},
+    {"q": 11},
+    {"e": 75},
+    {"p": 76},
+    {"m": 77},
+    {"a": 61, "c": 62, "e": 73, "f": 19, "o": 74, "r": 14, "s": 26, "u": 78},
+    {"c": 62},
+    {"Y": 2},
+    {"P": 81},
+    {"t": 12},
+    {"u": 83},
+    {"D": 11},
+    {"l": 85},
+    {"a": 86},
+    {"i": 87},
+    {"t": 88},
+    {"n": 89},
+    {"e": 90},
+    {"r": 91},
+    {"e": 92},
+    {"f": 93},
+    {"f": 94},
+    {"i": 95},
+    {"D": 96},
+    {"l": 97},
+    {"a": 98},
+    {"t": 99},
+    {";": 1, "i": 100},
+    {"y": 66},
+    {"e": 102},
+    {"l": 103},
+    {"c": 84, "p": 101, "y": 104},
+    {"r": 30},
+    {"i": 50},
+    {"d": 107},
+    {"c": 11},
+    {"r": 109},
+    {"t": 11},
+    {"n": 111},
+    {"i": 112},
+    {"n": 113},
+    {"a": 106, "e": 108, "i": 110, "o": 114},
+    {"o": 111},
+    {"l": 23},
+    {"l": 117},
+    {"i": 118},
+    {"D": 116},
+    {"r": 120},
+    {"e": 121},
+    {"t": 122},
+    {"d": 119, "n": 123},
+    {"i": 11},
+    {"u": 66},
+    {"n": 126},
+    {"i": 127},
+    {"l": 126},
+    {"e": 66},
+    {"m": 130},
+    {"i": 131},
+    {"D": 116, "M": 128, "P": 129, "T": 132},
+    {"e": 133},
+    {"l": 134},
+    {"c": 135},
+    {"r": 136},
+    {"l": 11},
+    {"a": 138},
+    {"r": 139},
+    {"g": 140},
+    {"e": 141},
+    {"t": 142},
+    {"n": 143},
+    {"I": 144},
+    {"r": 145},
+    {"u": 146},
+    {"o": 147},
+    {"t": 148},
+    {"n": 149},
+    {"o": 150},
+    {"C": 151},
+    {"e": 152},
+    {"s": 153},
+    {"i": 154},
+    {"w": 155},
+    {"k": 156},
+    {"o": 83},
+    {"u": 158},
+    {"Q": 159},
+    {"e": 160},
+    {"l": 161},
+    {"b": 162},
+    {"u": 163},
+    {"o": 164},
+    {"D": 165, "Q": 159},
+    {"y": 166},
+    {"l": 167},
+    {"r": 168},
+    {"u": 169},
+    {"C": 170},
+    {"e": 171},
+    {"c": 157, "s": 172},
+    {"o": 173},
+    {";": 1, "e": 11},
+    {"n": 175},
+    {"o": 176},
+    {"e": 112},
+    {"u": 178},
+    {"r": 179},
+    {"g": 180, "i": 112, "t": 148},
+    {"c": 111},
+    {"u": 182},
+    {"d": 183},
+    {"o": 184},
+    {"f": 11, "r": 185},
+    {"c": 157},
+    {"o": 187},
+    {"l": 188},
+    {"C": 189},
+    {"r": 190},
+    {"e": 191},
+    {"t": 192},
+    {"n": 193},
+    {"l": 177, "n": 181, "p": 186, "u": 194},
+    {"s": 66},
+    {"o": 196},
+    {"p": 11},
+    {"a": 198},
+    {";": 1, "C": 199},
+    {"p": 200},
+    {"H": 80, "O": 82, "a": 105, "c": 115, "d": 116, "e": 124, "f": 19,
+     "h": 125, "i": 137, "l": 174, "o": 195, "r": 197, "s": 26, "u": 201},
+    {"h": 28},
+    {"a": 203},
+    {"r": 204},
+    {"t": 205},
+    {";": 1, "o": 206},
+    {"e": 19},
+    {"g": 208},
+    {"v": 11},
+    {"h": 210},
+    {"g": 209, "r": 19, "s": 211},
+    {"a": 106, "y": 11},
+    {";": 1, "t": 23},
+    {"l": 214},
+    {"c": 84},
+    {"A": 216},
+    {"e": 217},
+    {"l": 218},
+    {"b": 219},
+    {"t": 11, "u": 220},
+    {"o": 221},
+    {"a": 13},
+    {"r": 223},
+    {"d": 12},
+    {"l": 225},
+    {"i": 226},
+    {"A": 216, "D": 222, "G": 224, "T": 227},
+    {"l": 228},
+    {"a": 229},
+    {"c": 230},
+    {"i": 231},
+    {"t": 232},
+    {"i": 233},
+    {"r": 234},
+    {"n": 28},
+    {"o": 236},
+    {"c": 235, "m": 237},
+    {"a": 238, "f": 94},
+    {"u": 139},
+    {"q": 240},
+    {";": 1, "D": 116, "E": 241},
+    {"w": 11},
+    {"o": 243},
+    {"r": 244},
+    {"r": 245},
+    {"A": 246},
+    {"n": 247},
+    {"t": 11, "w": 248},
+    {"o": 249},
+    {"t": 247},
+    {"h": 251},
+    {"g": 252},
+    {"i": 253},
+    {"e": 12},
+    {"A": 246, "R": 254, "T": 255},
+    {"t": 256},
+    {"f": 257},
+    {"A": 246, "R": 254},
+    {"t": 259},
+    {"f": 260},
+    {"e": 261},
+    {"L": 262, "R": 254},
+    {"g": 263},
+    {"n": 264},
+    {"e": 258, "o": 265},
+    {"A": 246, "T": 255},
+    {"t": 267},
+    {"h": 268},
+    {"g": 269},
+    {"i": 270},
+    {"w": 248},
+    {"o": 272},
+    {"A": 246, "D": 273},
+    {"p": 274},
+    {"a": 19},
+    {"B": 276},
+    {"l": 277},
+    {"a": 278},
+    {"c": 279},
+    {"i": 280},
+    {"t": 281},
+    {"r": 282},
+    {"e": 283},
+    {"C": 151, "D": 250, "L": 266, "R": 271, "U": 275, "V": 284},
+    {"e": 285},
+    {"l": 286},
+    {"b": 287},
+    {"p": 247},
+    {";": 1, "B": 276, "U": 289},
+    {"w": 290},
+    {"o": 291},
+    {"r": 292},
+    {"r": 293},
+    {"o": 19},
+    {"t": 295},
+    {"c": 296},
+    {"e": 297},
+    {"V": 298},
+    {"t": 299},
+    {"h": 300},
+    {"g": 301},
+    {"i": 302},
+    {"e": 299},
+    {"e": 304},
+    {";": 1, "B": 276},
+    {"r": 306},
+    {"o": 307},
+    {"t": 308},
+    {"c": 309},
+    {"e": 310},
+    {"R": 303, "T": 305, "V": 311},
+    {"t": 312},
+    {"f": 313},
+    {"e": 314},
+    {"T": 305, "V": 311},
+    {"t": 316},
+    {"h": 317},
+    {"g": 318},
+    {"i": 319},
+    {";": 1, "A": 246},
+    {"e": 321},
+    {"e": 322},
+    {"A": 294, "B": 15, "L": 315, "R": 320, "T": 323, "a": 246},
+    {"n": 324},
+    {"p": 31, "t": 242, "u": 288, "w": 325},
+    {"k": 11},
+    {"o": 327},
+    {"r": 328},
+    {"c": 19, "t": 329},
+    {"D": 207, "J": 80, "S": 80, "Z": 80, "a": 212, "c": 213, "e": 215,
+     "f": 19, "i": 239, "o": 326, "s": 330},
+    {"G": 11},
+    {"H": 2},
+    {"a": 106, "i": 17, "y": 11},
+    {"m": 178},
+    {"e": 335},
+    {"r": 12},
+    {"a": 337},
+    {"u": 338},
+    {"q": 339},
+    {"S": 340},
+    {"l": 341},
+    {"l": 342},
+    {"a": 343},
+    {"m": 344},
+    {"S": 345},
+    {"y": 346},
+    {"r": 347},
+    {"e": 348},
+    {"S": 345, "V": 349},
+    {"y": 350},
+    {"t": 351},
+    {"a": 26, "p": 352},
+    {"l": 30},
+    {"i": 354},
+    {"s": 355},
+    {";": 1, "T": 227},
+    {"l": 357},
+    {"m": 11},
+    {"u": 359},
+    {"i": 360},
+    {"r": 361},
+    {"b": 362},
+    {"i": 363},
+    {"l": 364},
+    {"a": 358, "i": 365},
+    {"u": 366},
+    {"c": 19, "i": 359},
+    {"t": 66},
+    {"s": 369},
+    {"E": 11},
+    {"l": 371},
+    {"a": 372},
+    {"i": 373},
+    {"t": 374},
+    {"n": 375},
+    {"e": 376},
+    {"n": 377},
+    {"o": 378},
+    {"i": 370, "p": 379},
+    {"N": 332, "T": 333, "a": 10, "c": 334, "d": 116, "f": 19, "g": 22,
+     "l": 336, "m": 353, "o": 32, "p": 356, "q": 367, "s": 368, "t": 23,
+     "u": 51, "x": 380},
+    {"d": 350},
+    {"e": 382},
+    {"l": 383},
+    {"l": 384},
+    {"l": 138},
+    {"A": 386},
+    {"r": 31},
+    {"t": 388},
+    {"r": 389},
+    {"e": 390},
+    {"i": 391},
+    {"r": 392},
+    {"p": 31, "r": 387, "u": 393},
+    {"c": 62, "f": 19, "i": 385, "o": 394, "s": 26},
+    {";": 1, "d": 11},
+    {"a": 396},
+    {"m": 397},
+    {"m": 398},
+    {"i": 138},
+    {"d": 400},
+    {"e": 401, "i": 110, "y": 11},
+    {"e": 196},
+    {";": 1, "L": 403},
+    {"l": 404},
+    {"a": 405},
+    {"u": 406},
+    {"q": 407},
+    {"E": 241},
+    {"l": 409},
+    {"l": 410},
+    {"u": 411},
+    {"t": 208},
+    {"a": 413},
+    {"e": 414},
+    {"r": 415},
+    {"t": 409},
+    {"n": 417},
+    {"a": 418},
+    {"l": 419},
+    {"E": 408, "F": 412, "G": 416, "L": 403, "S": 420, "T": 227},
+    {"r": 421},
+    {"e": 422},
+    {"t": 423},
+    {"a": 424},
+    {"e": 425},
+    {"J": 80, "T": 2, "a": 399, "b": 15, "c": 402, "d": 116, "f": 19, "g": 11,
+     "o": 74, "r": 426, "s": 26, "t": 11},
+    {"D": 80},
+    {"R": 428},
+    {"e": 327},
+    {"c": 430, "t": 11},
+    {"i": 110},
+    {"c": 12},
+    {"a": 433},
+    {"p": 434},
+    {"S": 435},
+    {"t": 436},
+    {"r": 437},
+    {"e": 438},
+    {"b": 439},
+    {"l": 440},
+    {"n": 12},
+    {"i": 442},
+    {"L": 443},
+    {"l": 444},
+    {"a": 445},
+    {"t": 446},
+    {"n": 447},
+    {"o": 448},
+    {"z": 449},
+    {"i": 450},
+    {"p": 31, "r": 451},
+    {"m": 198},
+    {"u": 453},
+    {"H": 454},
+    {"n": 455},
+    {"w": 456},
+    {"o": 457},
+    {"D": 458, "E": 241},
+    {"p": 459},
+    {"m": 460},
+    {"A": 429, "a": 431, "c": 432, "f": 19, "i": 441, "o": 452, "s": 330,
+     "u": 461},
+    {"g": 11},
+    {"i": 463},
+    {"l": 464},
+    {"I": 11},
+    {"y": 466},
+    {"r": 467},
+    {"a": 468},
+    {"n": 469},
+    {"i": 470},
+    {"c": 19, "g": 471},
+    {"i": 130},
+    {"l": 473},
+    {";": 1, "a": 472, "p": 474},
+    {"e": 35},
+    {"s": 476},
+    {"g": 140, "r": 477},
+    {";": 1, "e": 478},
+    {"m": 23},
+    {"m": 480},
+    {"o": 481},
+    {"C": 482, "T": 132},
+    {"e": 483},
+    {"l": 484},
+    {"b": 485},
+    {"i": 486},
+    {"s": 487},
+    {"i": 488},
+    {"t": 479, "v": 489},
+    {"g": 30, "p": 31, "t": 23},
+    {"k": 80, "m": 50},
+    {"E": 80, "J": 465, "O": 80, "a": 10, "c": 18, "d": 116, "f": 19, "g": 22,
+     "m": 475, "n": 490, "o": 491, "s": 26, "t": 227, "u": 492},
+    {"i": 110, "y": 11},
+    {"r": 80},
+    {"c": 19, "e": 495},
+    {"k": 80},
+    {"c": 494, "f": 19, "o": 74, "s": 496, "u": 497},
+    {"p": 23},
+    {"p": 499},
+    {"e": 401, "y": 11},
+    {"H": 80, "J": 80, "a": 500, "c": 501, "f": 19, "o": 74, "s": 26},
+    {"d": 23},
+    {"b": 503},
+    {"e": 389},
+    {"c": 505},
+    {"a": 506},
+    {"l": 507},
+    {"c": 84, "m": 504, "n": 463, "p": 508, "r": 19},
+    {"a": 106, "e": 401, "y": 11},
+    {"e": 111},
+    {"k": 511},
+    {"c": 512},
+    {"a": 513},
+    {"r": 514},
+    {"B": 515},
+    {"e": 516},
+    {"l": 517},
+    {"g": 518},
+    {";": 1, "B": 276, "R": 254},
+    {"w": 520},
+    {"o": 521},
+    {"r": 522},
+    {"n": 519, "r": 523},
+    {"n": 463},
+    {"i": 525},
+    {"l": 526},
+    {"i": 527},
+    {"e": 528},
+    {"b": 518},
+    {"n": 316},
+    {"u": 530, "w": 531},
+    {"o": 532},
+    {"o": 295},
+    {"l": 534},
+    {"A": 246, "V": 298},
+    {"t": 536},
+    {"h": 537},
+    {"g": 538},
+    {"i": 539},
+    {";": 1, "A": 246, "V": 298},
+    {"e": 541},
+    {";": 1, "B": 276, "E": 241},
+    {"e": 543},
+    {"l": 544},
+    {"g": 545},
+    {"n": 546},
+    {"a": 547},
+    {"i": 548},
+    {"e": 542, "r": 549},
+    {"n": 299},
+    {"w": 551},
+    {"o": 552},
+    {"D": 553, "T": 305, "V": 311},
+    {"p": 554},
+    {"a": 246},
+    {"t": 556},
+    {"h": 557},
+    {"g": 558},
+    {"i": 559},
+    {"A": 524, "C": 529, "D": 533, "F": 535, "R": 540, "T": 550, "U": 555,
+     "V": 311, "a": 246, "r": 560},
+    {"t": 561},
+    {"G": 416},
+    {"l": 563},
+    {"a": 564},
+    {"u": 565},
+    {"q": 566},
+    {"E": 567, "F": 412, "G": 416, "L": 403, "S": 420, "T": 227},
+    {"s": 568},
+    {"f": 562, "s": 569},
+    {"f": 557},
+    {";": 1, "e": 571},
+    {"d": 116},
+    {"i": 573},
+    {"a": 246, "r": 560},
+    {"t": 575},
+    {"f": 576},
+    {"e": 577},
+    {"L": 262, "R": 254, "l": 578, "r": 560},
+    {"g": 579},
+    {"f": 251},
+    {"e": 581},
+    {"L": 582, "R": 254},
+    {"r": 583},
+    {"e": 584},
+    {"n": 580, "p": 31, "w": 585},
+    {"c": 19, "h": 11, "t": 329},
+    {"J": 80, "T": 2, "a": 509, "c": 510, "e": 570, "f": 19, "l": 572,
+     "m": 574, "o": 586, "s": 587, "t": 11},
+    {"m": 436},
+    {"u": 589},
+    {"i": 590},
+    {"n": 389},
+    {"i": 592},
+    {"l": 593},
+    {"d": 591, "l": 594},
+    {"P": 129},
+    {"s": 596},
+    {"u": 597},
+    {"n": 598},
+    {"a": 198, "c": 62, "e": 595, "f": 19, "i": 599, "o": 74, "s": 26,
+     "u": 11},
+    {"d": 591},
+    {"e": 601},
+    {"k": 436},
+    {"c": 603, "n": 436},
+    {"i": 604},
+    {"h": 605},
+    {"n": 436},
+    {"i": 607},
+    {"h": 608},
+    {"T": 609},
+    {"y": 610},
+    {"r": 611},
+    {"e": 612},
+    {"M": 602, "T": 606, "V": 613},
+    {"e": 614},
+    {"v": 615},
+    {"i": 616},
+    {"t": 617},
+    {"a": 618},
+    {"r": 563},
+    {"e": 620},
+    {"t": 621},
+    {"a": 622},
+    {"e": 623},
+    {"r": 624},
+    {"L": 403},
+    {"s": 626},
+    {"s": 627},
+    {"e": 628},
+    {"G": 625, "L": 629},
+    {"d": 630},
+    {"e": 631},
+    {"t": 632},
+    {"g": 619, "s": 633, "w": 444},
+    {"a": 327},
+    {"e": 635},
+    {"r": 636},
+    {"g": 436},
+    {"n": 638},
+    {"i": 639},
+    {"k": 640},
+    {"a": 641},
+    {"e": 642},
+    {"r": 643},
+    {"B": 644},
+    {"g": 180},
+    {"n": 646},
+    {"C": 199},
+    {"p": 648},
+    {"o": 647, "u": 649},
+    {"V": 284},
+    {"e": 651},
+    {"l": 652},
+    {"b": 653},
+    {"u": 654},
+    {"o": 655},
+    {"a": 358},
+    {"u": 657},
+    {"i": 370},
+    {"l": 336, "q": 658, "x": 659},
+    {";": 1, "E": 241, "F": 412, "G": 416, "L": 403, "S": 420, "T": 227},
+    {"r": 661},
+    {"e": 662},
+    {"t": 663},
+    {"a": 664},
+    {"e": 665},
+    {"r": 666},
+    {"u": 461},
+    {"r": 549},
+    {"T": 669},
+    {"t": 670},
+    {";": 1, "E": 241, "G": 416, "L": 403, "S": 420, "T": 227},
+    {"s": 672},
+    {"f": 671, "s": 673},
+    {"e": 674},
+    {"s": 633},
+    {"e": 676},
+    {";": 1, "E": 241, "S": 420},
+    {"s": 678},
+    {"e": 679},
+    {"d": 680},
+    {"e": 681},
+    {"c": 682},
+    {"e": 683},
+    {"r": 684},
+    {"l": 336},
+    {"E": 686},
+    {"e": 687},
+    {"s": 688},
+    {"r": 689},
+    {"e": 690},
+    {"v": 691},
+    {"h": 671},
+    {"g": 693},
+    {"e": 692, "i": 694},
+    {";": 1, "E": 241},
+    {"t": 696},
+    {"e": 697},
+    {"s": 698},
+    {"r": 699},
+    {"e": 700},
+    {"b": 699, "p": 701},
+    {"u": 702},
+    {"S": 703},
+    {"e": 704},
+    {"r": 705},
+    {"a": 706},
+    {"u": 707},
+    {";": 1, "E": 241, "S": 420, "T": 227},
+    {"s": 709},
+    {"d": 710},
+    {"e": 711},
+    {"e": 712},
+    {"c": 713},
+    {"b": 699, "c": 714, "p": 701},
+    {"q": 708, "u": 715},
+    {";": 1, "E": 241, "F": 412, "T": 227},
+    {"e": 717},
+    {"d": 718},
+    {"l": 719},
+    {"i": 720},
+    {";": 1, "C": 650, "D": 656, "E": 660, "G": 667, "H": 668, "L": 675,
+     "N": 677, "P": 685, "R": 695, "S": 716, "T": 721, "V": 284},
+    {"B": 637, "n": 645, "p": 31, "t": 722},
+    {"J": 80, "a": 216, "c": 510, "e": 634, "f": 19, "o": 723, "s": 26,
+     "t": 49, "u": 11},
+    {"a": 109},
+    {"l": 725},
+    {"b": 726},
+    {"g": 23},
+    {"c": 106},
+    {"a": 26, "e": 728, "i": 729},
+    {"n": 171},
+    {"e": 731},
+    {"h": 2},
+    {"s": 733},
+    {"a": 734},
+    {"c": 19, "l": 735},
+    {"l": 47, "m": 130},
+    {"i": 737},
+    {"e": 11, "k": 511},
+    {"c": 739},
+    {"a": 740},
+    {"a": 19, "r": 741},
+    {"s": 67},
+    {"e": 743},
+    {"h": 744},
+    {"t": 745},
+    {"n": 746},
+    {"e": 747},
+    {"r": 748},
+    {"a": 749},
+    {"B": 742, "P": 750},
+    {"r": 751},
+    {"e": 752},
+    {"E": 465, "a": 10, "c": 18, "d": 727, "f": 19, "g": 22, "m": 730,
+     "o": 74, "p": 732, "r": 11, "s": 736, "t": 738, "u": 51, "v": 753},
+    {"r": 89},
+    {"M": 128},
+    {"s": 756},
+    {"u": 757},
+    {"a": 442},
+    {"l": 759},
+    {"p": 760},
+    {"e": 761},
+    {"r": 762},
+    {"a": 763},
+    {"c": 764},
+    {"n": 765},
+    {"i": 766, "p": 31},
+    {"e": 710},
+    {"d": 768},
+    {"e": 769},
+    {"c": 770},
+    {"m": 12},
+    {";": 1, "a": 138},
+    {"n": 773},
+    {"o": 774},
+    {"i": 775},
+    {"t": 776},
+    {"r": 777},
+    {"o": 778},
+    {"d": 183, "p": 779},
+    {";": 1, "e": 771, "i": 772, "o": 780},
+    {"c": 19, "i": 11},
+    {"a": 755, "c": 62, "f": 19, "h": 125, "i": 11, "l": 758, "o": 767,
+     "r": 781, "s": 782},
+    {"T": 2},
+    {"O": 784},
+    {"U": 785, "f": 19, "o": 74, "s": 26},
+    {"r": 19},
+    {"a": 787},
+    {"G": 2},
+    {";": 1, "t": 138},
+    {"r": 790},
+    {"c": 84, "n": 463, "r": 791},
+    {"i": 365},
+    {"u": 793},
+    {"l": 336, "q": 794},
+    {"q": 794},
+    {"E": 796},
+    {"p": 797},
+    {"E": 795, "U": 798},
+    {"e": 799},
+    {"s": 800},
+    {"r": 801},
+    {"e": 802},
+    {";": 1, "v": 803},
+    {"o": 11},
+    {";": 1, "B": 276, "L": 582},
+    {"w": 806},
+    {"o": 807},
+    {"r": 808},
+    {"n": 519, "r": 809},
+    {"A": 810, "C": 529, "D": 533, "F": 535, "T": 550, "U": 555, "V": 311,
+     "a": 246},
+    {"t": 811},
+    {"h": 812},
+    {"g": 813},
+    {"p": 474},
+    {"m": 815},
+    {"I": 816},
+    {"d": 817},
+    {"n": 818},
+    {"p": 31, "u": 819},
+    {"c": 19, "h": 11},
+    {"y": 59},
+    {"a": 822},
+    {"l": 823},
+    {"e": 824},
+    {"D": 825},
+    {"e": 826},
+    {"l": 827},
+    {"B": 788, "E": 789, "a": 792, "c": 510, "e": 804, "f": 19, "h": 805,
+     "i": 814, "o": 820, "r": 560, "s": 821, "u": 828},
+    {"H": 80},
+    {"C": 830, "c": 62},
+    {"T": 80},
+    {"F": 832},
+    {";": 1, "a": 106, "e": 401, "i": 110, "y": 11},
+    {"D": 273, "L": 582, "R": 254, "U": 289},
+    {"t": 835},
+    {"r": 836},
+    {"o": 837},
+    {"g": 480},
+    {"l": 12},
+    {"c": 840},
+    {"r": 841},
+    {"i": 842},
+    {"C": 843},
+    {"l": 844},
+    {"l": 845},
+    {"a": 846},
+    {"r": 477},
+    {"e": 848},
+    {"t": 849},
+    {"n": 850},
+    {"n": 33},
+    {";": 1, "I": 851, "S": 703, "U": 852},
+    {"e": 853},
+    {"r": 854},
+    {"a": 855},
+    {"r": 111, "u": 856},
+    {";": 1, "s": 698},
+    {"a": 111},
+    {"h": 859},
+    {"T": 860},
+    {"c": 713, "h": 861},
+    {";": 1, "e": 700, "s": 511},
+    {"b": 858, "c": 862, "m": 11, "p": 863},
+    {"H": 831, "O": 833, "a": 216, "c": 834, "f": 19, "h": 838, "i": 839,
+     "m": 847, "o": 74, "q": 857, "s": 26, "t": 276, "u": 864},
+    {"N": 2},
+    {"R": 866},
+    {"O": 867},
+    {"D": 371},
+    {"A": 869},
+    {"H": 80, "c": 62},
+    {"b": 11, "u": 11},
+    {"o": 337},
+    {"f": 873},
+    {"e": 874},
+    {"r": 875, "t": 23},
+    {"e": 876, "i": 604},
+    {"e": 120},
+    {"l": 878},
+    {"p": 879},
+    {"i": 880},
+    {"H": 868, "R": 870, "S": 871, "a": 872, "c": 510, "f": 19, "h": 877,
+     "i": 720, "o": 74, "r": 881, "s": 330},
+    {"i": 19},
+    {"c": 883},
+    {";": 1, "o": 884},
+    {"r": 885},
+    {"c": 9, "r": 886},
+    {"c": 62, "e": 13},
+    {"r": 888},
+    {";": 1, "P": 129},
+    {"n": 890},
+    {"o": 891},
+    {"d": 753, "i": 892},
+    {";": 1, "B": 276, "D": 273},
+    {"w": 894},
+    {"o": 895},
+    {"r": 896},
+    {"r": 897},
+    {"n": 556},
+    {"w": 899},
+    {"o": 900},
+    {";": 1, "l": 30},
+    {"i": 902},
+    {"A": 898, "D": 273, "E": 796, "T": 323, "a": 246, "d": 901, "p": 585,
+     "s": 903},
+    {"a": 887, "b": 889, "c": 18, "d": 727, "f": 19, "g": 22, "m": 27,
+     "n": 893, "o": 32, "p": 904, "r": 526, "s": 26, "t": 227, "u": 51},
+    {";": 1, "l": 11},
+    {"h": 906},
+    {"s": 907},
+    {"a": 908},
+    {"a": 296},
+    {"r": 910},
+    {"a": 911},
+    {"p": 912},
+    {"e": 913},
+    {"B": 276, "L": 443, "S": 914, "T": 227},
+    {"l": 915},
+    {"a": 916},
+    {"c": 917},
+    {";": 1, "i": 918},
+    {"b": 276, "t": 919, "y": 610},
+    {"e": 11, "r": 920},
+    {"d": 55},
+    {"D": 55, "b": 276, "c": 62, "d": 909, "e": 921, "f": 19, "o": 74,
+     "s": 26, "v": 922},
+    {"g": 12},
+    {"d": 924},
+    {"c": 432, "e": 925, "f": 19, "o": 74, "s": 26},
+    {"f": 19, "i": 11, "o": 74, "s": 26},
+    {"m": 138},
+    {"A": 80, "I": 80, "U": 80, "a": 10, "c": 494, "f": 19, "o": 74, "s": 26,
+     "u": 928},
+    {"h": 436},
+    {"t": 930},
+    {"d": 931},
+    {"i": 932},
+    {"W": 933},
+    {"o": 934},
+    {"r": 935, "t": 23},
+    {"H": 80, "a": 216, "c": 213, "d": 116, "e": 936, "f": 19, "o": 74,
+     "s": 26},
+    {";": 1, "E": 11, "d": 11, "i": 17, "u": 8, "y": 11},
+    {";": 1, "r": 11},
+    {"y": 359},
+    {"s": 940},
+    {"f": 941, "p": 53},
+    {"e": 942, "p": 24},
+    {"c": 19, "l": 463},
+    {"a": 944, "p": 2},
+    {"p": 12},
+    {"o": 946},
+    {"l": 947},
+    {";": 1, "a": 236, "d": 11, "s": 948, "v": 11},
+    {"a": 11, "b": 11, "c": 11, "d": 11, "e": 11, "f": 11, "g": 11, "h": 11},
+    {";": 1, "a": 950},
+    {"d": 951},
+    {"s": 952},
+    {"b": 396},
+    {";": 1, "v": 954},
+    {"t": 955},
+    {"p": 53, "t": 11},
+    {";": 1, "e": 11, "l": 12, "m": 953, "r": 956, "s": 957, "z": 788},
+    {"d": 949, "g": 958},
+    {";": 1, "e": 75},
+    {"x": 960},
+    {"o": 961},
+    {"r": 962},
+    {";": 1, "E": 11, "a": 884, "e": 11, "i": 28, "o": 66, "p": 963},
+    {"p": 960},
+    {"m": 965},
+    {"c": 19, "t": 11, "y": 966},
+    {"o": 114},
+    {"c": 968, "i": 112},
+    {"a": 10, "b": 15, "c": 938, "e": 5, "f": 939, "g": 22, "l": 943,
+     "m": 945, "n": 959, "o": 32, "p": 964, "r": 43, "s": 967, "t": 49,
+     "u": 51, "w": 969},
+    {"o": 525},
+    {"p": 356},
+    {"i": 772},
+    {"r": 973},
+    {"m": 960},
+    {"i": 975},
+    {"c": 971, "e": 972, "p": 974, "s": 976},
+    {"k": 977},
+    {";": 1, "g": 12},
+    {"d": 979},
+    {"e": 980},
+    {"v": 255, "w": 981},
+    {"c": 978, "r": 982},
+    {"r": 327},
+    {"b": 984},
+    {";": 1, "t": 985},
+    {"k": 986},
+    {"r": 987},
+    {"o": 525, "y": 11},
+    {"u": 805},
+    {"q": 990},
+    {"s": 175},
+    {"u": 992},
+    {"a": 993},
+    {"y": 210},
+    {"t": 995},
+    {"p": 996},
+    {"s": 125},
+    {"u": 11},
+    {"o": 999},
+    {"n": 1000},
+    {"e": 29},
+    {"e": 1002},
+    {"a": 11, "h": 11, "w": 1003},
+    {"c": 994, "m": 997, "p": 998, "r": 1001, "t": 1004},
+    {"a": 198, "i": 110, "u": 198},
+    {"d": 116, "p": 129, "t": 132},
+    {"u": 198},
+    {"c": 1008},
+    {"q": 1009, "t": 276},
+    {"w": 29},
+    {"o": 1011},
+    {"d": 1012, "u": 198},
+    {"e": 1013},
+    {"l": 1014},
+    {"g": 1015},
+    {"n": 1016},
+    {"a": 1017},
+    {"i": 1018},
+    {"r": 1019},
+    {"p": 129},
+    {"e": 925},
+    {"c": 1006, "o": 1007, "s": 1010, "t": 1020, "u": 1021, "v": 255,
+     "w": 1022},
+    {"g": 1023},
+    {"a": 245},
+    {"n": 924},
+    {"e": 1026},
+    {"z": 1027},
+    {"o": 1028},
+    {"f": 111},
+    {"e": 1030},
+    {"h": 111},
+    {"g": 1032},
+    {"i": 1033},
+    {";": 1, "d": 1012, "l": 1031, "r": 1034},
+    {"e": 1035},
+    {"l": 1036},
+    {"g": 1037},
+    {"n": 1038},
+    {"a": 1039},
+    {"i": 1040},
+    {"r": 1041},
+    {"l": 1029, "s": 340, "t": 1042},
+    {"k": 1043},
+    {"c": 1044, "n": 327},
+    {"2": 11, "4": 11},
+    {"4": 11},
+    {"1": 1046, "3": 1047},
+    {"c": 327},
+    {"a": 1045, "k": 1048, "o": 1049},
+    {"i": 210},
+    {"u": 1051},
+    {";": 1, "q": 1052},
+    {"e": 1053, "o": 111},
+    {"o": 359},
+    {";": 1, "t": 1055},
+    {"i": 12},
+    {"t": 1057},
+    {"L": 11, "R": 11, "l": 11, "r": 11},
+    {";": 1, "D": 11, "U": 11, "d": 11, "u": 11},
+    {";": 1, "H": 11, "L": 11, "R": 11, "h": 11, "l": 11, "r": 11},
+    {"x": 11},
+    {"o": 1062},
+    {"D": 1059, "H": 1060, "U": 1059, "V": 1061, "b": 1063, "d": 1059,
+     "h": 1060, "m": 128, "p": 129, "t": 132, "u": 1059, "v": 1061},
+    {"p": 31, "t": 1056, "w": 1058, "x": 1064},
+    {"r": 2},
+    {"a": 1066},
+    {"b": 1067},
+    {"e": 13, "v": 1068},
+    {"m": 125},
+    {"m": 175},
+    {"b": 11},
+    {"u": 1072},
+    {"s": 1073},
+    {";": 1, "b": 11, "h": 1074},
+    {"l": 1075},
+    {"c": 19, "e": 1070, "i": 1071, "o": 1076},
+    {";": 1, "e": 111},
+    {"l": 1078},
+    {";": 1, "q": 11},
+    {";": 1, "E": 11, "e": 1080},
+    {"p": 1081},
+    {"l": 1079, "m": 1082},
+    {"N": 116, "a": 983, "b": 988, "c": 989, "d": 991, "e": 1005, "f": 19,
+     "i": 1024, "k": 1025, "l": 1050, "n": 1054, "o": 1065, "p": 974,
+     "r": 1069, "s": 1077, "u": 1083},
+    {"r": 1009},
+    {"a": 198, "u": 198},
+    {";": 1, "a": 236, "b": 1085, "c": 1086, "d": 116, "s": 11},
+    {"e": 111, "o": 29},
+    {"c": 84, "p": 1087, "r": 1088},
+    {"p": 66, "r": 30},
+    {";": 1, "s": 359},
+    {"s": 1091},
+    {"p": 1092},
+    {"a": 1090, "e": 108, "i": 110, "u": 1093},
+    {"r": 573},
+    {";": 1, "e": 1095},
+    {"t": 1096},
+    {"d": 107, "m": 997, "n": 1097},
+    {"a": 984},
+    {";": 1, "m": 1099},
+    {"k": 1100},
+    {"c": 1101},
+    {"c": 62, "e": 1102, "i": 11},
+    {"l": 1031, "r": 1034},
+    {"w": 1104},
+    {"o": 1105},
+    {"r": 1106},
+    {"r": 1107},
+    {"s": 111},
+    {"R": 11, "S": 11, "a": 1109, "c": 432, "d": 55},
+    {"a": 1108, "d": 1110},
+    {"e": 1111},
+    {";": 1, "e": 75, "l": 1112},
+    {"i": 28},
+    {";": 1, "E": 11, "c": 1113, "e": 11, "f": 114, "m": 1114, "s": 884},
+    {"r": 1115},
+    {"i": 111},
+    {";": 1, "u": 1117},
+    {"s": 1118},
+    {"b": 1119},
+    {"u": 1120},
+    {";": 1, "e": 1080},
+    {"n": 1122},
+    {"o": 1123},
+    {";": 1, "t": 11},
+    {"a": 1125},
+    {"m": 178, "x": 130},
+    {"e": 1127},
+    {";": 1, "f": 29, "l": 1128},
+    {"m": 1126, "p": 1129},
+    {";": 1, "d": 116},
+    {"g": 1131, "i": 112},
+    {"o": 28},
+    {";": 1, "s": 19},
+    {"f": 11, "r": 1133, "y": 1134},
+    {"l": 1124, "m": 1130, "n": 1132, "p": 1135},
+    {"a": 787, "o": 196},
+    {"b": 175, "p": 175},
+    {"c": 19, "u": 1138},
+    {"l": 11, "r": 11},
+    {"r": 1140},
+    {"r": 1141},
+    {"a": 1142},
+    {"p": 19, "s": 109},
+    {";": 1, "p": 11},
+    {"r": 1145},
+    {"r": 1146},
+    {"a": 1147},
+    {"c": 199},
+    {"r": 1149},
+    {";": 1, "b": 1150, "c": 1086, "d": 116, "o": 19, "s": 11},
+    {";": 1, "m": 11},
+    {"r": 1152},
+    {"r": 1153},
+    {"e": 109},
+    {"r": 1155},
+    {"c": 109},
+    {"u": 1157},
+    {"p": 1156, "s": 1158},
+    {"q": 1159},
+    {"e": 1160, "v": 255, "w": 1022},
+    {"y": 1161},
+    {"n": 2},
+    {"e": 1163},
+    {"a": 1108},
+    {"e": 1165},
+    {"a": 1154, "l": 1162, "r": 1164, "v": 1166},
+    {"d": 1143, "e": 1144, "l": 1148, "p": 1151, "r": 1167, "v": 255, "w": 59},
+    {"t": 62},
+    {"c": 1169},
+    {"l": 1170},
+    {"a": 1089, "c": 1094, "d": 116, "e": 1098, "f": 19, "h": 1103, "i": 1116,
+     "l": 1121, "o": 1136, "r": 1137, "s": 1139, "t": 573, "u": 1168,
+     "w": 969, "y": 1171},
+    {"t": 53},
+    {"e": 1173},
+    {";": 1, "v": 11},
+    {"h": 1175},
+    {"g": 209, "l": 1174, "r": 19, "s": 1176},
+    {"k": 1025, "l": 725},
+    {"g": 209, "r": 19},
+    {"s": 76},
+    {"t": 1180},
+    {";": 1, "a": 1179, "o": 1181},
+    {"t": 23},
+    {"g": 2, "l": 1183, "m": 997},
+    {"s": 1032},
+    {"i": 1185, "r": 11},
+    {"a": 1141},
+    {"u": 1117},
+    {";": 1, "s": 1188},
+    {"d": 1189},
+    {"n": 1190},
+    {";": 1, "o": 1191, "s": 11},
+    {"m": 1192},
+    {"a": 481},
+    {"i": 29},
+    {"t": 132},
+    {"n": 1196},
+    {";": 1, "o": 1197},
+    {"e": 1198},
+    {"d": 1199},
+    {"n": 1062},
+    {";": 1, "i": 1200, "o": 1201},
+    {"a": 1193, "e": 11, "g": 1194, "s": 1195, "v": 1202},
+    {"r": 29},
+    {"o": 198},
+    {"o": 1204, "r": 1205},
+    {"c": 1206},
+    {"l": 276},
+    {"q": 1131},
+    {";": 1, "e": 1209, "m": 128, "p": 129, "s": 340},
+    {"w": 1022},
+    {"r": 1211},
+    {"a": 1212},
+    {"b": 1213},
+    {"e": 1214},
+    {"l": 1215},
+    {"b": 1216},
+    {"w": 66},
+    {"o": 1218},
+    {"r": 1219},
+    {"r": 1220},
+    {"a": 1221},
+    {"n": 1222},
+    {"w": 1223},
+    {"o": 1224},
+    {"n": 1104},
+    {"o": 1226},
+    {"o": 1227},
+    {"p": 1228},
+    {"r": 1229},
+    {"a": 1230},
+    {"a": 246, "d": 1225, "h": 1231},
+    {"n": 1232},
+    {"l": 1208, "p": 31, "t": 1210, "u": 1217, "w": 1233},
+    {"k": 1025},
+    {"b": 1235, "c": 1206},
+    {"r": 11, "y": 11},
+    {"c": 1237, "o": 138, "t": 329},
+    {";": 1, "f": 11},
+    {"i": 1239},
+    {"d": 116, "r": 1240},
+    {"a": 787, "h": 276},
+    {"g": 840},
+    {"n": 1243},
+    {"a": 1244},
+    {"r": 788},
+    {"g": 1246},
+    {"c": 62, "i": 1247},
+    {"A": 787, "H": 276, "a": 1177, "b": 1178, "c": 213, "d": 1182, "e": 1184,
+     "f": 1186, "h": 1187, "i": 1203, "j": 80, "l": 1207, "o": 1234,
+     "r": 1236, "s": 1238, "t": 1241, "u": 1242, "w": 1245, "z": 1248},
+    {"D": 116, "o": 111},
+    {"c": 9, "s": 413},
+    {";": 1, "c": 2},
+    {"r": 1252},
+    {"a": 106, "i": 1253, "o": 354, "y": 11},
+    {"D": 116, "r": 11},
+    {";": 1, "r": 21, "s": 1131},
+    {"r": 66},
+    {"e": 1257},
+    {"t": 1258},
+    {"n": 1259},
+    {";": 1, "i": 1260, "l": 11, "s": 1131},
+    {";": 1, "s": 511, "v": 11},
+    {"y": 1262},
+    {"t": 1263},
+    {"3": 11, "4": 11},
+    {"1": 1265, ";": 1},
+    {"p": 1266},
+    {"a": 26, "p": 1264, "s": 1267},
+    {"g": 11, "s": 198},
+    {";": 1, "s": 138},
+    {"r": 1270},
+    {";": 1, "l": 30, "v": 11},
+    {"i": 1272},
+    {"a": 1271, "l": 126, "s": 1273},
+    {"i": 110, "o": 354},
+    {"t": 19},
+    {"g": 1276, "l": 403},
+    {"t": 1277},
+    {"n": 1278},
+    {"a": 1279},
+    {"i": 359, "l": 1280},
+    {"l": 66},
+    {";": 1, "D": 85},
+    {"v": 1283},
+    {"a": 1282, "e": 1109, "i": 1284},
+    {"s": 138},
+    {"r": 1286},
+    {"a": 1287},
+    {"p": 1288},
+    {"c": 1275, "s": 1281, "u": 1285, "v": 1289},
+    {"D": 116, "a": 787},
+    {"c": 19, "d": 116, "i": 359},
+    {"a": 11, "h": 2},
+    {"m": 50, "r": 805},
+    {"a": 34},
+    {"t": 1295},
+    {"c": 1296},
+    {"a": 840},
+    {"i": 1298},
+    {"t": 1299},
+    {"n": 1300},
+    {"e": 1301},
+    {"n": 1302},
+    {"e": 1297, "o": 1303},
+    {"c": 138, "i": 1109, "p": 1304},
+    {"D": 1250, "a": 1251, "c": 1254, "d": 116, "e": 11, "f": 1255, "g": 1256,
+     "l": 1261, "m": 1268, "n": 1269, "o": 32, "p": 1274, "q": 1290,
+     "r": 1291, "s": 1292, "t": 1293, "u": 1294, "x": 1305},
+    {"o": 1181},
+    {"d": 1307},
+    {"g": 1308},
+    {"n": 1309},
+    {"i": 1310},
+    {"l": 1311},
+    {"l": 1312},
+    {"m": 1298},
+    {"i": 463, "l": 464},
+    {"i": 465, "l": 1315, "r": 11},
+    {"n": 66},
+    {"a": 111, "l": 464, "t": 1317},
+    {"o": 31},
+    {"a": 386, "k": 1175},
+    {"p": 31, "r": 1320},
+    {"t": 113},
+    {"r": 1322},
+    {"a": 1323},
+    {"2": 2, "3": 11, "4": 2, "5": 11, "6": 11, "8": 11},
+    {"3": 11, "5": 11},
+    {"4": 2, "5": 11, "8": 11},
+    {"5": 11},
+    {"6": 11, "8": 11},
+    {"8": 11},
+    {"1": 1325, "2": 1326, "3": 1327, "4": 1328, "5": 1329, "7": 1330},
+    {"c": 1331, "s": 138},
+    {"a": 1332, "o": 1011},
+    {"a": 1313, "c": 62, "e": 1314, "f": 1316, "i": 465, "j": 465, "l": 1318,
+     "n": 1319, "o": 1321, "p": 1324, "r": 1333, "s": 26},
+    {"c": 84, "m": 398, "p": 11},
+    {"a": 112},
+    {"l": 1336},
+    {";": 1, "q": 11, "s": 1337},
+    {";": 1, "o": 906},
+    {"t": 1339},
+    {"o": 1340},
+    {";": 1, "e": 66},
+    {";": 1, "c": 109, "d": 1341, "l": 1342},
+    {";": 1, "l": 11, "q": 1338, "s": 1343},
+    {";": 1, "g": 11},
+    {"e": 138},
+    {"m": 1346},
+    {";": 1, "E": 11, "a": 11, "j": 11},
+    {"r": 1063},
+    {";": 1, "p": 1349},
+    {"p": 1350},
+    {";": 1, "q": 1080},
+    {"i": 359},
+    {"E": 11, "a": 1351, "e": 1352, "s": 1353},
+    {";": 1, "e": 11, "l": 11},
+    {"m": 1355},
+    {"c": 19, "i": 1356},
+    {"c": 11, "i": 19},
+    {"P": 276},
+    {"e": 1109},
+    {"u": 1360},
+    {"p": 1349},
+    {"p": 1362, "r": 19},
+    {"l": 403},
+    {"l": 403, "q": 1364},
+    {"q": 1365},
+    {"a": 1363, "d": 116, "e": 1366, "l": 403, "s": 1353},
+    {";": 1, "c": 1358, "d": 116, "l": 1359, "q": 1361, "r": 1367},
+    {"q": 75},
+    {"e": 1369},
+    {"n": 1370},
+    {"t": 1371},
+    {"r": 1372},
+    {"e": 1373, "n": 371},
+    {"E": 906, "a": 1335, "b": 15, "c": 494, "d": 116, "e": 1344, "f": 19,
+     "g": 1345, "i": 1347, "j": 80, "l": 1348, "n": 1354, "o": 74, "r": 223,
+     "s": 1357, "t": 1368, "v": 1374},
+    {"s": 198},
+    {"r": 1376},
+    {"l": 111},
+    {"i": 1378},
+    {";": 1, "c": 883, "w": 11},
+    {"d": 80, "r": 1380},
+    {"i": 1377, "l": 31, "m": 1379, "r": 1381},
+    {"t": 1119},
+    {"r": 1383},
+    {"i": 198},
+    {"l": 1385},
+    {"c": 30},
+    {"a": 1384, "l": 1386, "r": 1387},
+    {"e": 1025, "w": 1025},
+    {"s": 1389},
+    {"t": 1032},
+    {"e": 571},
+    {"l": 1392, "r": 560},
+    {"k": 1393},
+    {"b": 276},
+    {"a": 787, "m": 1391, "o": 1394, "p": 31, "r": 1395},
+    {"c": 19, "l": 55, "t": 329},
+    {"u": 386},
+    {"h": 1002},
+    {"b": 1398, "p": 1399},
+    {"A": 787, "a": 1382, "b": 276, "c": 432, "e": 1388, "f": 19, "k": 1390,
+     "o": 1396, "s": 1397, "y": 1400},
+    {";": 1, "i": 17, "y": 11},
+    {"c": 50},
+    {"c": 62, "x": 1403},
+    {"f": 11, "r": 11},
+    {"i": 112, "n": 111},
+    {"f": 1195},
+    {";": 1, "i": 1406, "n": 1407, "o": 1183},
+    {"r": 111},
+    {"a": 1409},
+    {"e": 11, "l": 443, "p": 1410},
+    {"c": 19, "g": 1411, "t": 53},
+    {"a": 1412, "o": 31, "p": 59},
+    {";": 1, "t": 1057},
+    {"n": 1414},
+    {"i": 1415},
+    {"c": 139},
+    {"g": 1258, "r": 1417},
+    {"h": 327},
+    {"r": 1419},
+    {"a": 1420},
+    {"r": 1133},
+    {";": 1, "c": 139, "e": 1418, "l": 1421, "p": 1422},
+    {";": 1, "c": 338, "f": 1416, "o": 573, "t": 1423},
+    {"c": 62, "g": 30, "p": 31, "t": 23},
+    {"t": 2},
+    {"s": 1426},
+    {"e": 1427},
+    {"u": 1428},
+    {";": 1, "E": 11, "d": 116, "s": 1175, "v": 11},
+    {"n": 1430},
+    {"c": 19, "i": 1431},
+    {";": 1, "i": 226},
+    {"a": 10, "c": 1402, "e": 1404, "f": 1405, "g": 22, "i": 1408, "j": 465,
+     "m": 1413, "n": 1424, "o": 1425, "p": 1422, "q": 1429, "s": 1432,
+     "t": 1433, "u": 492},
+    {"a": 1173},
+    {"c": 494, "f": 19, "m": 1435, "o": 74, "s": 496, "u": 497},
+    {"a": 1175},
+    {"p": 1437},
+    {"p": 1438},
+    {"r": 1003},
+    {"a": 1439, "c": 501, "f": 19, "g": 1440, "h": 80, "j": 80, "o": 74,
+     "s": 26},
+    {"a": 400},
+    {"a": 787, "r": 19, "t": 1442},
+    {"m": 997},
+    {"a": 29},
+    {"r": 1445},
+    {";": 1, "d": 11, "l": 12},
+    {"g": 1447},
+    {"o": 2},
+    {"u": 1449},
+    {";": 1, "f": 66},
+    {";": 1, "b": 1451, "f": 66, "h": 327, "l": 198, "p": 138, "s": 1353,
+     "t": 138},
+    {"r": 1452},
+    {";": 1, "s": 11},
+    {";": 1, "a": 400, "e": 1454},
+    {"c": 84, "e": 1444, "g": 1446, "m": 504, "n": 1448, "p": 11, "q": 1450,
+     "r": 1453, "t": 1455},
+    {"e": 11, "k": 11},
+    {"c": 1457},
+    {"d": 11, "u": 11},
+    {"l": 1459},
+    {"e": 11, "s": 1460},
+    {"a": 1458, "k": 1461},
+    {"a": 787, "b": 984, "r": 1462},
+    {"d": 400, "i": 138},
+    {"a": 106, "e": 1464, "u": 1072, "y": 11},
+    {"o": 939},
+    {"u": 1466},
+    {"h": 276},
+    {"s": 1468},
+    {"d": 1468, "u": 1469},
+    {"c": 23, "q": 1467, "r": 1470, "s": 53},
+    {";": 1, "t": 1442},
+    {"w": 1472},
+    {"o": 1473},
+    {"r": 1474},
+    {"r": 1475},
+    {"n": 1013},
+    {"o": 1477},
+    {"o": 1478},
+    {"p": 1479},
+    {"r": 1480},
+    {"a": 1481},
+    {"t": 1222},
+    {"f": 1483},
+    {"e": 1484},
+    {"w": 1454},
+    {"o": 1486},
+    {"r": 1487},
+    {"r": 1488},
+    {"o": 1317},
+    {"o": 1490},
+    {"p": 1491},
+    {"r": 1492},
+    {"a": 1493},
+    {"g": 556},
+    {"i": 1495},
+    {"u": 1496},
+    {"q": 1497},
+    {"a": 1489, "h": 1494, "s": 1498},
+    {"t": 1499},
+    {"h": 1500},
+    {"g": 1501},
+    {"i": 1502},
+    {"e": 1196},
+    {"e": 1504},
+    {"r": 1505},
+    {"h": 1506},
+    {"a": 1476, "h": 1482, "l": 1485, "r": 1503, "t": 1507},
+    {"t": 1508},
+    {";": 1, "o": 939},
+    {"t": 1510},
+    {"o": 1511},
+    {"p": 1362},
+    {"g": 1276},
+    {"g": 1276, "q": 1514},
+    {"q": 1515},
+    {"a": 1513, "d": 116, "e": 1516, "g": 1276, "s": 1353},
+    {";": 1, "c": 109, "d": 1512, "g": 1342, "s": 1517},
+    {";": 1, "f": 1509, "g": 11, "q": 1338, "s": 1518},
+    {"i": 1185, "l": 534, "r": 11},
+    {";": 1, "E": 11},
+    {"d": 11, "u": 906},
+    {"r": 1522},
+    {"l": 327},
+    {"a": 1523, "b": 1524},
+    {"n": 208},
+    {"r": 1526},
+    {"o": 1527},
+    {"r": 28},
+    {"a": 1529},
+    {"r": 125},
+    {";": 1, "a": 787, "c": 1528, "h": 1530, "t": 1531},
+    {"h": 12},
+    {"c": 1533},
+    {";": 1, "a": 1534},
+    {"t": 1535},
+    {"s": 1536},
+    {"u": 1537},
+    {"i": 573, "o": 1538},
+    {"n": 463, "r": 19},
+    {"t": 805},
+    {"s": 1541},
+    {"p": 1542},
+    {"a": 1543},
+    {"l": 578, "m": 1544, "r": 560},
+    {"g": 1545},
+    {"p": 1165},
+    {"a": 19, "f": 11, "l": 126},
+    {"a": 1109, "b": 276},
+    {";": 1, "e": 1026, "f": 11},
+    {"a": 1540, "b": 984, "n": 1546, "o": 1547, "p": 1548, "t": 132,
+     "w": 1549, "z": 1550},
+    {";": 1, "l": 111},
+    {"r": 1552},
+    {"a": 1553},
+    {"r": 396},
+    {"a": 1555},
+    {"a": 787, "c": 1528, "h": 1556, "m": 11, "t": 1531},
+    {";": 1, "e": 11, "g": 11},
+    {"m": 1558},
+    {"b": 11, "u": 1466},
+    {"a": 991, "c": 19, "h": 11, "i": 1559, "q": 1560, "t": 329},
+    {"r": 255},
+    {";": 1, "e": 11, "f": 11},
+    {"P": 276, "i": 1563},
+    {";": 1, "c": 1358, "d": 116, "h": 1562, "i": 131, "l": 788, "q": 1361,
+     "r": 1564},
+    {"d": 1469, "u": 1468},
+    {"r": 1566},
+    {"A": 1443, "B": 788, "E": 1345, "H": 276, "a": 1456, "b": 1463,
+     "c": 1465, "d": 1471, "e": 1519, "f": 1520, "g": 1521, "h": 1525,
+     "j": 80, "l": 1532, "m": 1539, "n": 1354, "o": 1551, "p": 1554,
+     "r": 1557, "s": 1561, "t": 1565, "u": 1567, "v": 1374},
+    {";": 1, "e": 63},
+    {"e": 11, "t": 1569},
+    {";": 1, "d": 1012, "l": 1031, "u": 198},
+    {"o": 1571},
+    {"t": 1572},
+    {";": 1, "s": 1573},
+    {"k": 208},
+    {"c": 1066, "l": 1570, "p": 1574, "r": 1575},
+    {"o": 481, "y": 11},
+    {"d": 1245},
+    {"e": 1578},
+    {"r": 1579},
+    {"u": 1580},
+    {"s": 1581},
+    {"a": 1582},
+    {"r": 1449},
+    {"o": 1426},
+    {";": 1, "a": 1109, "c": 883, "d": 1585},
+    {";": 1, "u": 11},
+    {";": 1, "b": 11, "d": 1587},
+    {"s": 1588},
+    {"u": 1589},
+    {"c": 1584, "d": 1586, "n": 1590},
+    {"c": 198, "d": 19},
+    {"e": 1282},
+    {"d": 1593, "p": 31},
+    {"o": 66},
+    {"p": 1595},
+    {"c": 19, "t": 1596},
+    {"m": 199},
+    {"i": 1598},
+    {"t": 1599},
+    {";": 1, "l": 1600, "m": 199},
+    {"D": 120, "a": 1576, "c": 1577, "d": 55, "e": 1583, "f": 19, "h": 805,
+     "i": 1591, "l": 1592, "n": 1021, "o": 1594, "p": 11, "s": 1597,
+     "u": 1601},
+    {"g": 11, "t": 1175},
+    {"e": 577, "l": 11, "t": 1175},
+    {"D": 55, "d": 55},
+    {";": 1, "E": 11, "i": 28, "o": 66, "p": 1349},
+    {"l": 1454},
+    {";": 1, "a": 1607},
+    {"r": 1608},
+    {"u": 1609},
+    {"b": 117, "c": 84, "n": 463, "p": 1606, "t": 1610},
+    {"p": 2},
+    {"p": 175},
+    {"m": 1613},
+    {"s": 1612, "u": 1614},
+    {"p": 11, "r": 30},
+    {"g": 1131},
+    {"n": 1617},
+    {"a": 1616, "e": 401, "o": 1618, "u": 198, "y": 11},
+    {";": 1, "o": 243},
+    {"h": 327, "r": 1620},
+    {"r": 1621},
+    {"e": 276, "i": 359},
+    {"t": 1454},
+    {"s": 1624},
+    {"i": 1625},
+    {";": 1, "A": 787, "a": 1622, "d": 116, "q": 1052, "s": 1623, "x": 1626},
+    {";": 1, "q": 1338, "s": 11},
+    {"E": 11, "e": 1628, "s": 1353, "t": 939},
+    {"A": 787, "a": 787, "p": 276},
+    {";": 1, "s": 396, "v": 11},
+    {";": 1, "f": 576, "q": 1338, "s": 1454},
+    {"i": 175},
+    {";": 1, "r": 1633},
+    {"A": 787, "E": 11, "a": 787, "d": 19, "e": 1632, "s": 1353, "t": 1634},
+    {"a": 11, "b": 11, "c": 11},
+    {";": 1, "E": 11, "d": 116, "v": 1636},
+    {"n": 1637},
+    {";": 1, "v": 1636},
+    {"i": 1639},
+    {";": 1, "i": 1638, "n": 1640},
+    {"p": 31, "t": 1641},
+    {"l": 1346},
+    {"l": 1643},
+    {";": 1, "a": 1644, "s": 138, "t": 11},
+    {"r": 1645},
+    {"l": 113},
+    {"u": 12},
+    {";": 1, "c": 960},
+    {";": 1, "c": 1648, "e": 1649},
+    {"a": 1646, "o": 1647, "r": 1650},
+    {";": 1, "c": 11, "w": 11},
+    {"r": 1652},
+    {"r": 1653},
+    {"r": 1633},
+    {"A": 787, "a": 1654, "i": 559, "t": 1655},
+    {";": 1, "c": 1648, "e": 11, "r": 11},
+    {"a": 1644},
+    {"r": 1658},
+    {"a": 1659},
+    {"m": 1114, "p": 1660},
+    {"t": 1661},
+    {"r": 1662},
+    {"o": 1663},
+    {"m": 1122},
+    {"b": 12, "p": 12},
+    {"u": 1666},
+    {"s": 1667},
+    {"q": 1080},
+    {";": 1, "e": 1669},
+    {"t": 1670},
+    {"e": 1671},
+    {";": 1, "E": 11, "e": 11, "s": 1672},
+    {"c": 960},
+    {"b": 1673, "c": 1674, "p": 1673},
+    {"c": 1657, "h": 1664, "i": 1665, "m": 1114, "p": 276, "q": 1668,
+     "u": 1675},
+    {"t": 960},
+    {"f": 1677},
+    {"e": 1678},
+    {"h": 1677},
+    {"g": 1680},
+    {"i": 1681},
+    {"l": 1679, "r": 1682},
+    {"e": 1683},
+    {"l": 1684},
+    {"g": 1685},
+    {"n": 1686},
+    {"a": 1687},
+    {"i": 1688},
+    {"g": 138, "i": 48, "l": 463, "r": 1689},
+    {"r": 805},
+    {";": 1, "e": 1691, "s": 198},
+    {";": 1, "m": 1692},
+    {"e": 11, "t": 11},
+    {"n": 1407},
+    {";": 1, "r": 1057},
+    {"A": 787, "e": 11, "t": 1696},
+    {"r": 1057},
+    {"A": 787, "t": 1698},
+    {"D": 55, "H": 788, "a": 198, "d": 55, "g": 1694, "i": 1695, "l": 1697,
+     "r": 1699, "s": 1353},
+    {"e": 276},
+    {"A": 787, "a": 1622, "n": 1701},
+    {"G": 1603, "L": 1604, "R": 560, "V": 1605, "a": 1611, "b": 1615,
+     "c": 1619, "d": 55, "e": 1627, "f": 19, "g": 1629, "h": 1630, "i": 1631,
+     "j": 80, "l": 1635, "m": 1114, "o": 1642, "p": 1651, "r": 1656,
+     "s": 1676, "t": 1690, "u": 1693, "v": 1700, "w": 1702},
+    {"c": 9, "s": 111},
+    {"i": 1253, "y": 11},
+    {"l": 28},
+    {"o": 1706},
+    {"a": 54, "b": 726, "i": 210, "o": 111, "s": 1707},
+    {"c": 883, "r": 11},
+    {"o": 29, "r": 21, "t": 11},
+    {"b": 276, "m": 11},
+    {"i": 19, "r": 197},
+    {"a": 787, "c": 1712, "i": 442, "t": 11},
+    {"c": 106, "d": 11, "n": 126},
+    {"a": 26, "e": 728, "i": 1714},
+    {"r": 198},
+    {"a": 19, "e": 1716, "l": 126},
+    {";": 1, "o": 31},
+    {"r": 1718},
+    {";": 1, "e": 1719, "f": 2, "m": 2},
+    {"g": 1319},
+    {";": 1, "a": 787, "d": 1720, "i": 1721, "o": 19, "s": 948, "v": 11},
+    {"c": 19, "l": 735, "o": 138},
+    {";": 1, "a": 66},
+    {"s": 1724},
+    {"e": 1725},
+    {"l": 47, "m": 1726},
+    {"i": 1727},
+    {"S": 11, "a": 1704, "c": 1705, "d": 1708, "e": 465, "f": 1709, "g": 1710,
+     "h": 1711, "i": 112, "l": 1713, "m": 1715, "o": 74, "p": 1717, "r": 1722,
+     "s": 1723, "t": 1728, "u": 51, "v": 1395},
+    {";": 1, "l": 1643},
+    {"i": 359, "l": 11},
+    {";": 1, "a": 1730, "s": 1731, "t": 11},
+    {"r": 1732},
+    {"n": 327},
+    {"e": 1734},
+    {"c": 112, "i": 1133, "m": 400, "p": 11, "t": 1735},
+    {"r": 1736},
+    {"m": 859},
+    {"i": 1175, "m": 1738, "o": 442},
+    {"o": 984},
+    {"f": 1740},
+    {"h": 1741},
+    {"c": 1742},
+    {";": 1, "t": 1743, "v": 11},
+    {";": 1, "h": 11},
+    {"k": 1745},
+    {"c": 1746, "k": 210},
+    {"n": 1747},
+    {"o": 11, "u": 11},
+    {"w": 805},
+    {";": 1, "a": 884, "b": 11, "c": 883, "d": 1749, "e": 11, "m": 1163,
+     "s": 1353, "t": 1750},
+    {"s": 1751},
+    {"a": 1748, "u": 1752},
+    {"n": 1322},
+    {"d": 2},
+    {"n": 1755},
+    {"i": 1754, "p": 31, "u": 1756},
+    {"y": 76},
+    {"l": 1758},
+    {"r": 1759},
+    {"u": 1760},
+    {"a": 1513, "e": 1369, "s": 1353},
+    {";": 1, "a": 1513, "c": 1761, "e": 75, "n": 1762, "s": 1353},
+    {";": 1, "c": 1763},
+    {"e": 1454},
+    {"m": 1765},
+    {"E": 11, "a": 198, "s": 1353},
+    {"u": 388},
+    {"a": 1208, "l": 443, "s": 1768},
+    {";": 1, "t": 805},
+    {"d": 11, "f": 1769, "p": 1770},
+    {"r": 1346},
+    {";": 1, "E": 11, "a": 198, "c": 1648, "e": 1764, "i": 1766, "n": 1767,
+     "o": 1771, "s": 1353, "u": 1772},
+    {"c": 1376},
+    {"n": 1774},
+    {"a": 1733, "c": 62, "e": 1737, "f": 19, "h": 1739, "i": 1744, "l": 1753,
+     "m": 11, "o": 1757, "r": 1773, "s": 782, "u": 1775},
+    {"i": 1490},
+    {"n": 1777},
+    {"r": 1778},
+    {"e": 1779, "i": 112},
+    {"t": 1780},
+    {"s": 1677},
+    {"a": 1781, "e": 1782, "o": 1426},
+    {"f": 19, "i": 112, "o": 74, "p": 974, "s": 26, "u": 1783},
+    {"e": 11, "u": 83},
+    {"i": 109},
+    {";": 1, "d": 11, "e": 11, "l": 12},
+    {"g": 1787},
+    {";": 1, "a": 198, "b": 1451, "c": 11, "f": 66, "h": 327, "l": 198,
+     "p": 138, "s": 1353, "t": 138, "w": 11},
+    {"r": 1789},
+    {"a": 1282},
+    {";": 1, "n": 1791},
+    {"o": 1792},
+    {"a": 400, "i": 1793},
+    {"c": 1785, "d": 1786, "e": 1444, "n": 1788, "q": 1450, "r": 1790,
+     "t": 1794},
+    {"d": 1468},
+    {"c": 23, "l": 1796, "q": 1467, "s": 53},
+    {";": 1, "i": 442, "p": 1410, "s": 11},
+    {"l": 1798},
+    {"a": 1799, "c": 111, "g": 2},
+    {"a": 1523, "o": 1175},
+    {"a": 1221, "h": 1494},
+    {"t": 1802},
+    {"f": 1803},
+    {"e": 1804},
+    {"h": 1483},
+    {"g": 1806},
+    {"i": 1807},
+    {"a": 1476, "h": 1482, "l": 1805, "r": 1808, "s": 1498, "t": 1507},
+    {"t": 1809},
+    {"h": 1810},
+    {"g": 1811, "n": 463, "s": 1311},
+    {"a": 787, "h": 276, "m": 11},
+    {"o": 1538},
+    {"m": 1114},
+    {"a": 1540, "b": 984, "p": 1548, "t": 132},
+    {";": 1, "g": 111},
+    {"r": 1817},
+    {"o": 1647},
+    {"a": 1818, "p": 1819},
+    {"a": 991, "c": 19, "h": 11, "q": 1560},
+    {"t": 1531},
+    {";": 1, "e": 11, "f": 11, "l": 1822},
+    {"i": 1823},
+    {"h": 1562, "i": 131, "r": 1824},
+    {"u": 1468},
+    {"l": 1826},
+    {"A": 1443, "B": 788, "H": 276, "a": 1795, "b": 1463, "c": 1465,
+     "d": 1797, "e": 1800, "f": 1520, "h": 1801, "i": 1812, "l": 1813,
+     "m": 1814, "n": 1815, "o": 1816, "p": 1820, "r": 788, "s": 1821,
+     "t": 1825, "u": 1827, "x": 11},
+    {";": 1, "d": 400},
+    {";": 1, "E": 11, "a": 1616, "c": 1648, "e": 1829, "i": 110, "n": 1767,
+     "p": 1819, "s": 1353, "y": 11},
+    {";": 1, "b": 11, "e": 11},
+    {"t": 1831},
+    {"o": 1832},
+    {"w": 276},
+    {"i": 127, "n": 11},
+    {"m": 1835},
+    {"A": 787, "a": 1622, "c": 1426, "m": 125, "s": 1834, "t": 1836, "x": 111},
+    {";": 1, "o": 1011},
+    {"r": 1838},
+    {"h": 80, "y": 11},
+    {"a": 1716, "c": 1840, "o": 1663, "y": 2},
+    {";": 1, "f": 11, "v": 11},
+    {"a": 1842},
+    {"m": 1843},
+    {";": 1, "d": 116, "e": 1080, "g": 1521, "l": 1521, "n": 12, "p": 129,
+     "r": 788},
+    {"g": 1844, "m": 1845},
+    {"m": 128},
+    {"t": 1847},
+    {"e": 1848},
+    {"s": 1849},
+    {"l": 1850},
+    {"h": 198},
+    {"l": 1851, "s": 1852},
+    {"d": 11, "l": 12},
+    {";": 1, "e": 1454},
+    {"a": 1853, "e": 1289, "i": 1854, "t": 1855},
+    {"t": 80},
+    {";": 1, "a": 19},
+    {";": 1, "b": 1858},
+    {"f": 1857, "l": 1859, "p": 31},
+    {"e": 1119},
+    {"d": 1861, "r": 11},
+    {"a": 1862},
+    {"p": 1454},
+    {"a": 1864, "u": 1864},
+    {"e": 1677},
+    {";": 1, "e": 11, "s": 1866},
+    {"b": 1867, "p": 1867},
+    {"u": 1868},
+    {"e": 11, "f": 11},
+    {"r": 1870},
+    {";": 1, "a": 1871, "f": 11},
+    {"c": 1865, "s": 1869, "u": 1872},
+    {"m": 29},
+    {"t": 1874},
+    {"i": 840},
+    {"a": 388},
+    {"c": 19, "e": 1875, "m": 1876, "t": 1877},
+    {"r": 1239},
+    {"h": 125},
+    {"e": 972, "p": 1880},
+    {"t": 1881},
+    {"h": 1882},
+    {"g": 1883},
+    {"i": 1884},
+    {"a": 1885, "n": 66},
+    {"a": 1879, "r": 1886},
+    {"u": 1378},
+    {"E": 11, "e": 11},
+    {"e": 1669},
+    {";": 1, "e": 1669, "n": 1890},
+    {"t": 1891},
+    {"b": 11, "p": 11},
+    {"e": 1892, "i": 359, "u": 1893},
+    {";": 1, "E": 11, "d": 116, "e": 1131, "m": 1888, "n": 1889, "p": 129,
+     "r": 788, "s": 1894},
+    {"c": 1763},
+    {"o": 111, "s": 1073},
+    {"o": 138, "u": 1072},
+    {"s": 1898},
+    {"1": 2, "2": 2, "3": 2, ";": 1, "E": 11, "d": 1897, "e": 1131, "h": 1899,
+     "l": 788, "m": 1888, "n": 1889, "p": 129, "s": 1894},
+    {"b": 1895, "c": 1896, "m": 11, "n": 463, "p": 1900},
+    {"A": 787, "a": 1622, "n": 1834},
+    {"a": 216, "b": 991, "c": 1830, "d": 1833, "e": 1837, "f": 1839,
+     "h": 1841, "i": 1846, "l": 788, "m": 1856, "o": 1860, "p": 1863,
+     "q": 1873, "r": 788, "s": 1878, "t": 1887, "u": 1901, "w": 1902, "z": 5},
+    {"g": 511},
+    {"r": 1904, "u": 11},
+    {"l": 1156},
+    {"4": 11, "f": 873},
+    {"e": 1907},
+    {";": 1, "s": 940, "v": 11},
+    {"a": 1909},
+    {"r": 1908, "t": 1910},
+    {"a": 1513, "s": 1353},
+    {"k": 1912},
+    {"c": 1913, "n": 1376},
+    {"a": 198, "s": 1353},
+    {"r": 1163},
+    {"e": 1911, "i": 1914, "k": 1915, "o": 1916},
+    {";": 1, "b": 1858, "d": 11},
+    {"s": 1918},
+    {"e": 1919},
+    {"l": 225, "m": 1920, "n": 111},
+    {";": 1, "o": 984},
+    {";": 1, "b": 116, "c": 883, "f": 1922},
+    {"e": 23, "p": 1923, "s": 23},
+    {";": 1, "d": 1012, "l": 1679, "q": 11, "r": 1682},
+    {"e": 1925},
+    {"l": 1926},
+    {"g": 1927},
+    {"n": 1928},
+    {"a": 1929, "d": 116, "e": 11, "m": 128, "p": 129, "s": 1072, "t": 973},
+    {"z": 361},
+    {"e": 1931},
+    {"a": 225, "i": 1930, "p": 1932},
+    {"c": 1237, "h": 80, "t": 329},
+    {"x": 111},
+    {"d": 1393},
+    {"a": 1936},
+    {"e": 1937},
+    {"h": 1938},
+    {"i": 1935, "o": 1939},
+    {"a": 1905, "b": 984, "c": 510, "d": 116, "e": 1906, "f": 19, "h": 1917,
+     "i": 1921, "o": 1924, "p": 974, "r": 1933, "s": 1934, "w": 1940},
+    {"c": 9, "r": 19},
+    {"a": 787, "b": 726, "h": 276},
+    {"a": 1141, "b": 1524},
+    {";": 1, "e": 19},
+    {"n": 1945},
+    {"r": 1946},
+    {"o": 1947, "r": 1205},
+    {"c": 1948, "t": 1531},
+    {"a": 26, "l": 2},
+    {";": 1, "h": 11, "l": 30},
+    {"i": 1951},
+    {"p": 1222},
+    {"a": 246, "d": 901, "h": 1231, "l": 126, "s": 1952, "u": 1953},
+    {"c": 1948, "i": 525, "t": 1531},
+    {"d": 116, "i": 226, "r": 1240},
+    {"a": 787, "m": 50},
+    {"A": 787, "H": 276, "a": 1942, "b": 889, "c": 18, "d": 1943, "f": 1186,
+     "g": 22, "h": 1944, "l": 1949, "m": 1950, "o": 32, "p": 1954, "r": 1955,
+     "s": 26, "t": 1956, "u": 1957, "w": 1245},
+    {"r": 1175},
+    {"a": 1959},
+    {"g": 1409},
+    {"a": 500},
+    {"h": 526},
+    {"t": 1963},
+    {"o": 1964},
+    {"p": 1541},
+    {"o": 1966},
+    {"h": 125, "i": 11, "r": 1967},
+    {";": 1, "h": 805},
+    {"n": 1890},
+    {"t": 1970},
+    {"e": 1971},
+    {"s": 1972},
+    {"b": 1973, "p": 1973},
+    {"i": 839, "u": 1974},
+    {"e": 1183},
+    {"e": 1104},
+    {"l": 1977},
+    {"g": 1978},
+    {"n": 1979},
+    {"a": 1980},
+    {"i": 1981},
+    {"h": 1976, "r": 1982},
+    {"e": 972, "k": 1962, "n": 1965, "p": 1968, "r": 1969, "s": 1975,
+     "t": 1983},
+    {"n": 1961, "r": 1984},
+    {";": 1, "b": 276, "e": 75},
+    {"b": 276, "t": 11},
+    {"e": 1986, "l": 1386, "r": 1987},
+    {"u": 1893},
+    {"s": 1989},
+    {"r": 1205},
+    {"n": 1889},
+    {"b": 1992, "p": 1992},
+    {"c": 19, "u": 1993},
+    {"a": 463},
+    {"z": 1995},
+    {"g": 1996},
+    {"i": 1997},
+    {"A": 787, "B": 1960, "D": 55, "a": 1985, "c": 62, "d": 55, "e": 1988,
+     "f": 19, "l": 1822, "n": 1990, "o": 74, "p": 1991, "r": 1822, "s": 1994,
+     "z": 1998},
+    {"e": 1080},
+    {"b": 276, "g": 2000},
+    {"e": 1716},
+    {"d": 2001, "i": 2002},
+    {";": 1, "e": 1435},
+    {"c": 432, "e": 2003, "f": 19, "o": 74, "p": 11, "r": 2004, "s": 26},
+    {"A": 787, "a": 787},
+    {"f": 11, "l": 126},
+    {"d": 116, "p": 2007, "t": 973},
+    {"c": 19, "q": 1009},
+    {"p": 129, "t": 1531},
+    {"c": 1006, "d": 1822, "f": 19, "h": 2006, "i": 11, "l": 2006, "m": 199,
+     "n": 67, "o": 2008, "r": 2006, "s": 2009, "u": 2010, "v": 255, "w": 1022},
+    {"u": 8, "y": 11},
+    {"c": 2012},
+    {"c": 62, "m": 50},
+    {"a": 2013, "c": 494, "e": 1163, "f": 19, "i": 80, "o": 74, "s": 26,
+     "u": 2014},
+    {"e": 389, "t": 23},
+    {"j": 11},
+    {"j": 11, "n": 2017},
+    {"a": 216, "c": 213, "d": 116, "e": 2016, "f": 19, "h": 80, "i": 1247,
+     "o": 74, "s": 26, "w": 2018}
+]""")
+
+final = json.loads("""[
+    false, true, true, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, true, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, true, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, true, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, true, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, true, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    true, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, true,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, true, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false, false,
+    false, false, false, false, false, false, false, false, false
+]""")
@@ -0,0 +1,89 @@
+"""Find the fastest trie backend on the running interpreter by timing each
+matching entity names as the tokenizer does, and keep the result in a
+file so that it is only measured once"""
+from __future__ import absolute_import, division, unicode_literals
+
+import json
+import os
+import platform
+import sys
+from functools import partial
+from timeit import default_timer
+
+from ..constants import entities
+from . import trieBackends
+
+# The backends already picked by calibrate in this process, by cache file
+calibrated = {}
+
+
+def defaultCacheFile():
+    cacheHome = (os.environ.get("XDG_CACHE_HOME") or
+                 os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cacheHome, "html5lib", "trie-backends.json")
+
+
+def interpreterKey():
+    """Return a string identifying the interpreter and the backends
+    available to it, which the calibrated choice depends on"""
+    return "%s %s %s" % (platform.python_implementation(),
+                         sys.version.split()[0],
+                         ",".join(sorted(trieBackends)))
+
+
+def timeBackends(repeat=3):
+    """Return the shortest time each backend took over repeat runs to
+    match every entity name, and a few texts only starting like one, by
+    the name of the backend"""
+    names = sorted(entities)
+    texts = ([name + "x" for name in names] +
+             [name[:-1] + "#" for name in names[::4]])
+    times = {}
+    for backend, trieClass in trieBackends.items():
+        trie = trieClass(entities)
+        for i in range(repeat):
+            start = default_timer()
+            for text in texts:
+                trie.match_longest([text[0]], partial(next, iter(text[1:]),
+                                                      None))
+            time = default_timer() - start
+            times[backend] = min(time, times.get(backend, time))
+    return times
+
+
+def calibrate(cacheFile=None, recalibrate=False):
+    """Return the name of the fastest trie backend on this interpreter
+
+    cacheFile - the JSON file in which the fastest backend is kept for
+                each interpreter, html5lib/trie-backends.json in the user's
+                cache directory ($XDG_CACHE_HOME or ~/.cache) by default.
+                Nothing is kept if it can't be written.
+    recalibrate - time the backends even if the fastest is already known
+    """
+    if cacheFile is None:
+        cacheFile = defaultCacheFile()
+    if cacheFile in calibrated and not recalibrate:
+        return calibrated[cacheFile]
+
+    key = interpreterKey()
+    try:
+        with open(cacheFile) as fp:
+            choices = json.load(fp)
+    except (IOError, OSError, ValueError):
+        choices = {}
+
+    if recalibrate or choices.get(key) not in trieBackends:
+        times = timeBackends()
+        choices[key] = min(times, key=times.get)
+        try:
+            directory = os.path.dirname(cacheFile)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            with open(cacheFile, "w") as fp:
+                json.dump(choices, fp, indent=2, separators=(",", ": "),
+                          sort_keys=True)
+        except (IOError, OSError):
+            pass
+
+    calibrated[cacheFile] = choices[key]
+    return choices[key]
@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, unicode_literals
+from six import text_type
+
+from ._base import Trie as ABCTrie
+
+
+class DAFSA(object):
+    """A minimal deterministic acyclic finite state automaton accepting a
+    set of strings
+
+    The states are numbered, the start state being 0. transitions[state]
+    maps each character that can follow to the next state, and final[state]
+    is whether the characters read to get there are one of the strings.
+    Strings sharing an ending share the states for it, so there are far
+    fewer states than in a trie of the same strings.
+    """
+
+    def __init__(self, words, states=None):
+        """Build the automaton for words, or, if states is given, use the
+        (transitions, final) pair of lists of one built earlier, such as
+        the prebuilt one in _entities"""
+        if states is not None:
+            self.transitions, self.final = states
+            return
+
+        root = {}
+        for word in words:
+            node = root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[None] = {}
+
+        # Add the states children first in order of their characters, so
+        # that the same words are always given the same state numbers
+        self.transitions = [None]
+        self.final = [None in root]
+        register = {}
+        self.transitions[0] = self._addTransitions(root, register)
+
+    def _addTransitions(self, node, register):
+        """Add the states for the children of node, a subtree of a trie
+        built from nested dicts, and return the transitions to them"""
+        transitions = {}
+        for char in sorted([char for char in node if char is not None]):
+            transitions[char] = self._addState(node[char], register)
+        return transitions
+
+    def _addState(self, node, register):
+        """Add the state for node, a subtree of a trie built from nested
+        dicts, reusing any identical state already added, and return its
+        number"""
+        transitions = self._addTransitions(node, register)
+        final = None in node
+        key = (final, tuple(sorted(transitions.items())))
+        state = register.get(key)
+        if state is None:
+            state = register[key] = len(self.transitions)
+            self.transitions.append(transitions)
+            self.final.append(final)
+        return state
+
+    def walk(self, text):
+        """Return the state reached by reading text, or None if no string
+        starts with it"""
+        transitions = self.transitions
+        state = 0
+        for char in text:
+            state = transitions[state].get(char)
+            if state is None:
+                return None
+        return state
+
+    def __contains__(self, text):
+        state = self.walk(text)
+        return state is not None and self.final[state]
+
+    def longestPrefixLength(self, text):
+        """Return the length of the longest string text starts with, or
+        None if there isn't one"""
+        transitions = self.transitions
+        final = self.final
+        state = 0
+        length = 0 if final[0] else None
+        for i, char in enumerate(text):
+            state = transitions[state].get(char)
+            if state is None:
+                break
+            if final[state]:
+                length = i + 1
+        return length
+
+
+class Trie(ABCTrie):
+    def __init__(self, data, states=None):
+        if not all(isinstance(x, text_type) for x in data.keys()):
+            raise TypeError("All keys must be strings")
+
+        self._data = data
+        self._dafsa = DAFSA(data.keys(), states)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def keys(self, prefix=None):
+        if not prefix:
+            return set(self._data)
+        if self._dafsa.walk(prefix) is None:
+            return set()
+        return set([key for key in self._data if key.startswith(prefix)])
+
+    def has_keys_with_prefix(self, prefix):
+        return self._dafsa.walk(prefix) is not None
+
+    def longest_prefix(self, prefix):
+        length = self._dafsa.longestPrefixLength(prefix)
+        if length is None:
+            raise KeyError(prefix)
+        return prefix[:length]
+
+    def match_longest(self, chars, read):
+        transitions = self._dafsa.transitions
+        final = self._dafsa.final
+        state = 0
+        length = 0
+        while True:
+            state = transitions[state].get(chars[-1])
+            if state is None:
+                return length
+            if final[state]:
+                length = len(chars)
+            chars.append(read())
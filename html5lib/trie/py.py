@@ -13,8 +13,6 @@ class Trie(ABCTrie):
 
         self._data = data
         self._keys = sorted(data.keys())
-        self._cachestr = ""
-        self._cachepoints = (0, len(data))
 
     def __contains__(self, key):
         return key in self._data
@@ -29,25 +27,14 @@ class Trie(ABCTrie):
         return self._data[key]
 
     def keys(self, prefix=None):
-        if prefix is None or prefix == "" or not self._keys:
+        if prefix is None or prefix == "":
             return set(self._keys)
 
-        if prefix.startswith(self._cachestr):
-            lo, hi = self._cachepoints
-            start = i = bisect_left(self._keys, prefix, lo, hi)
-        else:
-            start = i = bisect_left(self._keys, prefix)
-
         keys = set()
-        if start == len(self._keys):
-            return keys
-
-        while self._keys[i].startswith(prefix):
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
             keys.add(self._keys[i])
-            i += 1
-
-        self._cachestr = prefix
-        self._cachepoints = (start, i)
 
         return keys
 
@@ -55,11 +42,7 @@ class Trie(ABCTrie):
         if prefix in self._data:
             return True
 
-        if prefix.startswith(self._cachestr):
-            lo, hi = self._cachepoints
-            i = bisect_left(self._keys, prefix, lo, hi)
-        else:
-            i = bisect_left(self._keys, prefix)
+        i = bisect_left(self._keys, prefix)
 
         if i == len(self._keys):
             return False
@@ -1,6 +1,7 @@
 import json
 
 import html5lib
+from html5lib.trie.dafsa import DAFSA
 
 def parse(path="html5ents.xml"):
     return html5lib.parse(open(path), treebuilder="lxml")
@@ -76,12 +77,51 @@ def make_entities_code(entities):
 %s
 }"""%entities_text
 
+def wrap_items(items, indent, width=79):
+    lines = [indent]
+    for item in items:
+        if len(lines[-1]) + len(item) + 1 > width:
+            lines[-1] = lines[-1].rstrip()
+            lines.append(indent)
+        lines[-1] += item + " "
+    lines[-1] = lines[-1].rstrip()
+    return "\n".join(lines)
+
+def make_dafsa_code(entities):
+    dafsa = DAFSA(entities)
+    # wrap_items leaves a comma after the last item, which JSON doesn't allow
+    transitions_text = ",\n".join(
+        "    {%s}" % wrap_items(["\"%s\": %d," % item
+                                 for item in sorted(transitions.items())],
+                                "     ")[5:-1]
+        for transitions in dafsa.transitions)
+    final_text = wrap_items(["%s," % json.dumps(final)
+                             for final in dafsa.final], "    ")[:-1]
+    return """\"\"\"The automaton matching the names in constants.entities, built by
+utils/entities.py so that it doesn't need building at run time
+
+It is kept as JSON because, without a .pyc file, compiling the same lists
+written in Python would take longer than building the automaton.\"\"\"
+from __future__ import absolute_import, division, unicode_literals
+
+import json
+
+transitions = json.loads(\"\"\"[
+%s
+]\"\"\")
+
+final = json.loads(\"\"\"[
+%s
+]\"\"\")
+""" % (transitions_text, final_text)
+
 def main():
     entities = entity_table(parse())
     tests_json = make_tests_json(entities)
     json.dump(tests_json, open("namedEntities.test", "w"), indent=4)
     code = make_entities_code(entities)
     open("entities_constants.py", "w").write(code)
+    open("entities_dafsa.py", "w").write(make_dafsa_code(entities))
 
 if __name__ == "__main__":
     main()